@@ -14,9 +14,9 @@ import { useForm } from "@mantine/form";
 import { IconUser, IconUsers } from "@tabler/icons-react";
 import { useTranslation } from "next-i18next";
 import { SWRResponse } from "swr";
-import ExcelJS from "exceljs";
+import { showNotification } from "@mantine/notifications";
 
-import { createPlayer } from "../../services/player";
+import { importPlayersFile } from "../../services/player";
 import { updatePlayerFields } from "../../services/player_fields";
 import { getClubs, getPlayerFields } from "../../services/adapter";
 import {
@@ -27,7 +27,6 @@ import PlayersImportModal, { PlayersUpload } from "./players_import_modal";
 import { inferFieldsFromSheet } from "../utils/excel";
 import { Player } from "../../interfaces/player";
 import type { Club } from "../../interfaces/club";
-import { resolveClubIdByName } from "../../utils/clubs";
 
 function SinglePlayerTab({
   tournament_id,
@@ -185,17 +184,14 @@ export default function PlayerCreateModal({
   setOpened: (open: boolean) => void;
 }) {
   const { t } = useTranslation();
-  const swrClubsForImport = getClubs();
 
   // import all club sheets
   const handleImportAll = async (uploads: PlayersUpload[]) => {
     if (uploads.length === 0) return;
-    const clubs: Club[] = swrClubsForImport.data?.data ?? [];
-    console.log("uploads", uploads);
 
     // infer schema once
-    const { file, sheet, headerRow, dataRow } = uploads[0];
-    const { fields, headerMap, nameCols } = await inferFieldsFromSheet(
+    const { file, sheet, headerRow } = uploads[0];
+    const { fields } = await inferFieldsFromSheet(
       file,
       sheet,
       headerRow
@@ -206,62 +202,24 @@ export default function PlayerCreateModal({
     // refresh player fields in UI so table columns update immediately
     if (swrPlayerFieldsResponse) await swrPlayerFieldsResponse.mutate();
 
-    // now import every upload
-    for (const { file, clubName, sheet } of uploads) {
-      const wb = new ExcelJS.Workbook();
-      await wb.xlsx.load(await file.arrayBuffer());
-      const ws = wb.getWorksheet(sheet);
-      if (!ws) continue;
-
-      // for each row starting at dataRow, build a player
-      // stop when we hit an empty row (no name)
-      for (let r = dataRow; r <= ws.rowCount; r++) {
-        const row = ws.getRow(r);
-
-        // helper to read a cell’s displayed text (handles formulas)
-        const cellText = (c: ExcelJS.Cell) => {
-          const v = c.value as any;
-          const raw =
-            v && typeof v === "object" && "result" in v ? v.result : v;
-          return String(raw ?? "").trim();
-        };
-
-        // build a raw map header→value, pulling out .result if it's a formula
-        const rowData: Record<string, any> = {};
-        headerMap.forEach(({ col, header }) => {
-          // normalize the header into a lowercase_snake_case key:
-          const key = header.toLowerCase().replace(/\s+/g, "_");
-          const txt = cellText(row.getCell(col));
-          rowData[key] = txt === "" ? null : txt;
+    // now import every upload, the server parses the sheet and reports rows it skipped
+    for (const { file, clubName, sheet, headerRow, dataRow } of uploads) {
+      const response = await importPlayersFile(tournament_id, file, {
+        club: clubName,
+        sheet,
+        header_row: headerRow,
+        data_row: dataRow,
+      });
+      const errors: Array<{ row: number; detail: string }> =
+        response?.data?.data?.errors ?? [];
+      if (errors.length > 0) {
+        showNotification({
+          color: "orange",
+          title: `${file.name}: ${errors.length} ${t("rows_skipped", "rows skipped")}`,
+          message: errors
+            .map((error) => `${error.row}: ${error.detail}`)
+            .join("\n"),
         });
-
-        // console.log("rowData", rowData);
-
-        // derive player display name (prefer single Name; else First + Last)
-        let nameValue = "";
-        if (nameCols.name) {
-          nameValue = cellText(row.getCell(nameCols.name));
-        } else {
-          const first = nameCols.first
-            ? cellText(row.getCell(nameCols.first))
-            : "";
-          const last = nameCols.last
-            ? cellText(row.getCell(nameCols.last))
-            : "";
-          nameValue = [first, last].filter(Boolean).join(" ").trim();
-        }
-        if (!nameValue) {
-          break; // break at the first empty row
-        }
-
-        const body = {
-          name: nameValue,
-          club_id: resolveClubIdByName(clubs, clubName, 2),
-          data: rowData,
-        };
-
-        console.log("posting player:", body);
-        await createPlayer(tournament_id, body);
       }
     }
 
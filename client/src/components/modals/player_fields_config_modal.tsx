@@ -63,6 +63,11 @@ export default function PlayerFieldsConfigModal({
       f.map((x) => (x.key === key ? { ...x, include: !x.include } : x))
     );
 
+  const toggleIndexed = (key: string) =>
+    setFields((f) =>
+      f.map((x) => (x.key === key ? { ...x, indexed: !x.indexed } : x))
+    );
+
   const updateType = (key: string, type: PlayerFieldTypes) =>
     setFields((f) =>
       f.map((x) =>
@@ -160,6 +165,14 @@ export default function PlayerFieldsConfigModal({
               checked={field.include}
               onChange={() => toggleInclude(field.key)}
             />
+            <Checkbox
+              label={t("field_sortable", "Sortable")}
+              checked={field.indexed ?? false}
+              onChange={() => toggleIndexed(field.key)}
+              disabled={!field.include}
+              ml="auto"
+              mr="md"
+            />
             <Select
               data={[
                 { value: "TEXT", label: t("type_text", "Text") },
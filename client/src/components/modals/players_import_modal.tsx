@@ -26,7 +26,7 @@ import { Club } from "../../interfaces/club";
 import type { TeamCategoryInterface } from "../../interfaces/team_category";
 import { getTournamentIdFromRouter } from "../utils/util";
 import type { FieldInsertable } from "../../interfaces/player_fields";
-import { createTeam } from "../../services/team";
+import { createTeamsBulk } from "../../services/team";
 import { resolveClubIdByName } from "../../utils/clubs";
 
 export interface PlayersUpload {
@@ -633,19 +633,18 @@ export default function PlayersImportModal({
               });
               return;
             }
-            for (const u of uploads) {
+            const teams = uploads.flatMap((u) => {
               const clubName = u.clubName || u.clubAbbrev || "";
-              for (let i = 0; i < u.teamCount; i++) {
-                const name = teamName(u.clubAbbrev, i);
-                await createTeam(
-                  tournamentData.id,
-                  name,
-                  true,
-                  [],
-                  resolveClubIdByName(clubs, clubName, 2),
-                  defaultCatId,
-                );
-              }
+              const clubId = resolveClubIdByName(clubs, clubName, 2);
+              return Array.from({ length: u.teamCount }, (_, i) => ({
+                code: teamName(u.clubAbbrev, i),
+                active: true,
+                club_id: clubId,
+                category_id: defaultCatId,
+              }));
+            });
+            if (teams.length > 0) {
+              await createTeamsBulk(tournamentData.id, teams);
             }
 
             onImportAll(uploads);
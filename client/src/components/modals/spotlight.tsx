@@ -14,14 +14,18 @@ import {
 } from '@tabler/icons-react';
 import { useTranslation } from 'next-i18next';
 import { useRouter } from 'next/router';
-import React from 'react';
+import React, { useState } from 'react';
 
+import { Player } from '../../interfaces/player';
+import { searchPlayers } from '../../services/adapter';
 import { getTournamentIdFromRouter } from '../utils/util';
 
 export function BracketSpotlight() {
   const { t } = useTranslation();
   const router = useRouter();
   const { id: tournamentId } = getTournamentIdFromRouter();
+  const [query, setQuery] = useState('');
+  const swrPlayerSearch = searchPlayers(tournamentId >= 0 ? tournamentId : null, query);
 
   const actions: SpotlightActionData[] = [
     {
@@ -105,10 +109,24 @@ export function BracketSpotlight() {
       leftSection: <IconScoreboard size="1.2rem" />,
     },
   ];
-  const allActions = tournamentId >= 0 ? actions.concat(tournamentActions) : actions;
+  const playerActions: SpotlightActionData[] = (swrPlayerSearch.data?.data ?? []).map(
+    (player: Player) => ({
+      id: `player-${player.id}`,
+      title: player.name,
+      description: [player.code, player.club].filter(Boolean).join(' · '),
+      // results are already matched server-side, keep them when the query changes
+      keywords: [query],
+      onClick: () => router.push(`/tournaments/${tournamentId}/participants/players`),
+      leftSection: <IconUser size="1.2rem" />,
+    })
+  );
+  const allActions =
+    tournamentId >= 0 ? actions.concat(tournamentActions, playerActions) : actions;
   return (
     <Spotlight
       actions={allActions}
+      query={query}
+      onQueryChange={setQuery}
       shortcut={['mod + k', 'mod + y', '/']}
       nothingFound={t('nothing_found_placeholder')}
       highlightQuery
@@ -41,6 +41,16 @@ export type BracketWithTeams = {
   teams: BracketTeamSlot[];
 };
 
+export type BracketWithEntries = BracketWithPlayers & BracketWithTeams;
+
+export interface DivisionWithBrackets {
+  division_id: number;
+  name: string;
+  prefix?: string | null;
+  division_type: "INDIVIDUALS" | "TEAMS";
+  brackets: BracketWithEntries[];
+}
+
 export interface BracketTeamsCreatePayload {
   index: number;
   num_players: number;
@@ -7,6 +7,7 @@ export interface FieldInsertable {
   type: PlayerFieldTypes;
   options: string[];
   position: number;
+  indexed?: boolean; // sortable, backed by an index on the server
 }
 
 export interface SaveFieldsInsertable {
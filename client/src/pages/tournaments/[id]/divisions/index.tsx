@@ -38,13 +38,12 @@ import {
   DEFAULT_POSTER,
 } from "../../../../components/utils/brackets_editor/shared";
 import {
+  BracketWithEntries,
   BracketWithPlayers,
   BracketWithTeams,
+  DivisionWithBrackets,
 } from "../../../../interfaces/bracket";
-import {
-  fetchDivisionBracketsWithPlayers,
-  fetchDivisionBracketsWithTeams,
-} from "../../../../services/bracket";
+import { fetchTournamentBrackets } from "../../../../services/bracket";
 import { ViewMode } from "../../../../interfaces/bracket";
 
 import { exportBracketsToExcel } from "../../../../components/export/exportExcel";
@@ -114,25 +113,39 @@ export default function BracketsPage() {
     return m;
   }, [clubs]);
 
+  // brackets of all divisions from a single request, reloaded when the divisions change
+  const [bracketsByDivision, setBracketsByDivision] = useState<Map<
+    number,
+    BracketWithEntries[]
+  > | null>(null);
+
   useEffect(() => {
-    if (!openItem) return;
+    if (!tournamentIdValid || !swrDivisions.data) return;
+
+    fetchTournamentBrackets(tournamentData.id).then((res) => {
+      const divisions = res.data.data as DivisionWithBrackets[];
+      setBracketsByDivision(
+        new Map(divisions.map((d) => [d.division_id, d.brackets])),
+      );
+    });
+  }, [tournamentIdValid, tournamentData.id, swrDivisions.data]);
+
+  useEffect(() => {
+    if (!openItem || !bracketsByDivision) return;
 
     const divisionId = Number(openItem);
     if (!Number.isFinite(divisionId)) return;
 
     const group = groups.find((g: any) => g.id === divisionId);
+    const divisionBrackets = bracketsByDivision.get(divisionId) ?? [];
     if (group?.division_type === "TEAMS") {
       setBrackets(null);
-      fetchDivisionBracketsWithTeams(divisionId).then((res) => {
-        setBracketsTeams(res.data.data);
-      });
+      setBracketsTeams(divisionBrackets);
     } else {
       setBracketsTeams(null);
-      fetchDivisionBracketsWithPlayers(divisionId).then((res) => {
-        setBrackets(res.data.data);
-      });
+      setBrackets(divisionBrackets);
     }
-  }, [openItem, groups]);
+  }, [openItem, groups, bracketsByDivision]);
 
   const sorted = useMemo(
     () => (brackets ?? []).slice().sort((a, b) => a.index - b.index),
@@ -206,14 +219,13 @@ export default function BracketsPage() {
   };
 
   const downloadPDF = async (divisionId: number, format: Format) => {
-    // Always fetch fresh for the division you’re exporting
     const group = groups.find((g: any) => g.id === divisionId);
     const divisionName = group?.name ?? `Division ${divisionId}`;
     const isTeams = group?.division_type === "TEAMS";
+    const divisionBrackets = bracketsByDivision?.get(divisionId) ?? [];
 
     if (isTeams) {
-      const res = await fetchDivisionBracketsWithTeams(divisionId);
-      const divisionBracketsTeams = res.data.data as BracketWithTeams[];
+      const divisionBracketsTeams: BracketWithTeams[] = divisionBrackets;
 
       setExporting({
         divisionId,
@@ -222,9 +234,6 @@ export default function BracketsPage() {
         bracketsTeams: divisionBracketsTeams,
       });
     } else {
-      const res = await fetchDivisionBracketsWithPlayers(divisionId);
-      const divisionBrackets = res.data.data as BracketWithPlayers[];
-
       setExporting({
         divisionId,
         divisionName,
@@ -246,8 +255,7 @@ export default function BracketsPage() {
   };
 
   const downloadExcel = async (divisionId: number) => {
-    const res = await fetchDivisionBracketsWithPlayers(divisionId);
-    const divisionBrackets = res.data.data as BracketWithPlayers[];
+    const divisionBrackets = bracketsByDivision?.get(divisionId) ?? [];
 
     const divisionName =
       groups.find((g: any) => g.id === divisionId)?.name ??
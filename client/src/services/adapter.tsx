@@ -145,6 +145,47 @@ export function getTeams(tournament_id: number | null): SWRResponse {
   );
 }
 
+export interface ListQuery {
+  limit?: number;
+  cursor?: string | null;
+  sort_by?: string;
+  sort_field?: string;
+  sort_direction?: 'asc' | 'desc';
+  club_id?: number;
+  category_id?: number;
+  division_id?: number;
+  not_in_team?: boolean;
+  search?: string;
+}
+
+function toQueryString(query: ListQuery): string {
+  const params = new URLSearchParams();
+  Object.entries(query).forEach(([key, value]) => {
+    if (value != null && value !== '') params.set(key, String(value));
+  });
+  return params.toString();
+}
+
+export function getPlayersPage(tournament_id: number, query: ListQuery): SWRResponse {
+  return useSWR(`tournaments/${tournament_id}/players?${toQueryString(query)}`, fetcher);
+}
+
+export function getTeamsPage(tournament_id: number | null, query: ListQuery): SWRResponse {
+  return useSWR(
+    tournament_id == null ? null : `tournaments/${tournament_id}/teams?${toQueryString(query)}`,
+    fetcher
+  );
+}
+
+export function searchPlayers(tournament_id: number | null, q: string): SWRResponse {
+  return useSWR(
+    tournament_id == null || q.trim().length < 2
+      ? null
+      : `tournaments/${tournament_id}/players/search?q=${encodeURIComponent(q.trim())}&limit=10`,
+    fetcher
+  );
+}
+
 export function getTeamCategories(tournament_id: number | null): SWRResponse {
   return useSWR(
     tournament_id == null
@@ -154,10 +195,12 @@ export function getTeamCategories(tournament_id: number | null): SWRResponse {
   );
 }
 
-export function getTeamsLive(tournament_id: number | null): SWRResponse {
-  return useSWR(tournament_id == null ? null : `tournaments/${tournament_id}/teams`, fetcher, {
-    refreshInterval: 5_000,
-  });
+export function getTeamsLive(tournament_id: number | null, query: ListQuery = {}): SWRResponse {
+  return useSWR(
+    tournament_id == null ? null : `tournaments/${tournament_id}/teams?${toQueryString(query)}`,
+    fetcher,
+    { refreshInterval: 5_000 }
+  );
 }
 
 export function getDivisions(tournament_id: number | null): SWRResponse {
@@ -138,6 +138,12 @@ export async function fetchDivisionBracketsWithTeams(division_id: number) {
   return axios.get(`divisions/${division_id}/brackets/with-teams`);
 }
 
+/** All divisions' brackets (players and teams) of a tournament in a single request. */
+export async function fetchTournamentBrackets(tournament_id: number) {
+  const axios = await createAxios();
+  return axios.get(`tournaments/${tournament_id}/brackets`);
+}
+
 function seededTeamsToBracketPayload(
   seeded: TeamBracketGroup[]
 ): BracketTeamsCreatePayload[] {
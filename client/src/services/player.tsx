@@ -58,3 +58,33 @@ export async function updatePlayerCodes(
     handleRequestError(error);
   }
 }
+
+export async function importPlayersFile(
+  tournament_id: number,
+  file: File,
+  options: {
+    club?: string;
+    sheet?: string;
+    header_row?: number;
+    data_row?: number;
+  } = {},
+) {
+  try {
+    const form = new FormData();
+    form.append("file", file);
+    if (options.club) form.append("club", options.club);
+    if (options.sheet) form.append("sheet", options.sheet);
+    if (options.header_row != null)
+      form.append("header_row", String(options.header_row));
+    if (options.data_row != null)
+      form.append("data_row", String(options.data_row));
+
+    const axiosInstance = await createAxios();
+    return await axiosInstance.post(
+      `tournaments/${tournament_id}/players/import`,
+      form,
+    );
+  } catch (error: any) {
+    handleRequestError(error);
+  }
+}
@@ -17,6 +17,7 @@ export async function updatePlayerFields(
             type:     f.type,
             options:  f.options,
             position: idx,
+            indexed:  f.indexed ?? false,
           })),
         }
       );
@@ -28,6 +28,29 @@ export async function createTeam(
   }
 }
 
+export interface TeamBulkItem {
+  code: string;
+  active: boolean;
+  club_id: number | null;
+  category_id: number;
+  player_ids?: number[];
+  positions?: Record<string, string>;
+}
+
+export async function createTeamsBulk(
+  tournament_id: number,
+  teams: TeamBulkItem[],
+) {
+  try {
+    const axiosInstance = await createAxios();
+    return await axiosInstance.post(`tournaments/${tournament_id}/teams/bulk`, {
+      teams,
+    });
+  } catch (error: any) {
+    return handleRequestError(error);
+  }
+}
+
 export async function deleteTeam(tournament_id: number, team_id: number) {
   try {
     const axiosInstance = await createAxios();
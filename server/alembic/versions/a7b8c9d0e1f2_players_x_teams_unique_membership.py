@@ -0,0 +1,37 @@
+"""players_x_teams unique (team_id, player_id)
+
+Revision ID: a7b8c9d0e1f2
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-19
+
+A player is a member of a team at most once, which lets membership updates upsert the
+position instead of inserting duplicate rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, None] = "f2a3b4c5d6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the most recent row per membership, it holds the latest position
+    op.execute(
+        """
+        DELETE FROM players_x_teams a USING players_x_teams b
+        WHERE a.id < b.id AND a.team_id = b.team_id AND a.player_id = b.player_id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_players_x_teams_team_player",
+        "players_x_teams",
+        ["team_id", "player_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_players_x_teams_team_player", "players_x_teams", type_="unique")
@@ -0,0 +1,39 @@
+"""players code unique constraint deferrable
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-19
+
+Bulk code updates reassign codes within one statement, e.g. when a division is renumbered
+two players can swap codes. A deferrable constraint is checked at the end of the statement
+instead of per row, so such swaps succeed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("uq_players_tournament_code", "players", type_="unique")
+    op.create_unique_constraint(
+        "uq_players_tournament_code",
+        "players",
+        ["tournament_id", "code"],
+        deferrable=True,
+        initially="IMMEDIATE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_players_tournament_code", "players", type_="unique")
+    op.create_unique_constraint(
+        "uq_players_tournament_code",
+        "players",
+        ["tournament_id", "code"],
+    )
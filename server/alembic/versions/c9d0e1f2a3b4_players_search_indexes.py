@@ -0,0 +1,39 @@
+"""players search indexes
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19
+
+Full-text index on player name and code, and a prefix index on the lowercased code, for
+the player search endpoint. The expressions must match PLAYER_SEARCH_DOCUMENT in
+project/sql/players.py, otherwise the planner won't use them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX ix_players_search ON players
+        USING gin (to_tsvector('simple', name || ' ' || coalesce(code, '')))
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX ix_players_tournament_code_lower ON players
+        (tournament_id, lower(code) text_pattern_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_players_tournament_code_lower", table_name="players")
+    op.drop_index("ix_players_search", table_name="players")
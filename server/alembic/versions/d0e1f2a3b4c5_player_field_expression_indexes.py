@@ -0,0 +1,58 @@
+"""player field expression indexes
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19
+
+Adds players_field.indexed, for fields that get an expression index on players.data, and
+the player_field_numeric function those indexes use for NUMBER fields. The indexes
+themselves are created and dropped by the `sync-player-field-indexes` CLI command.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "players_field",
+        sa.Column("indexed", sa.Boolean(), nullable=False, server_default="f"),
+    )
+    op.execute(
+        r"""
+        CREATE OR REPLACE FUNCTION player_field_numeric(value TEXT) RETURNS NUMERIC
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$
+            SELECT CASE
+                WHEN value ~ '^\s*[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d{1,3})?\s*$' THEN value::numeric
+                ELSE 1e300
+            END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        DECLARE index_name TEXT;
+        BEGIN
+            FOR index_name IN
+                SELECT indexname FROM pg_indexes
+                WHERE tablename = 'players' AND indexname LIKE 'ix\\_players\\_by\\_field\\_%'
+            LOOP
+                EXECUTE format('DROP INDEX %I', index_name);
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("DROP FUNCTION IF EXISTS player_field_numeric(TEXT)")
+    op.drop_column("players_field", "indexed")
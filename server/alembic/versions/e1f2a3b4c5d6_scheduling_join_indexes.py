@@ -0,0 +1,71 @@
+"""indexes on the scheduling join keys
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-19
+
+Indexes the foreign keys that get_full_tournament_details, the stage item deletes and
+get_teams_with_members join or filter on, and the ones Postgres looks up for foreign key
+checks when rounds, inputs, courts or matches are deleted. players_x_teams.team_id is
+already covered by uq_players_x_teams_team_player. The indexes are built concurrently so the
+migration doesn't block writes to matches.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, partial index predicate)
+INDEXES: list[tuple[str, str, list[str], str | None]] = [
+    ("ix_matches_round_id", "matches", ["round_id"], None),
+    ("ix_matches_stage_item_input1_id", "matches", ["stage_item_input1_id"], None),
+    ("ix_matches_stage_item_input2_id", "matches", ["stage_item_input2_id"], None),
+    ("ix_matches_court_id", "matches", ["court_id"], None),
+    (
+        "ix_matches_input1_winner_from_match_id",
+        "matches",
+        ["stage_item_input1_winner_from_match_id"],
+        "stage_item_input1_winner_from_match_id IS NOT NULL",
+    ),
+    (
+        "ix_matches_input2_winner_from_match_id",
+        "matches",
+        ["stage_item_input2_winner_from_match_id"],
+        "stage_item_input2_winner_from_match_id IS NOT NULL",
+    ),
+    ("ix_rounds_stage_item_id_is_draft", "rounds", ["stage_item_id", "is_draft"], None),
+    ("ix_stage_items_ranking_id", "stage_items", ["ranking_id"], None),
+    ("ix_stage_item_inputs_team_id", "stage_item_inputs", ["team_id"], "team_id IS NOT NULL"),
+    (
+        "ix_stage_item_inputs_winner_from_stage_item_id",
+        "stage_item_inputs",
+        ["winner_from_stage_item_id"],
+        "winner_from_stage_item_id IS NOT NULL",
+    ),
+    ("ix_players_x_teams_player_id", "players_x_teams", ["player_id"], None),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where is not None else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
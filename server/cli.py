@@ -11,14 +11,21 @@ from project.database import database
 from project.logger import get_logger
 from project.models.db.account import UserAccountType
 from project.models.db.user import UserInsertable
+from project.sql.player_fields import sync_player_field_indexes
 from project.sql.users import (
     check_whether_email_is_in_use,
     create_user,
 )
 from project.utils.db_init import sql_create_dev_db
 from project.utils.security import hash_password
+from project.utils.synthetic_tournament import (
+    SyntheticTournamentSize,
+    sql_create_synthetic_tournaments,
+    validate_size,
+)
 
 logger = get_logger("cli")
+DEFAULT_SIZE = SyntheticTournamentSize()
 
 
 def run_async(f: Any) -> Any:
@@ -85,8 +92,47 @@ async def register_user(email: str, password: str, name: str) -> None:
     logger.info(f"Created user with id: {user_created.id}")
 
 
+@click.command()
+@click.option("--tournaments", default=1, help="The number of tournaments to generate.")
+@click.option("--players", default=DEFAULT_SIZE.players, help="Players per tournament.")
+@click.option("--clubs", default=DEFAULT_SIZE.clubs, help="The number of clubs.")
+@click.option("--courts", default=DEFAULT_SIZE.courts, help="Courts per tournament.")
+@click.option("--pool-size", default=DEFAULT_SIZE.pool_size, help="Teams per pool.")
+@click.option("--swiss-rounds", default=DEFAULT_SIZE.swiss_rounds, help="Swiss rounds.")
+@click.option("--seed", default=0, help="The random seed, the same seed generates the same data.")
+@run_async
+async def generate_synthetic_tournaments(
+    tournaments: int,
+    players: int,
+    clubs: int,
+    courts: int,
+    pool_size: int,
+    swiss_rounds: int,
+    seed: int,
+) -> None:
+    size = SyntheticTournamentSize(
+        players=players, clubs=clubs, courts=courts, pool_size=pool_size, swiss_rounds=swiss_rounds
+    )
+    try:
+        validate_size(size)
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+
+    tournament_ids = await sql_create_synthetic_tournaments(size, seed, tournaments)
+    logger.info(f"Created tournaments with ids: {tournament_ids}")
+
+
+@click.command()
+@run_async
+async def sync_player_field_indexes_cmd() -> None:
+    """Builds the expression indexes of indexed player fields and drops unused ones."""
+    await sync_player_field_indexes()
+
+
 if __name__ == "__main__":
     cli.add_command(create_dev_db)
+    cli.add_command(generate_synthetic_tournaments)
     cli.add_command(hash_password_cmd)
     cli.add_command(register_user)
+    cli.add_command(sync_player_field_indexes_cmd)
     cli()
@@ -11,12 +11,13 @@ from starlette.staticfiles import StaticFiles
 
 from project.config import Environment, config, environment, init_sentry
 from project.cronjobs.scheduling import start_cronjobs
-from project.database import database
-from project.models.metrics import RequestDefinition, get_request_metrics
+from project.database import PoolAcquireTimeout, database, replica_database, track_queries
+from project.models.metrics import get_loop_metrics, get_request_metrics, get_route_key
 from project.routes import (
     auth,
     clubs,
     courts,
+    exports,
     internals,
     matches,
     players,
@@ -37,13 +38,19 @@ from project.utils.alembic import alembic_run_migrations
 from project.utils.asyncio import AsyncioTasksManager
 from project.utils.db_init import init_db_when_empty
 from project.utils.logging import logger
+from project.utils.loop_monitor import EventLoopMonitor
+from project.utils.profiling import ProfilingMiddleware
+from project.utils.tracing import init_tracing, trace_span
 
 init_sentry()
+init_tracing()
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     await database.connect()
+    if replica_database is not None:
+        await replica_database.connect()
     await init_db_when_empty()
 
     if config.auto_run_migrations and environment is not Environment.CI:
@@ -52,6 +59,14 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     if environment is Environment.PRODUCTION:
         start_cronjobs()
 
+    if config.loop_monitor_enabled:
+        monitor = EventLoopMonitor(
+            get_loop_metrics(),
+            interval_seconds=config.loop_monitor_interval_seconds,
+            block_threshold_seconds=config.loop_monitor_block_threshold_seconds,
+        )
+        AsyncioTasksManager.add_coroutine(monitor.run(), long_running=True)
+
     if environment is Environment.PRODUCTION and not config.is_cors_enabled():
         logger.warning("It's advised to set the `CORS_ORIGINS` environment variable in production")
 
@@ -59,6 +74,8 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
 
     if environment is not Environment.CI:
         await database.disconnect()
+        if replica_database is not None:
+            await replica_database.disconnect()
 
     await AsyncioTasksManager.gather()
 
@@ -69,6 +86,7 @@ routers = {
     "Divisions": divisions.router,
     "Brackets": brackets.router,
     "Courts": courts.router,
+    "Exports": exports.router,
     "Internals": internals.router,
     "Matches": matches.router,
     "Players": players.router,
@@ -142,20 +160,61 @@ app.add_middleware(
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next: RequestResponseEndpoint) -> Response:
-    start_time = time.time()
     request_metrics = get_request_metrics()
-    request_metrics.request_count[RequestDefinition.from_request(request)] += 1
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    request_metrics.response_time[RequestDefinition.from_request(request)] = process_time
+    route_key = get_route_key(request)
+    request_metrics.start_request(route_key)
+    start_time = time.perf_counter()
+    status_code = 500  # unhandled exceptions propagate through here and become a 500
+    route = " ".join(route_key)
+    with track_queries(route=route) as query_stats, trace_span(route, op="http.server") as span:
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            if span is not None:
+                span.set_attribute("http.status_code", status_code)
+            request_metrics.finish_request(
+                route_key, status_code, time.perf_counter() - start_time
+            )
+            request_metrics.record_queries(
+                route_key, query_stats.queries, query_stats.rows, query_stats.seconds
+            )
+
+    threshold = config.repeated_query_warning_threshold
+    if threshold is not None:
+        for statement, count in query_stats.repeated_statements(threshold):
+            logger.warning(f"{query_stats.route} ran the same query {count} times: {statement}")
+
+    if config.query_stats_headers:
+        response.headers["X-DB-Queries"] = str(query_stats.queries)
+        response.headers["X-DB-Rows"] = str(query_stats.rows)
+        response.headers["X-DB-Time-Ms"] = f"{query_stats.seconds * 1000:.1f}"
     return response
 
 
+if config.request_profiling:
+    # outermost, so the profile covers the other middleware as well
+    app.add_middleware(
+        ProfilingMiddleware,
+        is_authorized=auth.is_admin_request,
+        interval_seconds=config.request_profiling_interval_seconds,
+    )
+
+
 @app.exception_handler(HTTPException)
 async def validation_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
 
 
+@app.exception_handler(PoolAcquireTimeout)
+async def pool_acquire_timeout_handler(request: Request, exc: PoolAcquireTimeout) -> JSONResponse:
+    return JSONResponse(
+        {"detail": "The server is busy, please try again"},
+        status_code=503,
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     return JSONResponse({"detail": "Internal server error"}, status_code=500)
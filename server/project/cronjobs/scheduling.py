@@ -40,4 +40,6 @@ CRONJOBS = ((timedelta(minutes=5), delete_demo_accounts),)
 
 def start_cronjobs() -> None:
     for delta_time, cronjob_entrypoint in CRONJOBS:
-        AsyncioTasksManager.add_coroutine(run_cronjob(cronjob_entrypoint, delta_time))
+        AsyncioTasksManager.add_coroutine(
+            run_cronjob(cronjob_entrypoint, delta_time), long_running=True
+        )
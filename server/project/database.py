@@ -1,27 +1,454 @@
-from typing import Any
+import asyncio
+import itertools
+import random
+import re
+import sys
+import time
+from collections import Counter, deque
+from collections.abc import AsyncGenerator, Awaitable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, cast
+from zoneinfo import ZoneInfo
 
+import orjson
 import sqlalchemy
 from databases import Database
 from heliclockter import datetime_utc
+from sqlalchemy.sql import ClauseElement
 
 from project.config import config
+from project.models.metrics import PoolMetrics, PoolStats, SlowQuery, get_pool_metrics
+from project.utils.asyncio import AsyncioTasksManager
+from project.utils.logging import logger
+from project.utils.tracing import is_tracing, trace_span
+from project.utils.types import JsonDict
 
 
-def datetime_decoder(value: str) -> datetime_utc:
-    value = value.split(".")[0].replace("+00", "+00:00")
-    return datetime_utc.fromisoformat(value)
+class PoolAcquireTimeout(Exception):
+    """No database connection became available within `pg_pool_acquire_timeout_seconds`."""
+
+
+UTC = ZoneInfo("UTC")
+PG_EPOCH = datetime(2000, 1, 1)
+PG_EPOCH_UTC = datetime(2000, 1, 1, tzinfo=UTC)
+ONE_MICROSECOND = timedelta(microseconds=1)
+JSONB_FORMAT_VERSION = b"\x01"
+
+
+def timestamp_decoder(value: tuple[int]) -> datetime_utc:
+    """
+    Decodes the binary timestamp(tz) format, microseconds since 2000-01-01 UTC. Fractional
+    seconds are dropped, like the API always has. `datetime.__new__` is called directly to skip
+    the (slow) validation in `datetime_utc.__init__`, the timezone is UTC by construction.
+    """
+    microseconds = value[0]
+    dt = PG_EPOCH + timedelta(microseconds=microseconds - microseconds % 1_000_000)
+    return cast(
+        datetime_utc,
+        datetime.__new__(
+            datetime_utc, dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, 0, UTC
+        ),
+    )
+
+
+def timestamp_encoder(value: datetime) -> tuple[int]:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return ((value - PG_EPOCH_UTC) // ONE_MICROSECOND,)
+
+
+def json_encoder(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def jsonb_encoder(value: Any) -> bytes:
+    return JSONB_FORMAT_VERSION + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def jsonb_decoder(value: bytes) -> Any:
+    return orjson.loads(memoryview(value)[1:])
 
 
 async def asyncpg_init(connection: Any) -> None:
+    """
+    Registers binary codecs on every new connection: timestamps decode straight to
+    `datetime_utc` and JSON(B) values are (de)serialized with orjson, so rows come back with
+    parsed JSON and parameters for JSON(B) columns are passed as plain Python objects.
+    """
     for timestamp_type in ("timestamp", "timestamptz"):
         await connection.set_type_codec(
             timestamp_type,
-            encoder=datetime_utc.isoformat,
-            decoder=datetime_decoder,
+            encoder=timestamp_encoder,
+            decoder=timestamp_decoder,
             schema="pg_catalog",
+            format="tuple",
         )
+    await connection.set_type_codec(
+        "json", encoder=json_encoder, decoder=orjson.loads, schema="pg_catalog", format="binary"
+    )
+    await connection.set_type_codec(
+        "jsonb", encoder=jsonb_encoder, decoder=jsonb_decoder, schema="pg_catalog", format="binary"
+    )
+
+
+class InstrumentedPool:
+    """
+    Wraps the asyncpg pool that `databases` uses, to bound how long acquiring a connection may
+    take and to record how long requests wait for one. Everything else is delegated.
+    """
+
+    def __init__(self, pool: Any, metrics: PoolMetrics) -> None:
+        self._pool = pool
+        self._metrics = metrics
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    async def acquire(self) -> Any:
+        metrics = self._metrics
+        metrics.waiting += 1
+        start_time = time.perf_counter()
+        try:
+            return await self._pool.acquire(timeout=config.pg_pool_acquire_timeout_seconds)
+        except asyncio.TimeoutError as exc:
+            metrics.acquire_timeouts += 1
+            raise PoolAcquireTimeout("Timed out waiting for a database connection") from exc
+        finally:
+            metrics.waiting -= 1
+            metrics.acquire_time.observe(time.perf_counter() - start_time)
+
+
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+PLACEHOLDER_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+WHITESPACE_RE = re.compile(r"\s+")
+DATA_MODIFYING_RE = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_sql(sql: str) -> str:
+    sql = LITERAL_RE.sub("?", sql)
+    sql = PLACEHOLDER_LIST_RE.sub("?", sql)
+    return WHITESPACE_RE.sub(" ", sql).strip()
+
+
+def normalize_query(query: ClauseElement | str) -> str:
+    """The statement without literals and formatting, so repeats of a query compare equal."""
+    return _normalize_sql(query if isinstance(query, str) else str(query))
+
+
+def is_plain_select(statement: str) -> bool:
+    """
+    Whether the statement only reads, so it can safely be run again. Also excludes SELECT ... FOR
+    UPDATE and CTEs that modify data, like `WITH updated AS (UPDATE ...) SELECT ...`.
+    """
+    if not statement.upper().startswith(("SELECT", "WITH")):
+        return False
+    return DATA_MODIFYING_RE.search(statement) is None
+
+
+@dataclass
+class QueryStats:
+    """Queries run within `track_queries`, e.g. by a single request."""
+
+    route: str | None = None
+    queries: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, query: ClauseElement | str, rows: int, seconds: float) -> None:
+        self.queries += 1
+        self.rows += rows
+        self.seconds += seconds
+        self.statements[normalize_query(query)] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [(sql, count) for sql, count in self.statements.items() if count > threshold]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(route: str | None = None) -> Iterator[QueryStats]:
+    """
+    Records the queries run in this context on any database, including in tasks started from
+    it. Outside of this block queries aren't tracked, so there's no overhead.
+    """
+    stats = QueryStats(route=route)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def _row_count(result: Any) -> int:
+    if isinstance(result, list):
+        return len(result)
+    return 0 if result is None else 1
+
+
+class InstrumentedDatabase(Database):
+    def __init__(self, url: str, *, pool_name: str, **options: Any) -> None:
+        super().__init__(url, **options)
+        self.pool_name = pool_name
+        # JSON(B) is (de)serialized by the asyncpg codecs, SQLAlchemy tables must pass it through
+        dialect: Any = self._backend._dialect  # type: ignore[attr-defined]
+        dialect._json_serializer = dialect._json_deserializer = lambda value: value
+
+    async def connect(self) -> None:
+        await super().connect()
+        # `databases` has no hook for its pool, so the backend's pool is wrapped after creation
+        backend: Any = self._backend
+        if backend._pool is not None and not isinstance(backend._pool, InstrumentedPool):
+            backend._pool = InstrumentedPool(backend._pool, get_pool_metrics(self.pool_name))
+
+    def pool_stats(self) -> PoolStats | None:
+        """Sizes and counters of the pool, None when not connected."""
+        pool = getattr(self._backend, "_pool", None)
+        if pool is None:
+            return None
+        return PoolStats(
+            name=self.pool_name,
+            size=pool.get_size(),
+            max_size=pool.get_max_size(),
+            idle=pool.get_idle_size(),
+            metrics=get_pool_metrics(self.pool_name),
+        )
+
+    async def _tracked(
+        self,
+        query: ClauseElement | str,
+        values: Any,
+        call: Awaitable[Any],
+        *,
+        rows: bool = True,
+    ) -> Any:
+        start_time = time.perf_counter()
+        result = None
+        with trace_span(_statement_name(), op="db.sql") as span:
+            try:
+                result = await call
+                return result
+            finally:
+                row_count = _row_count(result) if rows else 0
+                if span is not None:
+                    span.set_attribute("db.statement", normalize_query(query))
+                    span.set_attribute("db.rows", row_count)
+                self._record(query, values, row_count, start_time)
+
+    def _record(
+        self, query: ClauseElement | str, values: Any, rows: int, start_time: float
+    ) -> None:
+        seconds = time.perf_counter() - start_time
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.record(query, rows, seconds)
+        threshold = config.slow_query_threshold_ms
+        if threshold is not None and seconds * 1000 >= threshold:
+            slow_query_log.record(self, query, values, seconds, stats.route if stats else None)
+
+    async def execute(self, query: ClauseElement | str, values: dict | None = None) -> Any:
+        if not _is_tracking():
+            return await super().execute(query, values)
+        # the result is the id of the last inserted row, so no rows are counted
+        return await self._tracked(query, values, super().execute(query, values), rows=False)
+
+    async def execute_many(self, query: ClauseElement | str, values: list) -> None:
+        if not _is_tracking():
+            return await super().execute_many(query, values)
+        return await self._tracked(
+            query, values, super().execute_many(query, values), rows=False
+        )
+
+    async def fetch_all(self, query: ClauseElement | str, values: dict | None = None) -> Any:
+        if not _is_tracking():
+            return await super().fetch_all(query, values)
+        return await self._tracked(query, values, super().fetch_all(query, values))
+
+    async def fetch_one(self, query: ClauseElement | str, values: dict | None = None) -> Any:
+        if not _is_tracking():
+            return await super().fetch_one(query, values)
+        return await self._tracked(query, values, super().fetch_one(query, values))
+
+    async def fetch_val(
+        self, query: ClauseElement | str, values: dict | None = None, column: Any = 0
+    ) -> Any:
+        if not _is_tracking():
+            return await super().fetch_val(query, values, column)
+        return await self._tracked(query, values, super().fetch_val(query, values, column))
+
+    async def iterate(
+        self, query: ClauseElement | str, values: dict | None = None
+    ) -> AsyncGenerator[Mapping, None]:
+        if not _is_tracking():
+            async for record in super().iterate(query, values):
+                yield record
+            return
+
+        start_time = time.perf_counter()
+        rows = 0
+        try:
+            async for record in super().iterate(query, values):
+                rows += 1
+                yield record
+        finally:
+            # includes the time spent by the consumer in between rows
+            self._record(query, values, rows, start_time)
+
+    async def explain_analyze(self, query: str, values: Any) -> JsonDict:
+        """
+        Runs the query with `EXPLAIN (ANALYZE, BUFFERS)` in a transaction that is rolled back,
+        on a connection of its own when called from a separate task.
+        """
+        async with self.connection() as connection:
+            async with connection.transaction(force_rollback=True):
+                result = await connection.fetch_val(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}", values
+                )
+        return cast(JsonDict, result[0])
+
+
+def _is_tracking() -> bool:
+    return (
+        _query_stats.get() is not None
+        or config.slow_query_threshold_ms is not None
+        or is_tracing()
+    )
+
+
+def _statement_name() -> str:
+    """Name of the function that runs the query, e.g. `sql.stages.get_full_tournament_details`."""
+    if not is_tracing():
+        return ""
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None and frame.f_globals.get("__name__") in (__name__, "contextlib"):
+        frame = frame.f_back  # type: ignore[assignment]
+    if frame is None:
+        return "sql"
+    module = str(frame.f_globals.get("__name__", "")).removeprefix("project.")
+    return f"{module}.{frame.f_code.co_name}"
+
+
+def parameter_shapes(values: Any) -> dict[str, str]:
+    """Types of the bound parameters (and lengths of lists), without their values."""
+    if not isinstance(values, dict):
+        return {}
+    return {
+        name: f"list[{len(value)}]" if isinstance(value, list) else type(value).__name__
+        for name, value in values.items()
+    }
+
+
+class SlowQueryLog:
+    """
+    The most recent queries slower than `slow_query_threshold_ms`. A sample of the slow SELECT
+    statements is run again with EXPLAIN ANALYZE in the background, one at a time, to capture
+    their plan. That happens on a separate connection, so the plan reflects committed data.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.entries: deque[SlowQuery] = deque(maxlen=size)
+        self._ids = itertools.count(1)
+        self._explaining = False
+
+    def record(
+        self,
+        database: InstrumentedDatabase,
+        query: ClauseElement | str,
+        values: Any,
+        seconds: float,
+        route: str | None,
+    ) -> None:
+        entry = SlowQuery(
+            id=next(self._ids),
+            created=datetime_utc.now(),
+            database=database.pool_name,
+            route=route,
+            duration_ms=round(seconds * 1000, 1),
+            statement=normalize_query(query),
+            parameters=parameter_shapes(values),
+        )
+        self.entries.append(entry)
+        logger.warning(
+            f"Slow query ({entry.duration_ms:.0f} ms) in {route or 'no request'}: "
+            f"{entry.statement} {entry.parameters}"
+        )
+
+        if (
+            isinstance(query, str)
+            and is_plain_select(entry.statement)
+            and not self._explaining
+            and random.random() < config.slow_query_explain_sample_rate
+        ):
+            self._explaining = True
+            AsyncioTasksManager.add_coroutine(self._explain(database, entry, query, values))
+
+    async def _explain(
+        self, database: InstrumentedDatabase, entry: SlowQuery, query: str, values: Any
+    ) -> None:
+        try:
+            entry.plan = await database.explain_analyze(query, values)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Could not explain slow query {entry.id}: {exc}")
+        finally:
+            self._explaining = False
+
+
+slow_query_log = SlowQueryLog(config.slow_query_log_size)
+
+
+def database_options() -> dict[str, Any]:
+    server_settings = (
+        {"statement_timeout": str(config.pg_statement_timeout_ms)}
+        if config.pg_statement_timeout_ms is not None
+        else {}
+    )
+    return {
+        "min_size": config.pg_pool_min_size,
+        "max_size": config.pg_pool_max_size,
+        "statement_cache_size": config.pg_statement_cache_size,
+        "server_settings": server_settings,
+        "init": asyncpg_init,
+    }
+
+
+database = InstrumentedDatabase(str(config.pg_dsn), pool_name="primary", **database_options())
+
+# Optional read replica, for read-only routes (see `read_database`)
+replica_database = (
+    InstrumentedDatabase(str(config.pg_replica_dsn), pool_name="replica", **database_options())
+    if config.pg_replica_dsn is not None
+    else None
+)
+
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+@contextmanager
+def replica_reads(enabled: bool = True) -> Iterator[None]:
+    """
+    Lets `read_database` return the replica within this block. Only for code that doesn't write:
+    the replica lags behind, so reads that have to see a write of the same request must stay
+    on the primary.
+    """
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
 
+def read_database() -> Database:
+    """Database for SQL helpers that only read: the replica within `replica_reads`, if any."""
+    if replica_database is not None and replica_database.is_connected and _replica_reads.get():
+        return replica_database
+    return database
 
-database = Database(str(config.pg_dsn), init=asyncpg_init)
 
 engine = sqlalchemy.create_engine(str(config.pg_dsn))
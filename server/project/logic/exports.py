@@ -0,0 +1,205 @@
+import re
+from collections.abc import Sequence
+from enum import auto
+from functools import cache
+from typing import IO
+
+from openpyxl import Workbook
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFError, TTFont
+from reportlab.pdfgen.canvas import Canvas
+
+from project.config import config
+from project.models.db.bracket import BracketWithEntries, DivisionWithBrackets, PlayerSlot, TeamSlot
+from project.models.db.division import DivisionType
+from project.utils.logging import logger
+from project.utils.types import EnumAutoStr
+
+
+class ExportFormat(EnumAutoStr):
+    pdf = auto()
+    xlsx = auto()
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.pdf: "application/pdf",
+    ExportFormat.xlsx: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+PLAYER_COLUMNS = [
+    "group_index",
+    "group_title",
+    "bracket_id",
+    "slot",
+    "player_id",
+    "code",
+    "name",
+    "club",
+]
+TEAM_COLUMNS = ["group_index", "group_title", "bracket_id", "slot", "team_id", "name"]
+
+PDF_MARGIN = 36
+PDF_TITLE_SIZE = 16
+PDF_SUBTITLE_SIZE = 12
+PDF_ROW_SIZE = 10
+PDF_ROW_HEIGHT = 16
+PDF_FONT = "ExportSans"
+PDF_BOLD_FONT = "ExportSans-Bold"
+
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def _group_title(bracket: BracketWithEntries) -> str:
+    return bracket.title or f"Group {bracket.index}"
+
+
+def _player_slots(bracket: BracketWithEntries) -> list[PlayerSlot]:
+    """Player slots in bracket order, leaving out slots beyond the bracket size."""
+    slots = [slot for slot in bracket.players if 0 <= slot.bracket_idx < bracket.num_players]
+    return sorted(slots, key=lambda slot: slot.bracket_idx)
+
+
+def _team_slots(bracket: BracketWithEntries) -> list[TeamSlot]:
+    """Team slots in bracket order, leaving out slots beyond the bracket size."""
+    slots = [slot for slot in bracket.teams if 0 <= slot.bracket_idx < bracket.num_players]
+    return sorted(slots, key=lambda slot: slot.bracket_idx)
+
+
+def _bracket_rows(division: DivisionWithBrackets, bracket: BracketWithEntries) -> list[list[str]]:
+    """Slot rows in bracket order, with empty slots shown as TBD."""
+    rows: list[list[str]] = [["", "TBD", ""] for _ in range(bracket.num_players)]
+    if division.division_type is DivisionType.TEAMS:
+        for team_slot in _team_slots(bracket):
+            rows[team_slot.bracket_idx] = ["", team_slot.name or "", ""]
+    else:
+        for player_slot in _player_slots(bracket):
+            rows[player_slot.bracket_idx] = [
+                player_slot.code or player_slot.participant_number or "",
+                player_slot.name or "",
+                player_slot.club or "",
+            ]
+    return rows
+
+
+@cache
+def _register_pdf_fonts() -> None:
+    """
+    The standard PDF fonts only cover Latin-1, so names are drawn with the configured TrueType
+    fonts. Falls back to the Vera fonts that come with reportlab when those can't be loaded.
+    """
+    fonts = [
+        (PDF_FONT, config.export_pdf_font_path, "Vera.ttf"),
+        (PDF_BOLD_FONT, config.export_pdf_bold_font_path, "VeraBd.ttf"),
+    ]
+    for name, path, fallback in fonts:
+        try:
+            font = TTFont(name, path)
+        except TTFError as exc:
+            logger.warning(f"Could not load PDF font {path}, using {fallback} instead: {exc}")
+            font = TTFont(name, fallback)
+        pdfmetrics.registerFont(font)
+
+
+def _sheet_title(division: DivisionWithBrackets, used_titles: set[str]) -> str:
+    base = _INVALID_SHEET_CHARS.sub("_", division.name)[:28] or "Division"
+    title, counter = base, 1
+    while title.lower() in used_titles:
+        counter += 1
+        title = f"{base[:25]} ({counter})"
+    used_titles.add(title.lower())
+    return title
+
+
+def render_brackets_xlsx(divisions: Sequence[DivisionWithBrackets], out: IO[bytes]) -> None:
+    """
+    Writes one sheet per division, one row per bracket slot. openpyxl keeps the rows of a
+    write-only workbook in temporary files and zips them into `out` when it is saved.
+    """
+    workbook = Workbook(write_only=True)
+    used_titles: set[str] = set()
+
+    for division in divisions:
+        sheet = workbook.create_sheet(_sheet_title(division, used_titles))
+        if division.division_type is DivisionType.TEAMS:
+            sheet.append(TEAM_COLUMNS)
+            for bracket in division.brackets:
+                for team_slot in _team_slots(bracket):
+                    sheet.append(
+                        [
+                            bracket.index,
+                            bracket.title or "",
+                            bracket.id,
+                            team_slot.bracket_idx,
+                            team_slot.team_id,
+                            team_slot.name or "",
+                        ]
+                    )
+        else:
+            sheet.append(PLAYER_COLUMNS)
+            for bracket in division.brackets:
+                for player_slot in _player_slots(bracket):
+                    sheet.append(
+                        [
+                            bracket.index,
+                            bracket.title or "",
+                            bracket.id,
+                            player_slot.bracket_idx,
+                            player_slot.player_id,
+                            player_slot.code or "",
+                            player_slot.name or "",
+                            player_slot.club or "",
+                        ]
+                    )
+
+    if not divisions:
+        workbook.create_sheet("brackets")
+
+    workbook.save(out)
+
+
+def render_brackets_pdf(divisions: Sequence[DivisionWithBrackets], out: IO[bytes]) -> None:
+    """
+    Writes one page per bracket: division and group title followed by the slots in order.
+    reportlab builds the whole document in memory and writes it to `out` when it is saved.
+    """
+    _register_pdf_fonts()
+    pdf = Canvas(out, pagesize=A4, initialFontName=PDF_FONT)
+    _, page_height = A4
+
+    for division in divisions:
+        for bracket in division.brackets:
+            y = page_height - PDF_MARGIN - PDF_TITLE_SIZE
+            pdf.setFont(PDF_BOLD_FONT, PDF_TITLE_SIZE)
+            pdf.drawString(PDF_MARGIN, y, division.name)
+            y -= PDF_SUBTITLE_SIZE + 8
+            pdf.setFont(PDF_FONT, PDF_SUBTITLE_SIZE)
+            pdf.drawString(PDF_MARGIN, y, _group_title(bracket))
+            y -= PDF_ROW_HEIGHT * 2
+
+            pdf.setFont(PDF_FONT, PDF_ROW_SIZE)
+            for slot, (code, name, club) in enumerate(_bracket_rows(division, bracket), start=1):
+                if y < PDF_MARGIN:
+                    pdf.showPage()
+                    pdf.setFont(PDF_FONT, PDF_ROW_SIZE)
+                    y = page_height - PDF_MARGIN - PDF_ROW_SIZE
+
+                pdf.drawRightString(PDF_MARGIN + 20, y, str(slot))
+                pdf.drawString(PDF_MARGIN + 32, y, code)
+                pdf.drawString(PDF_MARGIN + 96, y, name)
+                pdf.drawString(PDF_MARGIN + 320, y, club)
+                y -= PDF_ROW_HEIGHT
+
+            pdf.showPage()
+
+    pdf.save()
+
+
+def render_brackets(
+    export_format: ExportFormat, divisions: Sequence[DivisionWithBrackets], out: IO[bytes]
+) -> None:
+    match export_format:
+        case ExportFormat.pdf:
+            render_brackets_pdf(divisions, out)
+        case ExportFormat.xlsx:
+            render_brackets_xlsx(divisions, out)
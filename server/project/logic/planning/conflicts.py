@@ -4,6 +4,7 @@ from project.database import database
 from project.models.db.match import Match, MatchWithDetailsDefinitive
 from project.models.db.util import StageWithStageItems
 from project.utils.id_types import MatchId
+from project.utils.tracing import traced
 
 
 def matchesOverlap(match1: Match, match2: Match) -> bool:
@@ -21,6 +22,7 @@ def matchesOverlap(match1: Match, match2: Match) -> bool:
     )
 
 
+@traced
 def get_conflicting_matches(
     stages: list[StageWithStageItems],
 ) -> tuple[
@@ -77,6 +79,7 @@ def get_conflicting_matches(
     return conflicts_to_set, conflicts_to_clear
 
 
+@traced
 async def set_conflicts(
     conflicts_to_set: dict[MatchId, list[bool]],
     conflicts_to_clear: set[MatchId],
@@ -110,6 +113,7 @@ async def set_conflicts(
         )
 
 
+@traced
 async def handle_conflicts(stages: list[StageWithStageItems]) -> None:
     conflicts_to_set, conflicts_to_clear = get_conflicting_matches(stages)
     await set_conflicts(conflicts_to_set, conflicts_to_clear)
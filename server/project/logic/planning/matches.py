@@ -17,9 +17,11 @@ from project.sql.matches import (
 from project.sql.stages import get_full_tournament_details
 from project.sql.tournaments import sql_get_tournament
 from project.utils.id_types import CourtId, MatchId, TournamentId
+from project.utils.tracing import traced
 from project.utils.types import assert_some
 
 
+@traced
 async def schedule_all_unscheduled_matches(
     tournament_id: TournamentId, stages: list[StageWithStageItems]
 ) -> None:
@@ -80,6 +82,7 @@ class MatchPosition(NamedTuple):
     position: float
 
 
+@traced
 async def reorder_matches_for_court(
     tournament: Tournament,
     scheduled_matches: list[MatchPosition],
@@ -105,6 +108,7 @@ async def reorder_matches_for_court(
         )
 
 
+@traced
 async def handle_match_reschedule(
     tournament_id: TournamentId, body: MatchRescheduleBody, match_id: MatchId
 ) -> None:
@@ -145,6 +149,7 @@ async def handle_match_reschedule(
         await reorder_matches_for_court(tournament, scheduled_matches, body.old_court_id)
 
 
+@traced
 async def update_start_times_of_matches(tournament_id: TournamentId) -> None:
     stages = await get_full_tournament_details(tournament_id)
     tournament = await sql_get_tournament(tournament_id)
@@ -166,6 +171,7 @@ def get_scheduled_matches(stages: list[StageWithStageItems]) -> list[MatchPositi
     ]
 
 
+@traced
 def get_scheduled_matches_per_court(
     stages: list[StageWithStageItems],
 ) -> dict[int, list[MatchPosition]]:
@@ -9,6 +9,7 @@ from project.sql.matches import (
 from project.sql.stages import get_full_tournament_details
 from project.sql.tournaments import sql_get_tournament
 from project.utils.id_types import TournamentId
+from project.utils.tracing import traced
 from project.utils.types import assert_some
 
 
@@ -25,6 +26,7 @@ def get_draft_round(
     )
 
 
+@traced
 async def schedule_all_matches_for_swiss_round(
     tournament_id: TournamentId,
     active_round: RoundWithMatches,
@@ -0,0 +1,187 @@
+import asyncio
+import csv
+import io
+import re
+from collections.abc import Iterable, Iterator
+from enum import auto
+from itertools import islice
+from typing import IO, Any
+
+from fastapi import HTTPException
+from openpyxl import load_workbook
+from pydantic import ValidationError
+from starlette import status
+
+from project.database import database
+from project.models.db.player import (
+    PlayerBody,
+    PlayerImportError,
+    PlayerImportRow,
+    PlayersImportResult,
+)
+from project.sql.clubs import get_club_ids_by_name
+from project.sql.players import sql_bulk_insert_players
+from project.utils.id_types import TournamentId
+from project.utils.types import EnumAutoStr, JsonDict
+
+IMPORT_BATCH_SIZE = 500
+
+NAME_HEADERS = ("name",)
+FIRST_NAME_HEADERS = ("first name", "firstname", "given name")
+LAST_NAME_HEADERS = ("last name", "lastname", "family name")
+CLUB_HEADERS = ("club",)
+
+IndexedRow = tuple[int, JsonDict]
+
+
+class ImportFileType(EnumAutoStr):
+    csv = auto()
+    xlsx = auto()
+
+    @staticmethod
+    def from_filename(filename: str | None) -> "ImportFileType":
+        extension = (filename or "").rsplit(".", 1)[-1].lower()
+        if extension not in ImportFileType.values():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only .csv and .xlsx files can be imported",
+            )
+        return ImportFileType(extension)
+
+
+def _cell_text(value: Any) -> str | None:
+    text = str(value).strip() if value is not None else ""
+    return text or None
+
+
+def header_to_data_key(header: str) -> str:
+    """Same key normalization as the client import: lowercase, whitespace to underscores."""
+    return re.sub(r"\s+", "_", header.strip().lower())
+
+
+def iter_csv_rows(file: IO[bytes]) -> Iterator[list[Any]]:
+    yield from csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+
+
+def iter_xlsx_rows(file: IO[bytes], sheet: str | None) -> Iterator[list[Any]]:
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        if sheet is not None and sheet not in workbook.sheetnames:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Could not find sheet {sheet}",
+            )
+        worksheet = workbook[sheet] if sheet is not None else workbook.worksheets[0]
+        for values in worksheet.iter_rows(values_only=True):
+            yield list(values)
+    finally:
+        workbook.close()
+
+
+def spreadsheet_rows_to_players(
+    rows: Iterable[list[Any]],
+    header_row: int,
+    default_club: str | None,
+    data_row: int | None = None,
+) -> Iterator[IndexedRow]:
+    """
+    Turns raw spreadsheet rows into PlayerImportRow-shaped dicts, keyed by spreadsheet row number.
+    Players start at `data_row` (by default right below the header row), and like the client
+    import, reading stops at the first row without a name.
+    """
+    if data_row is not None and data_row <= header_row:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The first row of players must come after the header row",
+        )
+
+    headers: list[str] = []
+    for row_number, values in enumerate(rows, start=1):
+        if row_number < header_row or header_row < row_number < (data_row or 0):
+            continue
+
+        if row_number == header_row:
+            headers = [_cell_text(value) or "" for value in values]
+            normalized = {header.lower() for header in headers}
+            if not normalized.intersection(NAME_HEADERS + FIRST_NAME_HEADERS + LAST_NAME_HEADERS):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Could not find a name column in row {header_row}",
+                )
+            continue
+
+        by_header = {
+            header.lower(): _cell_text(value)
+            for header, value in zip(headers, values)
+            if header
+        }
+        name = next((by_header[h] for h in NAME_HEADERS if by_header.get(h)), None)
+        if name is None:
+            first = next((by_header[h] for h in FIRST_NAME_HEADERS if by_header.get(h)), None)
+            last = next((by_header[h] for h in LAST_NAME_HEADERS if by_header.get(h)), None)
+            name = " ".join(part for part in (first, last) if part) or None
+
+        if name is None:
+            return
+
+        club = next((by_header[h] for h in CLUB_HEADERS if by_header.get(h)), None)
+        yield row_number, {
+            "name": name,
+            "club": club or default_club,
+            "data": {
+                header_to_data_key(header): _cell_text(value)
+                for header, value in zip(headers, values)
+                if header
+            },
+        }
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in exc.errors()
+    )
+
+
+async def import_player_rows(
+    tournament_id: TournamentId, rows: Iterator[IndexedRow]
+) -> PlayersImportResult:
+    """
+    Validates rows in batches and inserts every batch with a single statement. Reading the next
+    batch happens in a worker thread, because it may involve parsing a large spreadsheet.
+    Rows that fail validation are skipped and reported, the other rows are inserted.
+    """
+    club_lookup = await get_club_ids_by_name()
+    known_club_ids = set(club_lookup.values())
+    created = 0
+    errors: list[PlayerImportError] = []
+
+    async with database.transaction():
+        while batch := await asyncio.to_thread(lambda: list(islice(rows, IMPORT_BATCH_SIZE))):
+            to_insert: list[PlayerBody] = []
+            for row_number, raw in batch:
+                try:
+                    row = PlayerImportRow.model_validate(raw)
+                except ValidationError as exc:
+                    errors.append(
+                        PlayerImportError(row=row_number, detail=_format_validation_error(exc))
+                    )
+                    continue
+
+                club_id = row.club_id
+                if club_id is None and row.club is not None:
+                    club_id = club_lookup.get(row.club.strip().lower())
+
+                if club_id is None or club_id not in known_club_ids:
+                    detail = (
+                        "Missing club"
+                        if row.club is None and row.club_id is None
+                        else f"Unknown club: {row.club if row.club is not None else row.club_id}"
+                    )
+                    errors.append(PlayerImportError(row=row_number, detail=detail))
+                    continue
+
+                to_insert.append(PlayerBody(name=row.name, club_id=club_id, data=row.data))
+
+            created += await sql_bulk_insert_players(to_insert, tournament_id)
+
+    return PlayersImportResult(created=created, errors=errors)
@@ -11,6 +11,7 @@ from project.models.db.util import StageItemWithRounds
 from project.sql.rankings import get_ranking_for_stage_item
 from project.sql.teams import update_team_stats
 from project.utils.id_types import PlayerId, StageItemInputId, TeamId, TournamentId
+from project.utils.tracing import traced
 
 K = 32
 D = 400
@@ -64,6 +65,7 @@ def set_statistics_for_stage_item_input(
             raise ValueError(f"Unsupported stage type: {stage_item.type}")
 
 
+@traced
 def determine_ranking_for_stage_item(
     stage_item: StageItemWithRounds,
     ranking: Ranking,
@@ -103,6 +105,7 @@ def determine_team_ranking_for_stage_item(
     return sorted(team_ranking.items(), key=lambda x: x[1].points, reverse=True)
 
 
+@traced
 async def recalculate_ranking_for_stage_item(
     tournament_id: TournamentId,
     stage_item: StageItemWithRounds,
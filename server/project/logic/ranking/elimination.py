@@ -8,8 +8,10 @@ from project.utils.id_types import (
     MatchId,
     RoundId,
 )
+from project.utils.tracing import traced
 
 
+@traced
 def get_inputs_to_update_in_subsequent_elimination_rounds(
     current_round_id: RoundId,
     stage_item: StageItemWithRounds,
@@ -68,6 +70,7 @@ def get_inputs_to_update_in_subsequent_elimination_rounds(
     }
 
 
+@traced
 async def update_inputs_in_subsequent_elimination_rounds(
     current_round_id: RoundId,
     stage_item: StageItemWithRounds,
@@ -82,6 +85,7 @@ async def update_inputs_in_subsequent_elimination_rounds(
         )
 
 
+@traced
 async def update_inputs_in_complete_elimination_stage_item(
     stage_item: StageItemWithRounds,
 ) -> None:
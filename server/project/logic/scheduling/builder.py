@@ -22,9 +22,11 @@ from project.models.db.util import StageWithStageItems
 from project.sql.rounds import get_next_round_name, sql_create_round
 from project.sql.stage_items import get_stage_item
 from project.utils.id_types import StageId, StageItemId, TournamentId
+from project.utils.tracing import traced
 from tests.integration_tests.mocks import MOCK_NOW
 
 
+@traced
 async def create_rounds_for_new_stage_item(
     tournament_id: TournamentId, stage_item: StageItem
 ) -> None:
@@ -50,6 +52,7 @@ async def create_rounds_for_new_stage_item(
         )
 
 
+@traced
 async def build_matches_for_stage_item(stage_item: StageItem, tournament_id: TournamentId) -> None:
     await create_rounds_for_new_stage_item(tournament_id, stage_item)
     stage_item_with_rounds = await get_stage_item(tournament_id, stage_item.id)
@@ -70,6 +73,7 @@ async def build_matches_for_stage_item(stage_item: StageItem, tournament_id: Tou
     await recalculate_ranking_for_stage_item(tournament_id, stage_item_with_rounds)
 
 
+@traced
 def determine_available_inputs(
     teams: list[FullTeamWithPlayers],
     stages: list[StageWithStageItems],
@@ -5,6 +5,7 @@ from project.sql.matches import sql_create_match
 from project.sql.rounds import get_rounds_for_stage_item
 from project.sql.tournaments import sql_get_tournament
 from project.utils.id_types import TournamentId
+from project.utils.tracing import traced
 
 
 def determine_matches_first_round(
@@ -61,6 +62,7 @@ def determine_matches_subsequent_round(
     return suggestions
 
 
+@traced
 async def build_single_elimination_stage_item(
     tournament_id: TournamentId, stage_item: StageItemWithRounds
 ) -> None:
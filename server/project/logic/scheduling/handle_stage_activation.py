@@ -28,6 +28,7 @@ from project.utils.id_types import (
     StageItemInputId,
     TournamentId,
 )
+from project.utils.tracing import traced
 from project.utils.types import assert_some
 
 StageItemXTeamRanking = dict[StageItemId, list[tuple[StageItemInputId, TeamStatistics]]]
@@ -85,6 +86,7 @@ async def get_team_update_for_input(
     )
 
 
+@traced
 async def get_team_rankings_lookup_for_tournament(
     tournament_id: TournamentId, stages: list[StageWithStageItems]
 ) -> StageItemXTeamRanking:
@@ -100,6 +102,7 @@ async def get_team_rankings_lookup_for_tournament(
     }
 
 
+@traced
 async def get_updates_to_inputs_in_activated_stage(
     tournament_id: TournamentId, stage_id: StageId
 ) -> dict[StageItemId, list[StageItemInputUpdate]]:
@@ -127,6 +130,7 @@ async def get_updates_to_inputs_in_activated_stage(
     return dict(result)
 
 
+@traced
 async def update_matches_in_activated_stage(tournament_id: TournamentId, stage_id: StageId) -> None:
     """
     Sets the team_id for stage item inputs of the newly activated stage.
@@ -139,6 +143,7 @@ async def update_matches_in_activated_stage(tournament_id: TournamentId, stage_i
             )
 
 
+@traced
 async def update_matches_in_deactivated_stage(
     tournament_id: TournamentId, deactivated_stage: StageWithStageItems
 ) -> None:
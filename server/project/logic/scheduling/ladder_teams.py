@@ -12,6 +12,7 @@ from project.models.db.match import (
 from project.models.db.stage_item_inputs import StageItemInput, StageItemInputFinal
 from project.models.db.util import RoundWithMatches
 from project.utils.id_types import StageItemInputId
+from project.utils.tracing import traced
 from project.utils.types import assert_some
 
 
@@ -53,6 +54,7 @@ def get_number_of_inputs_played_per_input(
     return result
 
 
+@traced
 def get_possible_upcoming_matches_for_swiss(
     filter_: MatchFilter,
     rounds: list[RoundWithMatches],
@@ -5,6 +5,7 @@ from project.models.db.util import StageItemWithRounds
 from project.sql.matches import sql_create_match
 from project.sql.tournaments import sql_get_tournament
 from project.utils.id_types import TournamentId
+from project.utils.tracing import traced
 
 
 def get_round_robin_combinations(team_count: int) -> list[list[tuple[int, int]]]:
@@ -35,6 +36,7 @@ def get_round_robin_combinations(team_count: int) -> list[list[tuple[int, int]]]
     return matches
 
 
+@traced
 async def build_round_robin_stage_item(
     tournament_id: TournamentId, stage_item: StageItemWithRounds
 ) -> None:
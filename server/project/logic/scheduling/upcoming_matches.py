@@ -6,6 +6,7 @@ from project.models.db.stage_item import StageType
 from project.models.db.util import RoundWithMatches, StageItemWithRounds
 from project.sql.stages import get_full_tournament_details
 from project.utils.id_types import StageItemId, TournamentId
+from project.utils.tracing import traced
 
 
 async def get_draft_round_in_stage_item(
@@ -27,6 +28,7 @@ async def get_draft_round_in_stage_item(
     return draft_round, stage_item
 
 
+@traced
 def get_upcoming_matches_for_swiss(
     match_filter: MatchFilter,
     stage_item: StageItemWithRounds,
@@ -61,9 +61,15 @@ subscription_lookup = {
 
 
 def check_requirement(array: list[Any], user: UserBase, attribute: str, additions: int = 1) -> None:
+    check_count_requirement(len(array), user, attribute, additions)
+
+
+def check_count_requirement(
+    existing: int, user: UserBase, attribute: str, additions: int = 1
+) -> None:
     subscription = subscription_lookup[user.account_type]
     constraint: int = getattr(subscription, attribute)
-    if len(array) + additions > constraint:
+    if existing + additions > constraint:
         raise HTTPException(
             400,
             f'Your `{user.account_type.value}` subscription allows a maximum of '
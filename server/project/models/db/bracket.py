@@ -1,8 +1,8 @@
 # project/models/db/bracket.py
-import json
 from pydantic import field_validator
 from typing import Optional, List
 from project.models.db.shared import BaseModelORM
+from project.models.db.division import DivisionType
 from project.utils.id_types import BracketId, DivisionId, PlayerId, TeamId
 
 class BracketInsertable(BaseModelORM):
@@ -85,8 +85,6 @@ class BracketWithPlayers(Bracket):
     @field_validator("players", mode="before")
     @classmethod
     def parse_players(cls, v):
-        if isinstance(v, str):
-            v = json.loads(v)
         if isinstance(v, list):
             # Filter out null/invalid slots (e.g. from JSONB_AGG when player was deleted)
             v = [x for x in v if isinstance(x, dict)]
@@ -101,13 +99,37 @@ class TeamSlot(BaseModelORM):
 class BracketWithTeams(Bracket):
     teams: List[TeamSlot]
 
-    @field_validator("teams", mode="before")
+
+class BracketTitleUpdateBody(BaseModelORM):
+    title: Optional[str] = None
+
+
+class BracketWithEntries(Bracket):
+    """A bracket with both its player and team slots, as returned for a whole tournament."""
+
+    players: List[PlayerSlot] = []
+    teams: List[TeamSlot] = []
+
+    @field_validator("players", "teams", mode="before")
     @classmethod
-    def parse_teams(cls, v):
-        if isinstance(v, str):
-            return json.loads(v)
+    def parse_slots(cls, v):
+        if v is None:
+            return []
+        if isinstance(v, list):
+            v = [x for x in v if isinstance(x, dict)]
         return v
 
 
-class BracketTitleUpdateBody(BaseModelORM):
-    title: Optional[str] = None
+class DivisionWithBrackets(BaseModelORM):
+    division_id: DivisionId
+    name: str
+    prefix: Optional[str] = None
+    division_type: DivisionType
+    brackets: List[BracketWithEntries]
+
+    @field_validator("brackets", mode="before")
+    @classmethod
+    def parse_brackets(cls, v):
+        if v is None:
+            return []
+        return v
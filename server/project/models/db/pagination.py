@@ -0,0 +1,36 @@
+import base64
+import binascii
+from enum import auto
+
+from pydantic import BaseModel, ValidationError
+
+from project.utils.types import EnumAutoStr
+
+
+class SortDirection(EnumAutoStr):
+    asc = auto()
+    desc = auto()
+
+
+class Cursor(BaseModel):
+    """Position of the last row of a page: its sort value and id."""
+
+    value: str
+    id: int
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @staticmethod
+    def decode(cursor: str) -> "Cursor":
+        try:
+            return Cursor.model_validate_json(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValidationError) as exc:
+            raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+class Pagination(BaseModel):
+    # no limit returns all rows, for views that need the whole list
+    limit: int | None = None
+    cursor: Cursor | None = None
+    sort_direction: SortDirection = SortDirection.asc
@@ -1,11 +1,14 @@
 from decimal import Decimal
-from typing import Optional, Any, Dict, List
+from enum import auto
+from typing import Annotated, Optional, Any, Dict, List
 
 from heliclockter import datetime_utc
-from pydantic import Field
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 
+from project.models.db.player_fields import PlayerFieldTypes
 from project.models.db.shared import BaseModelORM
-from project.utils.id_types import ClubId, PlayerId, TournamentId
+from project.utils.id_types import ClubId, DivisionId, PlayerId, TournamentId
+from project.utils.types import EnumAutoStr
 
 
 class PlayerInsertable(BaseModelORM):
@@ -45,13 +48,76 @@ class PlayerInDivision(BaseModelORM):
     club: str
     code: str | None = None
     participant_number: str | None = None  # from data.participant_number
+    fields: Dict[str, Any] = Field(default_factory=dict)  # requested player fields, typed
     bias: bool = False
 
 
 class PlayerCodeItem(BaseModelORM):
-    player_id: int
+    player_id: PlayerId
     code: Optional[str] = None
 
 
 class PlayerCodesBody(BaseModelORM):
     codes: List[PlayerCodeItem]
+
+    @field_validator("codes")
+    @classmethod
+    def unique_players(cls, codes: List[PlayerCodeItem]) -> List[PlayerCodeItem]:
+        player_ids = [item.player_id for item in codes]
+        if len(player_ids) != len(set(player_ids)):
+            raise ValueError("Every player can only be given one code")
+        return codes
+
+
+class PlayerCodeConflict(BaseModelORM):
+    """`code` can't be given to `player_id`, because `conflicting_player_id` has or gets it."""
+
+    player_id: PlayerId
+    code: str
+    conflicting_player_id: PlayerId
+
+
+class PlayerImportRow(BaseModelORM):
+    """A single imported row: the club is given either by id or by name/abbreviation."""
+
+    name: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+    club_id: Optional[ClubId] = None
+    club: Optional[str] = None
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class PlayersBulkBody(BaseModelORM):
+    players: List[Dict[str, Any]]
+    # used for rows that don't specify a club themselves
+    club_id: Optional[ClubId] = None
+
+
+class PlayerImportError(BaseModelORM):
+    row: int  # spreadsheet row number for files, index in `players` for JSON
+    detail: str
+
+
+class PlayersImportResult(BaseModelORM):
+    created: int
+    errors: List[PlayerImportError]
+
+
+class PlayerSortBy(EnumAutoStr):
+    player_name = "name"  # `name` would shadow `Enum.name`
+    code = auto()
+    club = auto()
+    field = auto()  # value of the player field given by `sort_field`
+
+
+class PlayerFilter(BaseModel):
+    club_id: Optional[ClubId] = None
+    division_id: Optional[DivisionId] = None
+    not_in_team: bool = False
+    search: Optional[str] = None
+    sort_by: PlayerSortBy = PlayerSortBy.player_name
+    sort_field: Optional[str] = None
+    sort_field_type: PlayerFieldTypes = PlayerFieldTypes.TEXT
+
+
+class PlayerSearchResult(Player):
+    rank: float
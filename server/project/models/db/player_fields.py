@@ -18,6 +18,7 @@ class FieldInsertable(BaseModelORM):
     type:     PlayerFieldTypes
     options:  list[str] = []
     position: int
+    indexed:  bool = False  # gets an expression index, see `sync_player_field_indexes`
 
 class SaveFieldsInsertable(BaseModelORM):
     fields: list[FieldInsertable]
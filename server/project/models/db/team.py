@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 # ruff: noqa: TCH001,TCH002
-import json
+from enum import auto
 from typing import Annotated
 
 from heliclockter import datetime_utc
@@ -9,7 +9,15 @@ from pydantic import BaseModel, Field, StringConstraints, field_validator
 
 from project.models.db.player import Player
 from project.models.db.shared import BaseModelORM
-from project.utils.id_types import ClubId, PlayerId, TeamCategoryId, TeamId, TournamentId
+from project.utils.id_types import (
+    ClubId,
+    DivisionId,
+    PlayerId,
+    TeamCategoryId,
+    TeamId,
+    TournamentId,
+)
+from project.utils.types import EnumAutoStr
 
 
 class TeamInsertable(BaseModelORM):
@@ -50,13 +58,9 @@ class TeamWithPlayers(BaseModel):
 
     @field_validator("players", mode="before")
     @classmethod
-    def handle_players(cls, values: list[Player] | str) -> list[Player]:  # type: ignore[misc]
-        if isinstance(values, str):
-            values_json = json.loads(values)
-            if values_json == [None]:
-                return []
-            return values_json
-
+    def handle_players(cls, values: list[Player]) -> list[Player]:  # type: ignore[misc]
+        if values == [None]:
+            return []
         return values
 
 
@@ -80,3 +84,21 @@ class TeamBody(BaseModelORM):
     active: bool
     player_ids: list[PlayerId] = Field(default_factory=list)
     positions: dict[str, str] | None = None  # player_id (string) -> position name e.g. "Senpo"
+
+
+class TeamsBulkBody(BaseModelORM):
+    teams: list[TeamBody] = Field(min_length=1)
+
+
+class TeamSortBy(EnumAutoStr):
+    code = auto()
+    club = auto()
+    category = auto()
+
+
+class TeamFilter(BaseModel):
+    club_id: ClubId | None = None
+    category_id: TeamCategoryId | None = None
+    division_id: DivisionId | None = None
+    search: str | None = None
+    sort_by: TeamSortBy = TeamSortBy.code
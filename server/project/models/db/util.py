@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 # ruff: noqa: TCH001,TCH002
-import json
 from typing import Any
 
 from pydantic import field_validator, model_validator
@@ -50,10 +49,6 @@ class StageWithStageItems(Stage):
 
     @field_validator("stage_items", mode="before")
     def handle_stage_items(values: list[StageItemWithRounds]) -> list[StageItemWithRounds]:  # type: ignore[misc]
-        if isinstance(values, str):
-            values_json = json.loads(values)
-            if values_json == [None]:
-                return []
-            return values_json
-
+        if values == [None]:
+            return []
         return values
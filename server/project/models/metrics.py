@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from enum import auto
 from functools import cache
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
+from heliclockter import datetime_utc
+from pydantic import BaseModel, Field
 
-from project.utils.http import HTTPMethod
+from project.config import config
 from project.utils.starlette import get_route_path
-from project.utils.types import EnumAutoStr
+from project.utils.types import EnumAutoStr, JsonDict
 
 if TYPE_CHECKING:
     from starlette.requests import Request
@@ -22,22 +24,53 @@ class PrometheusMetricType(EnumAutoStr):
     histogram = auto()
 
 
-class RequestDefinition(BaseModel):
-    url: str
-    method: HTTPMethod
+# Label values (method, route path) of a request, the route path being the template so that all
+# requests to an endpoint share a key. Kept as tuples, the labels are only built when scraping.
+RouteKey = tuple[str, str]
+StatusKey = tuple[str, str, int]
+
+
+def get_route_key(request: Request) -> RouteKey:
+    return request.method, get_route_path(request)
+
+
+# Upper bounds (in seconds) of the latency histogram buckets, see `request_latency_buckets`
+LATENCY_BUCKETS = tuple(config.request_latency_buckets)
+
+# Upper bounds of the histogram of database queries per request
+QUERY_COUNT_BUCKETS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0)
 
-    @staticmethod
-    def from_request(request: Request) -> RequestDefinition:
-        return RequestDefinition(
-            url=get_route_path(request),
-            method=HTTPMethod(request.method),
-        )
 
-    def to_value_lookup(self, value: float) -> tuple[dict[str, str], float]:
-        return {"url": self.url, "method": self.method.value}, value
+class Histogram(BaseModel):
+    buckets: tuple[float, ...] = LATENCY_BUCKETS
+    bucket_counts: list[int] = Field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    count: int = 0
+    sum: float = 0.0
 
-    def __hash__(self) -> int:
-        return str.__hash__(f"{self.method}-{self.url}")
+    @classmethod
+    def with_buckets(cls, buckets: tuple[float, ...]) -> Histogram:
+        return cls(buckets=buckets, bucket_counts=[0] * len(buckets))
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+
+    def to_value_lookups(
+        self, labels: dict[str, str]
+    ) -> list[tuple[str, dict[str, str], float]]:
+        """Cumulative `_bucket` series plus `_sum` and `_count`, as Prometheus expects them."""
+        lookups = []
+        cumulative = 0
+        for upper_bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative += bucket_count
+            lookups.append(("_bucket", {**labels, "le": str(upper_bound)}, float(cumulative)))
+        lookups.append(("_bucket", {**labels, "le": "+Inf"}, float(self.count)))
+        lookups.append(("_sum", labels, self.sum))
+        lookups.append(("_count", labels, float(self.count)))
+        return lookups
 
 
 class MetricDefinition(BaseModel):
@@ -62,39 +95,118 @@ class MetricDefinition(BaseModel):
 
         return result
 
+    def format_for_prometheus_histogram(
+        self, histograms: list[tuple[dict[str, str], Histogram]]
+    ) -> str:
+        result = f"# HELP {self.name} {self.description}\n# TYPE {self.name} {self.type_.value}\n"
+        for labels, histogram in histograms:
+            for suffix, series_labels, value in histogram.to_value_lookups(labels):
+                key_value = ",".join(
+                    [f'{label}="{label_value}"' for label, label_value in series_labels.items()]
+                )
+                series = f"{self.name}{suffix}"
+                if key_value:
+                    series += f"{{{key_value}}}"
+                result += f"{series} {value}\n"
 
-METRIC_DEFINITIONS = [
-    MetricDefinition(
-        name="bracket_response_time",
-        description="Latest response time per endpoint",
-        type_=PrometheusMetricType.gauge,
+        return result
+
+
+REQUEST_METRIC_DEFINITIONS = {
+    "duration": MetricDefinition(
+        name="bracket_request_duration_seconds",
+        description="Response time per endpoint",
+        type_=PrometheusMetricType.histogram,
     ),
-    MetricDefinition(
+    "count": MetricDefinition(
         name="bracket_request_count",
-        description="Requests count per endpoint",
+        description="Requests count per endpoint and status code",
         type_=PrometheusMetricType.counter,
     ),
-    MetricDefinition(
-        name="bracket_version",
-        description="Requests count per endpoint",
+    "in_flight": MetricDefinition(
+        name="bracket_requests_in_flight",
+        description="Requests currently being handled per endpoint",
+        type_=PrometheusMetricType.gauge,
+    ),
+    "db_queries": MetricDefinition(
+        name="bracket_request_db_queries",
+        description="Database queries per request per endpoint",
+        type_=PrometheusMetricType.histogram,
+    ),
+    "db_duration": MetricDefinition(
+        name="bracket_request_db_duration_seconds",
+        description="Time spent on database queries per request per endpoint",
+        type_=PrometheusMetricType.histogram,
+    ),
+    "db_rows": MetricDefinition(
+        name="bracket_request_db_rows",
+        description="Rows fetched from the database per endpoint",
         type_=PrometheusMetricType.counter,
     ),
-]
+    "version": MetricDefinition(
+        name="bracket_version",
+        description="Always 1, to tell whether the API is being scraped",
+        type_=PrometheusMetricType.gauge,
+    ),
+}
+
+
+def _observe(
+    histograms: dict[RouteKey, Histogram], key: RouteKey, buckets: tuple[float, ...], value: float
+) -> None:
+    if (histogram := histograms.get(key)) is None:
+        histogram = histograms[key] = Histogram.with_buckets(buckets)
+    histogram.observe(value)
 
 
 class RequestMetrics(BaseModel):
-    response_time: dict[RequestDefinition, float] = defaultdict(float)
-    request_count: dict[RequestDefinition, int] = defaultdict(int)
+    buckets: tuple[float, ...] = LATENCY_BUCKETS
+    duration: dict[RouteKey, Histogram] = Field(default_factory=dict)
+    count: defaultdict[StatusKey, int] = Field(default_factory=lambda: defaultdict(int))
+    in_flight: defaultdict[RouteKey, int] = Field(default_factory=lambda: defaultdict(int))
+    db_queries: dict[RouteKey, Histogram] = Field(default_factory=dict)
+    db_duration: dict[RouteKey, Histogram] = Field(default_factory=dict)
+    db_rows: defaultdict[RouteKey, int] = Field(default_factory=lambda: defaultdict(int))
+
+    def start_request(self, key: RouteKey) -> None:
+        self.in_flight[key] += 1
+
+    def finish_request(self, key: RouteKey, status_code: int, duration: float) -> None:
+        self.in_flight[key] -= 1
+        self.count[(*key, status_code)] += 1
+        _observe(self.duration, key, self.buckets, duration)
+
+    def record_queries(self, key: RouteKey, queries: int, rows: int, duration: float) -> None:
+        _observe(self.db_queries, key, QUERY_COUNT_BUCKETS, queries)
+        _observe(self.db_duration, key, self.buckets, duration)
+        self.db_rows[key] += rows
 
     def to_prometheus(self) -> str:
+        definitions = REQUEST_METRIC_DEFINITIONS
         metrics = [
-            METRIC_DEFINITIONS[0].format_for_prometheus_per_label(
-                [m.to_value_lookup(v) for m, v in self.response_time.items()]
+            definitions[name].format_for_prometheus_histogram(
+                [({"method": method, "url": url}, h) for (method, url), h in histograms.items()]
+            )
+            for name, histograms in (
+                ("duration", self.duration),
+                ("db_queries", self.db_queries),
+                ("db_duration", self.db_duration),
+            )
+        ]
+        metrics += [
+            definitions["count"].format_for_prometheus_per_label(
+                [
+                    ({"method": method, "url": url, "status": str(status)}, count)
+                    for (method, url, status), count in self.count.items()
+                ]
+            ),
+            definitions["in_flight"].format_for_prometheus_per_label(
+                [({"method": method, "url": url}, n) for (method, url), n in self.in_flight.items()]
             ),
-            METRIC_DEFINITIONS[1].format_for_prometheus_per_label(
-                [m.to_value_lookup(v) for m, v in self.request_count.items()]
+            definitions["db_rows"].format_for_prometheus_per_label(
+                [({"method": method, "url": url}, n) for (method, url), n in self.db_rows.items()]
             ),
-            METRIC_DEFINITIONS[2].format_for_prometheus(1.0),
+            definitions["version"].format_for_prometheus(1.0),
         ]
         return "\n".join(metrics)
 
@@ -102,3 +214,163 @@ class RequestMetrics(BaseModel):
 @cache
 def get_request_metrics() -> RequestMetrics:
     return RequestMetrics()
+
+
+POOL_METRIC_DEFINITIONS = {
+    "size": MetricDefinition(
+        name="bracket_db_pool_size",
+        description="Open connections in the database pool",
+        type_=PrometheusMetricType.gauge,
+    ),
+    "max_size": MetricDefinition(
+        name="bracket_db_pool_max_size",
+        description="Maximum number of connections in the database pool",
+        type_=PrometheusMetricType.gauge,
+    ),
+    "in_use": MetricDefinition(
+        name="bracket_db_pool_in_use",
+        description="Database connections currently acquired",
+        type_=PrometheusMetricType.gauge,
+    ),
+    "idle": MetricDefinition(
+        name="bracket_db_pool_idle",
+        description="Open database connections that are not acquired",
+        type_=PrometheusMetricType.gauge,
+    ),
+    "waiting": MetricDefinition(
+        name="bracket_db_pool_waiting",
+        description="Requests waiting to acquire a database connection",
+        type_=PrometheusMetricType.gauge,
+    ),
+    "acquire_timeouts": MetricDefinition(
+        name="bracket_db_pool_acquire_timeouts",
+        description="Times acquiring a database connection timed out",
+        type_=PrometheusMetricType.counter,
+    ),
+    "acquire_time": MetricDefinition(
+        name="bracket_db_pool_acquire_seconds",
+        description="Time spent waiting for a database connection",
+        type_=PrometheusMetricType.histogram,
+    ),
+}
+
+
+class PoolMetrics(BaseModel):
+    """Counters kept by an instrumented pool, the sizes are read from the pool itself."""
+
+    waiting: int = 0
+    acquire_timeouts: int = 0
+    acquire_time: Histogram = Field(default_factory=Histogram)
+
+
+class PoolStats(BaseModel):
+    name: str
+    size: int
+    max_size: int
+    idle: int
+    metrics: PoolMetrics
+
+
+def pools_to_prometheus(pools: list[PoolStats]) -> str:
+    definitions = POOL_METRIC_DEFINITIONS
+    values = {
+        "size": [pool.size for pool in pools],
+        "max_size": [pool.max_size for pool in pools],
+        "in_use": [pool.size - pool.idle for pool in pools],
+        "idle": [pool.idle for pool in pools],
+        "waiting": [pool.metrics.waiting for pool in pools],
+        "acquire_timeouts": [pool.metrics.acquire_timeouts for pool in pools],
+    }
+    metrics = [
+        definitions[key].format_for_prometheus_per_label(
+            [({"pool": pool.name}, value) for pool, value in zip(pools, pool_values)]
+        )
+        for key, pool_values in values.items()
+    ]
+    metrics.append(
+        definitions["acquire_time"].format_for_prometheus_histogram(
+            [({"pool": pool.name}, pool.metrics.acquire_time) for pool in pools]
+        )
+    )
+    return "\n".join(metrics)
+
+
+@cache
+def get_pool_metrics(pool_name: str) -> PoolMetrics:
+    return PoolMetrics()
+
+
+LOOP_METRIC_DEFINITIONS = {
+    "lag": MetricDefinition(
+        name="bracket_event_loop_lag_seconds",
+        description="Delay of the event loop in running a callback that is due",
+        type_=PrometheusMetricType.histogram,
+    ),
+    "latest_lag": MetricDefinition(
+        name="bracket_event_loop_latest_lag_seconds",
+        description="Most recently measured delay of the event loop",
+        type_=PrometheusMetricType.gauge,
+    ),
+    "blocked": MetricDefinition(
+        name="bracket_event_loop_blocked",
+        description="Times the event loop was blocked for longer than the threshold",
+        type_=PrometheusMetricType.counter,
+    ),
+}
+
+
+class LoopMetrics(BaseModel):
+    lag: Histogram = Field(default_factory=Histogram)
+    latest_lag: float = 0.0
+    blocked: int = 0
+
+    def observe_lag(self, lag: float) -> None:
+        self.latest_lag = lag
+        self.lag.observe(lag)
+
+    def to_prometheus(self) -> str:
+        definitions = LOOP_METRIC_DEFINITIONS
+        metrics = [
+            definitions["lag"].format_for_prometheus_histogram([({}, self.lag)]),
+            definitions["latest_lag"].format_for_prometheus(self.latest_lag),
+            definitions["blocked"].format_for_prometheus(self.blocked),
+        ]
+        return "\n".join(metrics)
+
+
+@cache
+def get_loop_metrics() -> LoopMetrics:
+    return LoopMetrics()
+
+
+class SlowQuery(BaseModel):
+    id: int
+    created: datetime_utc
+    database: str
+    route: str | None
+    duration_ms: float
+    statement: str
+    parameters: dict[str, str]
+    plan: JsonDict | None = None
+
+
+class PoolReadiness(BaseModel):
+    name: str
+    in_use: int
+    max_size: int
+    waiting: int
+
+
+class DatabaseReadiness(BaseModel):
+    name: str
+    reachable: bool
+    latency_ms: float | None
+
+
+class Readiness(BaseModel):
+    ready: bool
+    failures: list[str]
+    databases: list[DatabaseReadiness]
+    pools: list[PoolReadiness]
+    loop_lag_seconds: float | None
+    background_tasks: int
@@ -1,14 +1,90 @@
+import asyncio
+import hashlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import APIRouter, Depends, HTTPException, Request
 from starlette import status
 from firebase_admin import auth
 from firebase_config import *
 
+from project.config import config
+from project.models.db.account import UserAccountType
 from project.models.db.user import UserPublic
-from project.sql.users import get_user
-from project.utils.types import assert_some
+from project.sql.access import get_user_access_to_tournament
+from project.sql.users import get_user_cached
+from project.utils.cache import TTLCache
+from project.utils.id_types import TournamentId
+from project.utils.types import JsonDict, assert_some
 
 router = APIRouter()
 
+# Firebase ID tokens are valid for an hour, cached claims never outlive the token's `exp`
+TOKEN_MAX_LIFETIME_SECONDS = 3600
+
+TokenVerifier = Callable[[str], JsonDict]
+
+_verify_executor = ThreadPoolExecutor(
+    max_workers=config.auth_verify_worker_threads, thread_name_prefix="auth"
+)
+_verified_tokens: TTLCache[str, JsonDict] = TTLCache(
+    max_size=config.auth_token_cache_size, ttl_seconds=TOKEN_MAX_LIFETIME_SECONDS
+)
+_pending_verifications: dict[str, asyncio.Task[JsonDict]] = {}
+
+
+def firebase_verify_id_token(id_token: str) -> JsonDict:
+    """
+    Verifies the signature and claims of a Firebase ID token. Blocking: it checks an RSA
+    signature and may fetch Google's public certificates.
+    """
+    return auth.verify_id_token(id_token)
+
+
+_token_verifier: TokenVerifier = firebase_verify_id_token
+
+
+def set_token_verifier(verifier: TokenVerifier) -> None:
+    """
+    Replaces how tokens are verified, e.g. with a stub that doesn't fetch Google's certificates
+    when running locally or in tests.
+    """
+    global _token_verifier
+    _token_verifier = verifier
+    _verified_tokens.clear()
+
+
+async def _verify_and_cache(token_hash: str, id_token: str) -> JsonDict:
+    try:
+        claims = await asyncio.get_running_loop().run_in_executor(
+            _verify_executor, _token_verifier, id_token
+        )
+        _verified_tokens.set(token_hash, claims, expires_at=float(claims["exp"]))
+        return claims
+    finally:
+        del _pending_verifications[token_hash]
+
+
+async def verify_id_token(id_token: str) -> JsonDict:
+    """
+    Claims of a verified ID token. Verified tokens are cached by their hash until they expire,
+    and concurrent requests with the same (uncached) token share a single verification, which
+    runs in a thread pool so it doesn't block the event loop.
+    """
+    token_hash = hashlib.sha256(id_token.encode()).hexdigest()
+    claims = _verified_tokens.get(token_hash)
+    if claims is not None:
+        return claims
+
+    pending = _pending_verifications.get(token_hash)
+    if pending is None:
+        pending = asyncio.create_task(_verify_and_cache(token_hash, id_token))
+        _pending_verifications[token_hash] = pending
+
+    # shielded, so a cancelled request doesn't cancel the verification others are waiting for
+    return await asyncio.shield(pending)
+
+
 async def firebase_user_authenticated(request: Request):
 
     # Extract Authorization header
@@ -24,8 +100,8 @@ async def firebase_user_authenticated(request: Request):
 
     try:
         # Verify Firebase ID token
-        decoded_token = auth.verify_id_token(id_token)
-        user = await get_user(email=assert_some(decoded_token.get("email")))
+        decoded_token = await verify_id_token(id_token)
+        user = await get_user_cached(email=assert_some(decoded_token.get("email")))
         if user is None:
             return None
         return UserPublic.model_validate(user.model_dump())
@@ -36,6 +112,47 @@ async def firebase_user_authenticated(request: Request):
             detail="Invalid or expired ID token",
         )
 
+async def user_authenticated_for_tournament(
+    tournament_id: TournamentId,
+    user: UserPublic | None = Depends(firebase_user_authenticated),
+) -> UserPublic:
+    """Authenticated user that has access to the tournament in the path."""
+    if user is None or not await get_user_access_to_tournament(tournament_id, user.id):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="You don't have access to this tournament",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+async def admin_user_authenticated(
+    user: UserPublic | None = Depends(firebase_user_authenticated),
+) -> UserPublic:
+    """Authenticated user with an admin account, for internal endpoints."""
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Only admins have access to this endpoint",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if user.account_type is not UserAccountType.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins have access to this endpoint",
+        )
+    return user
+
+
+async def is_admin_request(request: Request) -> bool:
+    """Whether the request is authenticated as an admin, for checks outside of a route."""
+    try:
+        user = await firebase_user_authenticated(request)
+    except HTTPException:
+        return False
+    return user is not None and user.account_type is UserAccountType.ADMIN
+
+
 @router.get("/protected")
 async def protected_route(user: dict = Depends(firebase_user_authenticated)):
     return {"message": "You are authorized!", "user": user}
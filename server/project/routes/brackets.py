@@ -1,29 +1,50 @@
+from collections.abc import AsyncIterator
 from typing import Optional
 from fastapi import APIRouter, Depends, Query
+from starlette.responses import StreamingResponse
 
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import firebase_user_authenticated, user_authenticated_for_tournament
 from project.models.db.bracket import DivisionBracketsCreateBody, DivisionTeamBracketsCreateBody
 from project.routes.models import (
     BracketsResponse,
     BracketsWithPlayersResponse,
     BracketsWithTeamsResponse,
     SuccessResponse,
+    TournamentBracketsResponse,
 )
 from project.sql.brackets import (
+    sql_iterate_tournament_brackets,
+    sql_list_tournament_brackets,
     sql_list_division_brackets,
     sql_list_division_brackets_with_players,
     sql_list_division_brackets_with_teams,
     sql_create_division_brackets,
     sql_create_division_brackets_teams,
 )
-from project.utils.id_types import DivisionId, BracketId
+from project.utils.id_types import DivisionId, BracketId, TournamentId
 from project.models.db.bracket import BracketTitleUpdateBody
 from project.sql.brackets import sql_update_bracket_title
 
 router = APIRouter()
 
 
+@router.get("/tournaments/{tournament_id}/brackets", response_model=TournamentBracketsResponse)
+async def list_tournament_brackets(
+    tournament_id: TournamentId,
+    stream: bool = Query(False, description="Stream one division per line as NDJSON"),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
+) -> TournamentBracketsResponse | StreamingResponse:
+    if stream:
+        async def ndjson_lines() -> AsyncIterator[str]:
+            async for division in sql_iterate_tournament_brackets(tournament_id):
+                yield division.model_dump_json() + "\n"
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    return TournamentBracketsResponse(data=await sql_list_tournament_brackets(tournament_id))
+
+
 @router.get("/divisions/{division_id}/brackets", response_model=BracketsResponse)
 async def list_division_brackets(
     division_id: DivisionId,
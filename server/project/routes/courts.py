@@ -6,8 +6,9 @@ from project.database import database
 from project.logic.subscriptions import check_requirement
 from project.models.db.court import Court, CourtBody, CourtToInsert
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import user_authenticated_for_tournament
 from project.routes.models import CourtsResponse, SingleCourtResponse, SuccessResponse
+from project.routes.util import read_only_route_dependency
 from project.schema import courts
 from project.sql.courts import get_all_courts_in_tournament, sql_delete_court, update_court
 from project.sql.stages import get_full_tournament_details
@@ -18,10 +19,14 @@ from project.utils.types import assert_some
 router = APIRouter()
 
 
-@router.get("/tournaments/{tournament_id}/courts", response_model=CourtsResponse)
+@router.get(
+    "/tournaments/{tournament_id}/courts",
+    response_model=CourtsResponse,
+    dependencies=[Depends(read_only_route_dependency)],
+)
 async def get_courts(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> CourtsResponse:
     return CourtsResponse(data=await get_all_courts_in_tournament(tournament_id))
 
@@ -31,7 +36,7 @@ async def update_court_by_id(
     tournament_id: TournamentId,
     court_id: CourtId,
     court_body: CourtBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SingleCourtResponse:
     await update_court(
         tournament_id=tournament_id,
@@ -55,7 +60,7 @@ async def update_court_by_id(
 async def delete_court(
     tournament_id: TournamentId,
     court_id: CourtId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     stages = await get_full_tournament_details(tournament_id, no_draft_rounds=False)
     used_in_matches_count = 0
@@ -80,7 +85,7 @@ async def delete_court(
 async def create_court(
     court_body: CourtBody,
     tournament_id: TournamentId,
-    user: UserPublic = Depends(firebase_user_authenticated),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SingleCourtResponse:
     existing_courts = await get_all_courts_in_tournament(tournament_id)
     check_requirement(existing_courts, user, "max_courts")
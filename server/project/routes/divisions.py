@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette import status
 
 from project.models.db.division import (
     DivisionCreateBody,
@@ -8,8 +9,9 @@ from project.models.db.division import (
     DivisionPlayersDetachBody,
     DivisionTeamsDetachBody,
 )
+from project.models.db.pagination import SortDirection
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import firebase_user_authenticated, user_authenticated_for_tournament
 from project.routes.models import (
     DivisionResponse,
     DivisionsResponse,
@@ -23,12 +25,14 @@ from project.sql.divisions import (
     sql_delete_division,
     sql_update_division,
     sql_attach_players_to_division,
+    sql_get_division,
     sql_get_players_for_division,
     sql_attach_teams_to_division,
     sql_get_teams_for_division,
     sql_detach_players_from_division,
     sql_detach_teams_from_division,
 )
+from project.sql.player_fields import get_player_fields
 from project.utils.id_types import DivisionId, TournamentId
 
 router = APIRouter()
@@ -37,7 +41,7 @@ router = APIRouter()
 @router.get("/tournaments/{tournament_id}/divisions", response_model=DivisionsResponse)
 async def list_divisions_for_tournament(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> DivisionsResponse:
     items = await get_divisions_for_tournament(tournament_id)
     return DivisionsResponse(data=items)
@@ -74,9 +78,29 @@ async def delete_division(
 @router.get("/divisions/{division_id}/players", response_model=DivisionPlayersResponse)
 async def list_division_players(
     division_id: DivisionId,
+    fields: list[str] = Query([]),
+    sort_field: str | None = None,
+    sort_direction: SortDirection = SortDirection.asc,
     _: UserPublic = Depends(firebase_user_authenticated),
 ) -> DivisionPlayersResponse:
-    players = await sql_get_players_for_division(division_id)
+    division = await sql_get_division(division_id)
+    if division is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Division not found")
+
+    player_fields = {field.key: field for field in await get_player_fields(division.tournament_id)}
+    unknown_keys = {*fields, *([sort_field] if sort_field else [])} - player_fields.keys()
+    if unknown_keys:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown player field(s): {', '.join(sorted(unknown_keys))}",
+        )
+
+    players = await sql_get_players_for_division(
+        division,
+        fields=[player_fields[key] for key in fields],
+        sort_field=player_fields[sort_field] if sort_field else None,
+        sort_direction=sort_direction,
+    )
     return DivisionPlayersResponse(players=players)
 
 
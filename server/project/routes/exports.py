@@ -0,0 +1,33 @@
+from functools import partial
+
+from fastapi import APIRouter, Depends, Query
+from starlette.responses import StreamingResponse
+
+from project.logic.exports import EXPORT_MEDIA_TYPES, ExportFormat, render_brackets
+from project.models.db.user import UserPublic
+from project.routes.auth import user_authenticated_for_tournament
+from project.sql.brackets import sql_list_tournament_brackets
+from project.utils.id_types import DivisionId, TournamentId
+from project.utils.streaming import stream_from_thread
+
+router = APIRouter()
+
+
+@router.get("/tournaments/{tournament_id}/export/brackets")
+async def export_brackets(
+    tournament_id: TournamentId,
+    export_format: ExportFormat = Query(ExportFormat.pdf, alias="format"),
+    division_ids: list[DivisionId] | None = Query(
+        None, description="Only export these divisions (defaults to all divisions)"
+    ),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
+) -> StreamingResponse:
+    divisions = await sql_list_tournament_brackets(
+        tournament_id, set(division_ids) if division_ids else None
+    )
+    filename = f"brackets-{tournament_id}.{export_format.value}"
+    return StreamingResponse(
+        stream_from_thread(partial(render_brackets, export_format, divisions)),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,16 +1,61 @@
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from project.models.metrics import get_request_metrics
+from project.config import config
+from project.database import database, replica_database, slow_query_log
+from project.models.db.user import UserPublic
+from project.models.metrics import (
+    Readiness,
+    get_loop_metrics,
+    get_request_metrics,
+    pools_to_prometheus,
+)
+from project.routes.auth import admin_user_authenticated
+from project.routes.models import SlowQueriesResponse
+from project.utils.readiness import check_readiness
 
 router = APIRouter()
 
 
 @router.get("/metrics", response_class=PlainTextResponse)
 async def get_metrics() -> PlainTextResponse:
-    return PlainTextResponse(get_request_metrics().to_prometheus())
+    metrics = [get_request_metrics().to_prometheus()]
+    pools = [
+        pool_stats
+        for db in (database, replica_database)
+        if db is not None and (pool_stats := db.pool_stats()) is not None
+    ]
+    if pools:
+        metrics.append(pools_to_prometheus(pools))
+    if config.loop_monitor_enabled:
+        metrics.append(get_loop_metrics().to_prometheus())
+    return PlainTextResponse("\n".join(metrics))
+
+
+@router.get("/slow_queries", response_model=SlowQueriesResponse)
+async def get_slow_queries(
+    _: UserPublic = Depends(admin_user_authenticated),
+) -> SlowQueriesResponse:
+    """Most recent queries slower than `SLOW_QUERY_THRESHOLD_MS`, newest first."""
+    return SlowQueriesResponse(data=list(reversed(slow_query_log.entries)))
 
 
 @router.get("/ping", summary="Healthcheck ping")
 async def ping() -> str:
     return "ping"
+
+
+@router.get(
+    "/ready",
+    summary="Readiness check, 503 when saturated",
+    response_model=Readiness,
+    responses={503: {"model": Readiness}},
+)
+async def ready() -> JSONResponse:
+    """
+    For load balancers: whether this worker can take more requests. Unlike `/ping`, this
+    checks that the database responds in time and that the connection pool, the event loop and
+    the background tasks are below the `READINESS_*` thresholds.
+    """
+    readiness = await check_readiness()
+    return JSONResponse(readiness.model_dump(), status_code=200 if readiness.ready else 503)
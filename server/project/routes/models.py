@@ -7,8 +7,18 @@ from project.models.db.club import Club
 from project.models.db.division import Division
 from project.models.db.court import Court
 from project.models.db.match import Match, SuggestedMatch
-from project.models.db.player import Player, PlayerInDivision
-from project.models.db.bracket import Bracket, BracketWithPlayers, BracketWithTeams
+from project.models.db.player import (
+    Player,
+    PlayerInDivision,
+    PlayerSearchResult,
+    PlayersImportResult,
+)
+from project.models.db.bracket import (
+    Bracket,
+    BracketWithPlayers,
+    BracketWithTeams,
+    DivisionWithBrackets,
+)
 from project.models.db.ranking import Ranking
 from project.models.db.stage_item_inputs import (
     StageItemInputOptionFinal,
@@ -19,6 +29,7 @@ from project.models.db.team_category import TeamCategory
 from project.models.db.tournament import Tournament
 from project.models.db.user import UserPublic
 from project.models.db.util import StageWithStageItems
+from project.models.metrics import SlowQuery
 from project.utils.id_types import StageId, StageItemId
 
 DataT = TypeVar("DataT")
@@ -72,16 +83,25 @@ class DivisionTeamsResponse(BaseModel):
 class PaginatedPlayers(BaseModel):
     count: int
     players: list[Player]
+    next_cursor: str | None = None
 
 
 class PlayersResponse(DataResponse[PaginatedPlayers]):
     pass
 
 
+class PlayerSearchResponse(DataResponse[list[PlayerSearchResult]]):
+    pass
+
+
 class SinglePlayerResponse(DataResponse[Player]):
     pass
 
 
+class PlayersImportResponse(DataResponse[PlayersImportResult]):
+    pass
+
+
 class BracketResponse(BaseModel):
     data: Bracket
 
@@ -98,6 +118,10 @@ class BracketsWithTeamsResponse(BaseModel):
     data: list[BracketWithTeams]
 
 
+class TournamentBracketsResponse(DataResponse[list[DivisionWithBrackets]]):
+    pass
+
+
 class StagesWithStageItemsResponse(DataResponse[list[StageWithStageItems]]):
     pass
 
@@ -113,12 +137,17 @@ class SingleMatchResponse(DataResponse[Match]):
 class PaginatedTeams(BaseModel):
     count: int
     teams: list[FullTeamWithPlayers]
+    next_cursor: str | None = None
 
 
 class TeamsWithPlayersResponse(DataResponse[PaginatedTeams]):
     pass
 
 
+class TeamsBulkResponse(DataResponse[list[FullTeamWithPlayers]]):
+    pass
+
+
 class SingleTeamResponse(DataResponse[Team]):
     pass
 
@@ -155,3 +184,7 @@ class StageItemInputOptionsResponse(
 
 class StageRankingResponse(DataResponse[dict[StageItemId, list[StageItemInputUpdate]]]):
     pass
+
+
+class SlowQueriesResponse(DataResponse[list[SlowQuery]]):
+    pass
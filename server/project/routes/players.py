@@ -1,31 +1,52 @@
+import json
 import logging
 
 import asyncpg  # type: ignore[import-untyped]
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, UploadFile
 from starlette import status
 
 from project.database import database
+from project.logic.players_import import (
+    ImportFileType,
+    import_player_rows,
+    iter_csv_rows,
+    iter_xlsx_rows,
+    spreadsheet_rows_to_players,
+)
 from project.logic.subscriptions import check_requirement
-from project.models.db.player import PlayerBody, PlayerCodesBody
+from project.models.db.pagination import Pagination
+from project.models.db.player import (
+    PlayerBody,
+    PlayerCodesBody,
+    PlayerFilter,
+    PlayersBulkBody,
+    PlayerSortBy,
+)
+from project.models.db.player_fields import PlayerFieldTypes
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import user_authenticated_for_tournament
 from project.routes.models import (
     CreatePlayerResponse,
     PaginatedPlayers,
+    PlayerSearchResponse,
+    PlayersImportResponse,
     PlayersResponse,
     SinglePlayerResponse,
     SuccessResponse,
 )
+from project.routes.util import pagination_dependency
 from project.schema import players
 from project.sql.players import (
-    get_all_players_in_tournament,
     get_player_by_id,
-    get_player_count,
+    get_players_page,
     insert_player,
     sql_delete_player,
+    sql_search_players,
+    sql_update_player_codes,
 )
-from project.utils.id_types import PlayerId, TournamentId
-from project.utils.types import assert_some
+from project.sql.player_fields import get_player_field_keys, get_player_fields
+from project.utils.id_types import ClubId, DivisionId, PlayerId, TournamentId
+from project.utils.types import JsonDict, assert_some
 
 router = APIRouter()
 
@@ -34,23 +55,95 @@ router = APIRouter()
 async def get_players(
     tournament_id: TournamentId,
     not_in_team: bool = False,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    club_id: ClubId | None = None,
+    division_id: DivisionId | None = None,
+    search: str | None = None,
+    sort_by: PlayerSortBy = PlayerSortBy.player_name,
+    sort_field: str | None = None,
+    pagination: Pagination = Depends(pagination_dependency),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> PlayersResponse:
+    if sort_by is PlayerSortBy.field and not sort_field:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="sort_field is required when sorting by a player field",
+        )
+
+    sort_field_type = PlayerFieldTypes.TEXT
+    if sort_by is PlayerSortBy.field:
+        field_types = {field.key: field.type for field in await get_player_fields(tournament_id)}
+        if sort_field not in field_types:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown player field: {sort_field}",
+            )
+        sort_field_type = field_types[sort_field]
+
+    player_filter = PlayerFilter(
+        club_id=club_id,
+        division_id=division_id,
+        not_in_team=not_in_team,
+        search=search,
+        sort_by=sort_by,
+        sort_field=sort_field,
+        sort_field_type=sort_field_type,
+    )
+    players_, count, cursor = await get_players_page(tournament_id, player_filter, pagination)
     return PlayersResponse(
         data=PaginatedPlayers(
-            players=await get_all_players_in_tournament(
-                tournament_id, not_in_team=not_in_team
-            ),
-            count=await get_player_count(tournament_id, not_in_team=not_in_team),
+            players=players_,
+            count=count,
+            next_cursor=cursor.encode() if cursor is not None else None,
         )
     )
 
 
+@router.get("/tournaments/{tournament_id}/players/search", response_model=PlayerSearchResponse)
+async def search_players(
+    tournament_id: TournamentId,
+    q: str | None = Query(None, description="Words to match in name or code"),
+    fields: str | None = Query(
+        None, description='JSON object of player field values, e.g. {"rank": "3 dan"}'
+    ),
+    limit: int = Query(20, ge=1, le=100),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
+) -> PlayerSearchResponse:
+    field_values: JsonDict | None = None
+    if fields is not None:
+        try:
+            field_values = json.loads(fields)
+        except json.JSONDecodeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="fields must be valid JSON"
+            ) from exc
+        if not isinstance(field_values, dict):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="fields must be a JSON object"
+            )
+
+        unknown_keys = field_values.keys() - await get_player_field_keys(tournament_id)
+        if unknown_keys:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown player field(s): {', '.join(sorted(unknown_keys))}",
+            )
+
+    if not (q and q.strip()) and not field_values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide a search term or field values",
+        )
+
+    return PlayerSearchResponse(
+        data=await sql_search_players(tournament_id, q, field_values, limit)
+    )
+
+
 @router.post("/tournaments/{tournament_id}/players", response_model=CreatePlayerResponse)
 async def create_single_player(
     player_body: PlayerBody,
     tournament_id: TournamentId,
-    user: UserPublic = Depends(firebase_user_authenticated),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> CreatePlayerResponse:
     # existing_players = await get_all_players_in_tournament(tournament_id)
     # check_requirement(existing_players, user, "max_players")
@@ -58,11 +151,49 @@ async def create_single_player(
     return CreatePlayerResponse(id=player_id)
 
 
+@router.post("/tournaments/{tournament_id}/players/bulk", response_model=PlayersImportResponse)
+async def create_players_bulk(
+    body: PlayersBulkBody,
+    tournament_id: TournamentId,
+    _: UserPublic = Depends(user_authenticated_for_tournament),
+) -> PlayersImportResponse:
+    rows = (
+        (
+            index,
+            player
+            if player.get("club") is not None or player.get("club_id") is not None
+            else {**player, "club_id": body.club_id},
+        )
+        for index, player in enumerate(body.players)
+    )
+    return PlayersImportResponse(data=await import_player_rows(tournament_id, rows))
+
+
+@router.post("/tournaments/{tournament_id}/players/import", response_model=PlayersImportResponse)
+async def import_players(
+    tournament_id: TournamentId,
+    file: UploadFile,
+    club: str | None = Form(None, description="Club name for rows without a club column"),
+    sheet: str | None = Form(None, description="Sheet to read (xlsx only, defaults to the first)"),
+    header_row: int = Form(1, ge=1),
+    data_row: int | None = Form(None, description="First row of players, after the header row"),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
+) -> PlayersImportResponse:
+    match ImportFileType.from_filename(file.filename):
+        case ImportFileType.csv:
+            raw_rows = iter_csv_rows(file.file)
+        case ImportFileType.xlsx:
+            raw_rows = iter_xlsx_rows(file.file, sheet)
+
+    rows = spreadsheet_rows_to_players(raw_rows, header_row, club, data_row)
+    return PlayersImportResponse(data=await import_player_rows(tournament_id, rows))
+
+
 @router.delete("/tournaments/{tournament_id}/players/{player_id}", response_model=SuccessResponse)
 async def delete_player(
     tournament_id: TournamentId,
     player_id: PlayerId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     await sql_delete_player(tournament_id, player_id)
     return SuccessResponse()
@@ -75,33 +206,32 @@ logger = logging.getLogger(__name__)
 async def update_player_codes(
     tournament_id: TournamentId,
     body: PlayerCodesBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
-    query = """
-        UPDATE players
-        SET code = :code
-        WHERE id = :player_id AND tournament_id = :tournament_id
-    """
     try:
-        async with database.transaction():
-            for item in body.codes:
-                await database.execute(
-                    query=query,
-                    values={
-                        "code": item.code,
-                        "player_id": item.player_id,
-                        "tournament_id": tournament_id,
-                    },
-                )
+        conflicts = await sql_update_player_codes(body.codes, tournament_id)
     except asyncpg.exceptions.UniqueViolationError as exc:
+        # A concurrent update took one of the codes after the conflict check
         logger.warning("Player codes update: unique violation %s", exc)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="One or more player codes are already in use in this tournament (codes must be unique per tournament).",
         ) from exc
-    except Exception as exc:
-        logger.exception("Player codes update failed: %s", exc)
-        raise
+
+    if conflicts:
+        index_by_player = {item.player_id: i for i, item in enumerate(body.codes)}
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=[
+                {
+                    "loc": ["body", "codes", index_by_player[conflict.player_id], "code"],
+                    "msg": f"Code {conflict.code} is already used by player {conflict.conflicting_player_id}",
+                    "type": "code_conflict",
+                    **conflict.model_dump(),
+                }
+                for conflict in conflicts
+            ],
+        )
 
     return SuccessResponse()
 
@@ -111,7 +241,7 @@ async def update_player_by_id(
     tournament_id: TournamentId,
     player_id: PlayerId,
     player_body: PlayerBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SinglePlayerResponse:
     await database.execute(
         query=players.update().where(
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 
 from project.database import database
 from project.schema import players_field
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import user_authenticated_for_tournament
 from project.models.db.user import UserPublic
 from project.utils.id_types import TournamentId
 from project.models.db.player_fields import FieldInsertable, SaveFieldsInsertable
@@ -14,7 +14,7 @@ router = APIRouter()
 async def update_player_fields(
     tournament_id: TournamentId,
     payload: SaveFieldsInsertable,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     print("Saving player fields for tournament:", tournament_id)
     # 1) wipe out old
@@ -32,21 +32,23 @@ async def update_player_fields(
         "type":          f.type.value,  # serialize enum to string value
         "options":       f.options,
         "position":      f.position,
+        "indexed":       f.indexed,
       }
       for f in payload.fields
     ]
     if rows:
       await database.execute_many(query=players_field.insert(), values=rows)
+
     return SuccessResponse()
 
 
 @router.get("/tournaments/{tournament_id}/player_fields",
     response_model=SaveFieldsInsertable,
-    dependencies=[Depends(firebase_user_authenticated)],
+    dependencies=[Depends(user_authenticated_for_tournament)],
 )
 async def get_player_fields(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SaveFieldsInsertable:
     # Fetch all fields for this tournament, in their saved order
     query = (
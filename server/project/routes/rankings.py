@@ -8,11 +8,12 @@ from project.logic.subscriptions import check_requirement
 from project.models.db.ranking import RankingBody, RankingCreateBody
 from project.models.db.stage_item import StageType
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import user_authenticated_for_tournament
 from project.routes.models import (
     RankingsResponse,
     SuccessResponse,
 )
+from project.routes.util import read_only_route_dependency
 from project.sql.rankings import (
     get_all_rankings_in_tournament,
     sql_create_ranking,
@@ -26,10 +27,12 @@ from project.utils.id_types import RankingId, TournamentId
 router = APIRouter()
 
 
-@router.get("/tournaments/{tournament_id}/rankings")
+@router.get(
+    "/tournaments/{tournament_id}/rankings", dependencies=[Depends(read_only_route_dependency)]
+)
 async def get_rankings(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> RankingsResponse:
     return RankingsResponse(data=await get_all_rankings_in_tournament(tournament_id))
 
@@ -39,7 +42,7 @@ async def update_ranking_by_id(
     tournament_id: TournamentId,
     ranking_id: RankingId,
     ranking_body: RankingBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     await sql_update_ranking(
         tournament_id=tournament_id,
@@ -60,7 +63,7 @@ async def update_ranking_by_id(
 async def delete_ranking(
     tournament_id: TournamentId,
     ranking_id: RankingId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     await sql_delete_ranking(tournament_id, ranking_id)
     return SuccessResponse()
@@ -70,7 +73,7 @@ async def delete_ranking(
 async def create_ranking(
     ranking_body: RankingCreateBody,
     tournament_id: TournamentId,
-    user: UserPublic = Depends(firebase_user_authenticated),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     existing_rankings = await get_all_rankings_in_tournament(tournament_id)
     check_requirement(existing_rankings, user, "max_rankings")
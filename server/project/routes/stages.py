@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from starlette import status
 
-from project.database import database
+from project.database import database, replica_reads
 from project.logic.scheduling.builder import determine_available_inputs
 from project.logic.scheduling.handle_stage_activation import (
     get_updates_to_inputs_in_activated_stage,
@@ -12,7 +12,7 @@ from project.logic.subscriptions import check_requirement
 from project.models.db.stage import Stage, StageActivateBody, StageUpdateBody
 from project.models.db.user import UserPublic
 from project.models.db.util import StageWithStageItems
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import user_authenticated_for_tournament
 from project.routes.models import (
     StageItemInputOptionsResponse,
     StageRankingResponse,
@@ -36,7 +36,7 @@ router = APIRouter()
 @router.get("/tournaments/{tournament_id}/stages", response_model=StagesWithStageItemsResponse)
 async def get_stages(
     tournament_id: TournamentId,
-    user: UserPublic = Depends(firebase_user_authenticated),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
     no_draft_rounds: bool = False,
 ) -> StagesWithStageItemsResponse:
     if no_draft_rounds is False and user is None:
@@ -45,7 +45,9 @@ async def get_stages(
             detail="Can't view draft rounds when not authorized",
         )
 
-    stages_ = await get_full_tournament_details(tournament_id, no_draft_rounds=no_draft_rounds)
+    # the public (polled) view can come from the replica, the draft view follows edits closely
+    with replica_reads(enabled=no_draft_rounds):
+        stages_ = await get_full_tournament_details(tournament_id, no_draft_rounds=no_draft_rounds)
     return StagesWithStageItemsResponse(data=stages_)
 
 
@@ -53,7 +55,7 @@ async def get_stages(
 async def delete_stage(
     tournament_id: TournamentId,
     stage_id: StageId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
     stage: StageWithStageItems = Depends(stage_dependency),
 ) -> SuccessResponse:
     if len(stage.stage_items) > 0:
@@ -76,7 +78,7 @@ async def delete_stage(
 @router.post("/tournaments/{tournament_id}/stages", response_model=SuccessResponse)
 async def create_stage(
     tournament_id: TournamentId,
-    user: UserPublic = Depends(firebase_user_authenticated),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     existing_stages = await get_full_tournament_details(tournament_id)
     check_requirement(existing_stages, user, "max_stages")
@@ -90,7 +92,7 @@ async def update_stage(
     tournament_id: TournamentId,
     stage_id: StageId,
     stage_body: StageUpdateBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
     stage: Stage = Depends(stage_dependency),  # pylint: disable=redefined-builtin
 ) -> SuccessResponse:
     values = {"tournament_id": tournament_id, "stage_id": stage_id}
@@ -111,7 +113,7 @@ async def update_stage(
 async def activate_next_stage(
     tournament_id: TournamentId,
     stage_body: StageActivateBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     new_active_stage_id = await get_next_stage_in_tournament(tournament_id, stage_body.direction)
     if new_active_stage_id is None:
@@ -139,7 +141,7 @@ async def activate_next_stage(
 )
 async def get_available_inputs(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> StageItemInputOptionsResponse:
     stages = await get_full_tournament_details(tournament_id)
     teams = await get_teams_with_members(tournament_id)
@@ -149,7 +151,7 @@ async def get_available_inputs(
 @router.get("/tournaments/{tournament_id}/next_stage_rankings")
 async def get_next_stage_rankings(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> StageRankingResponse:
     """
     Get the rankings for the stage items in this stage.
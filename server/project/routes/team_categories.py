@@ -4,7 +4,7 @@ from starlette import status
 
 from project.models.db.team_category import TeamCategoryBody, TeamCategoryInsertable
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import user_authenticated_for_tournament
 from project.routes.models import SingleTeamCategoryResponse, SuccessResponse, TeamCategoriesResponse
 from project.sql.team_categories import (
     sql_count_teams_using_category,
@@ -32,7 +32,7 @@ class _CategoryIdCheck(BaseModel):
 )
 async def list_team_categories(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> TeamCategoriesResponse:
     return TeamCategoriesResponse(data=await sql_list_team_categories(tournament_id))
 
@@ -44,7 +44,7 @@ async def list_team_categories(
 async def create_team_category(
     tournament_id: TournamentId,
     body: TeamCategoryBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SingleTeamCategoryResponse:
     pos = await sql_next_team_category_position(tournament_id)
     row = TeamCategoryInsertable(
@@ -65,7 +65,7 @@ async def update_team_category(
     tournament_id: TournamentId,
     category_id: TeamCategoryId,
     body: TeamCategoryBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SingleTeamCategoryResponse:
     await check_foreign_keys_belong_to_tournament(
         _CategoryIdCheck(category_id=category_id),
@@ -94,7 +94,7 @@ async def update_team_category(
 async def delete_team_category(
     tournament_id: TournamentId,
     category_id: TeamCategoryId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     existing = await sql_get_team_category_by_id(tournament_id, category_id)
     if existing is None:
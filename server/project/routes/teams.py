@@ -3,80 +3,109 @@ from heliclockter import datetime_utc
 from starlette import status
 
 from project.database import database
-from project.logic.subscriptions import check_requirement
+from project.logic.subscriptions import check_count_requirement
+from project.models.db.pagination import Pagination
 from project.models.db.team import (
     FullTeamWithPlayers,
     Team,
     TeamBody,
+    TeamFilter,
     TeamInsertable,
+    TeamsBulkBody,
+    TeamSortBy,
 )
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import user_authenticated_for_tournament
 from project.routes.models import (
     PaginatedTeams,
     SingleTeamResponse,
     SuccessResponse,
+    TeamsBulkResponse,
     TeamsWithPlayersResponse,
 )
-from project.routes.util import team_dependency, team_with_players_dependency
-from project.schema import players_x_teams, teams
+from project.routes.util import (
+    pagination_dependency,
+    team_dependency,
+    team_with_players_dependency,
+)
+from project.schema import teams
 from project.sql.teams import (
     get_latest_team_for_tournament,
     get_team_by_id,
     get_team_count,
+    get_teams_page,
     get_teams_with_members,
+    sql_create_teams,
     sql_delete_team,
+    sql_set_team_members,
 )
 from project.sql.validation import check_foreign_keys_belong_to_tournament
 from project.utils.errors import ForeignKey, check_foreign_key_violation
-from project.utils.id_types import PlayerId, TeamId, TournamentId
+from project.utils.id_types import (
+    ClubId,
+    DivisionId,
+    PlayerId,
+    TeamCategoryId,
+    TeamId,
+    TournamentId,
+)
 from project.utils.types import assert_some
 
 router = APIRouter()
 
+PLAYER_POSITIONS = ("SENPO", "JIHOU", "CHUKEN", "FUKUSHOU", "TAISHO")
+
 
 def _position_to_enum(value: str) -> str | None:
     if not value:
         return None
-    return value.upper()  # "Senpo" -> "SENPO"
+    position = value.upper()  # "Senpo" -> "SENPO"
+    if position not in PLAYER_POSITIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown position: {value}",
+        )
+    return position
 
 
-async def update_team_members(
-    team_id: TeamId,
-    tournament_id: TournamentId,
-    player_ids: set[PlayerId],
-    positions: dict[PlayerId, str] | None = None,
-) -> None:
-    [team] = await get_teams_with_members(tournament_id, team_id=team_id)
+def _team_members(
+    team_id: TeamId, team_body: TeamBody
+) -> list[tuple[TeamId, PlayerId, str | None]]:
+    positions = {PlayerId(int(k)): v for k, v in (team_body.positions or {}).items()}
+    return [
+        (team_id, player_id, _position_to_enum(positions.get(player_id, "")))
+        for player_id in dict.fromkeys(team_body.player_ids)
+    ]
 
-    # Remove old members from the team
-    await database.execute(
-        query=players_x_teams.delete().where(
-            (players_x_teams.c.player_id.not_in(player_ids))  # type: ignore[attr-defined]
-            & (players_x_teams.c.team_id == team_id)
-        ),
-    )
 
-    # Add members with optional position
-    for player_id in player_ids:
-        pos = None
-        if positions and player_id in positions:
-            pos = _position_to_enum(positions[player_id])
-        await database.execute(
-            query=players_x_teams.insert(),
-            values={"team_id": team_id, "player_id": player_id, "position": pos},
-        )
+async def update_team_members(team_id: TeamId, team_body: TeamBody) -> None:
+    await sql_set_team_members({team_id}, _team_members(team_id, team_body))
 
 
 @router.get("/tournaments/{tournament_id}/teams", response_model=TeamsWithPlayersResponse)
 async def get_teams(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    club_id: ClubId | None = None,
+    category_id: TeamCategoryId | None = None,
+    division_id: DivisionId | None = None,
+    search: str | None = None,
+    sort_by: TeamSortBy = TeamSortBy.code,
+    pagination: Pagination = Depends(pagination_dependency),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> TeamsWithPlayersResponse:
+    team_filter = TeamFilter(
+        club_id=club_id,
+        category_id=category_id,
+        division_id=division_id,
+        search=search,
+        sort_by=sort_by,
+    )
+    teams_, count, cursor = await get_teams_page(tournament_id, team_filter, pagination)
     return TeamsWithPlayersResponse(
         data=PaginatedTeams(
-            teams=await get_teams_with_members(tournament_id),
-            count=await get_team_count(tournament_id),
+            teams=teams_,
+            count=count,
+            next_cursor=cursor.encode() if cursor is not None else None,
         )
     )
 
@@ -85,7 +114,7 @@ async def get_teams(
 async def update_team_by_id(
     tournament_id: TournamentId,
     team_body: TeamBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
     team: Team = Depends(team_dependency),
 ) -> SingleTeamResponse:
     await check_foreign_keys_belong_to_tournament(team_body, tournament_id)
@@ -97,16 +126,8 @@ async def update_team_by_id(
         values=team_body.model_dump(exclude={"player_ids", "positions"}),
     )
 
-    player_ids_set = set(team_body.player_ids)
-    if player_ids_set:
-        positions_by_id = (
-            {PlayerId(int(k)): v for k, v in (team_body.positions or {}).items()}
-            if team_body.positions
-            else None
-        )
-        await update_team_members(
-            team.id, tournament_id, player_ids_set, positions=positions_by_id
-        )
+    if team_body.player_ids:
+        await update_team_members(team.id, team_body)
 
     return SingleTeamResponse(
         data=assert_some(await get_team_by_id(team.id, tournament_id))
@@ -116,7 +137,7 @@ async def update_team_by_id(
 @router.delete("/tournaments/{tournament_id}/teams/{team_id}", response_model=SuccessResponse)
 async def delete_team(
     tournament_id: TournamentId,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
     team: FullTeamWithPlayers = Depends(team_with_players_dependency),
 ) -> SuccessResponse:
     with check_foreign_key_violation(
@@ -135,12 +156,11 @@ async def delete_team(
 async def create_team(
     team_to_insert: TeamBody,
     tournament_id: TournamentId,
-    user: UserPublic = Depends(firebase_user_authenticated),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SingleTeamResponse:
     await check_foreign_keys_belong_to_tournament(team_to_insert, tournament_id)
 
-    existing_teams = await get_teams_with_members(tournament_id)
-    check_requirement(existing_teams, user, "max_teams")
+    check_count_requirement(await get_team_count(tournament_id), user, "max_teams")
 
     insertable = TeamInsertable(
         **team_to_insert.model_dump(exclude={"player_ids", "positions"}),
@@ -155,17 +175,37 @@ async def create_team(
             detail="Team was created but could not be read back",
         )
 
-    player_ids_set = set(team_to_insert.player_ids)
-    if player_ids_set:
-        positions_by_id = (
-            {PlayerId(int(k)): v for k, v in (team_to_insert.positions or {}).items()}
-            if team_to_insert.positions
-            else None
-        )
-        await update_team_members(
-            team_result.id, tournament_id, player_ids_set, positions=positions_by_id
-        )
+    if team_to_insert.player_ids:
+        await update_team_members(team_result.id, team_to_insert)
 
     return SingleTeamResponse(
         data=assert_some(await get_team_by_id(team_result.id, tournament_id))
     )
+
+
+@router.post("/tournaments/{tournament_id}/teams/bulk", response_model=TeamsBulkResponse)
+async def create_teams_bulk(
+    body: TeamsBulkBody,
+    tournament_id: TournamentId,
+    user: UserPublic = Depends(user_authenticated_for_tournament),
+) -> TeamsBulkResponse:
+    """Creates all teams, with their members and positions, in a single transaction."""
+    await check_foreign_keys_belong_to_tournament(body, tournament_id)
+
+    check_count_requirement(
+        await get_team_count(tournament_id), user, "max_teams", additions=len(body.teams)
+    )
+
+    async with database.transaction():
+        team_ids = await sql_create_teams(body.teams, tournament_id)
+        members = [
+            member
+            for team_id, team_body in zip(team_ids, body.teams)
+            for member in _team_members(team_id, team_body)
+        ]
+        if members:
+            await sql_set_team_members(set(team_ids), members)
+
+    return TeamsBulkResponse(
+        data=await get_teams_with_members(tournament_id, team_ids=set(team_ids))
+    )
@@ -15,8 +15,9 @@ from project.models.db.tournament import (
     TournamentUpdateBody,
 )
 from project.models.db.user import UserPublic
-from project.routes.auth import firebase_user_authenticated
+from project.routes.auth import firebase_user_authenticated, user_authenticated_for_tournament
 from project.routes.models import SuccessResponse, TournamentResponse, TournamentsResponse
+from project.routes.util import read_only_route_dependency
 from project.schema import tournaments
 from project.sql.rankings import (
     get_all_rankings_in_tournament,
@@ -31,7 +32,6 @@ from project.sql.tournaments import (
     sql_get_tournaments,
     sql_update_tournament,
 )
-from project.sql.users import get_user_access_to_club, get_which_clubs_has_user_access_to
 from project.utils.errors import (
     ForeignKey,
     UniqueIndex,
@@ -49,7 +49,11 @@ unauthorized_exception = HTTPException(
 )
 
 
-@router.get("/tournaments/{tournament_id}", response_model=TournamentResponse)
+@router.get(
+    "/tournaments/{tournament_id}",
+    response_model=TournamentResponse,
+    dependencies=[Depends(read_only_route_dependency)],
+)
 async def get_tournament(
     tournament_id: TournamentId,
     user: UserPublic | None = Depends(firebase_user_authenticated),
@@ -61,7 +65,11 @@ async def get_tournament(
     return TournamentResponse(data=tournament)
 
 
-@router.get("/tournaments", response_model=TournamentsResponse)
+@router.get(
+    "/tournaments",
+    response_model=TournamentsResponse,
+    dependencies=[Depends(read_only_route_dependency)],
+)
 async def get_tournaments(
     user: UserPublic | None = Depends(firebase_user_authenticated),
     endpoint_name: str | None = None,
@@ -92,7 +100,7 @@ async def get_tournaments(
 async def update_tournament_by_id(
     tournament_id: TournamentId,
     tournament_body: TournamentUpdateBody,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> SuccessResponse:
     with check_unique_constraint_violation({UniqueIndex.ix_tournaments_dashboard_endpoint}):
         await sql_update_tournament(tournament_id, tournament_body)
@@ -103,7 +111,7 @@ async def update_tournament_by_id(
 
 @router.delete("/tournaments/{tournament_id}", response_model=SuccessResponse)
 async def delete_tournament(
-    tournament_id: TournamentId, _: UserPublic = Depends(firebase_user_authenticated)
+    tournament_id: TournamentId, _: UserPublic = Depends(user_authenticated_for_tournament)
 ) -> SuccessResponse:
     for ranking in await get_all_rankings_in_tournament(tournament_id):
         await sql_delete_ranking(tournament_id, ranking.id)
@@ -140,7 +148,7 @@ async def create_tournament(
 async def upload_logo(
     tournament_id: TournamentId,
     file: UploadFile | None = None,
-    _: UserPublic = Depends(firebase_user_authenticated),
+    _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> TournamentResponse:
     old_logo_path = await get_tournament_logo_path(tournament_id)
     filename: str | None = None
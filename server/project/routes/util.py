@@ -1,8 +1,11 @@
-from fastapi import HTTPException
+from collections.abc import AsyncIterator
+
+from fastapi import HTTPException, Query
 from starlette import status
 
-from project.database import database
+from project.database import database, replica_reads
 from project.models.db.match import Match
+from project.models.db.pagination import Cursor, Pagination, SortDirection
 from project.models.db.round import Round
 from project.models.db.team import FullTeamWithPlayers, Team
 from project.models.db.util import RoundWithMatches, StageItemWithRounds, StageWithStageItems
@@ -99,3 +102,22 @@ async def team_with_players_dependency(
         )
 
     return teams_with_members[0]
+
+
+def pagination_dependency(
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = None,
+    sort_direction: SortDirection = SortDirection.asc,
+) -> Pagination:
+    try:
+        decoded_cursor = Cursor.decode(cursor) if cursor is not None else None
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return Pagination(limit=limit, cursor=decoded_cursor, sort_direction=sort_direction)
+
+
+async def read_only_route_dependency() -> AsyncIterator[None]:
+    """For routes that never write: their reads may be served by the read replica."""
+    with replica_reads():
+        yield
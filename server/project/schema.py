@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Table, UniqueConstraint, func, Index, text
+from sqlalchemy import DDL, Column, ForeignKey, Integer, String, Table, UniqueConstraint, event, func, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base  # type: ignore[attr-defined]
 from sqlalchemy.sql.sqltypes import BigInteger, Boolean, DateTime, Enum, Float, Text
@@ -7,6 +7,21 @@ Base = declarative_base()
 metadata = Base.metadata
 DateTimeTZ = DateTime(timezone=True)
 
+# Numeric value of a NUMBER player field, used by the player field expression indexes.
+# Missing and non-numeric values map to a very large number, so they sort last and the
+# expression never fails or returns NULL. Keep in sync with migration d0e1f2a3b4c5.
+PLAYER_FIELD_NUMERIC_FUNCTION = r"""
+    CREATE OR REPLACE FUNCTION player_field_numeric(value TEXT) RETURNS NUMERIC
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$
+        SELECT CASE
+            WHEN value ~ '^\s*[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d{1,3})?\s*$' THEN value::numeric
+            ELSE 1e300
+        END
+    $$
+"""
+event.listen(metadata, "before_create", DDL(PLAYER_FIELD_NUMERIC_FUNCTION))
+
 users = Table(
     "users",
     metadata,
@@ -75,9 +90,26 @@ players = Table(
     Column("wins", Integer, nullable=False),
     Column("data", JSONB, nullable=False),
     # code unique per tournament (same code allowed in different tournaments)
-    UniqueConstraint("tournament_id", "code", name="uq_players_tournament_code"),
+    UniqueConstraint(
+        "tournament_id",
+        "code",
+        name="uq_players_tournament_code",
+        deferrable=True,
+        initially="IMMEDIATE",
+    ),
     # optional: GIN index for fast JSON queries
     Index("ix_players_data_gin", "data", postgresql_using="gin"),
+    # player search, see PLAYER_SEARCH_DOCUMENT in project/sql/players.py
+    Index(
+        "ix_players_search",
+        text("to_tsvector('simple', name || ' ' || coalesce(code, ''))"),
+        postgresql_using="gin",
+    ),
+    Index(
+        "ix_players_tournament_code_lower",
+        "tournament_id",
+        text("lower(code) text_pattern_ops"),
+    ),
 )
 
 players_field = Table(
@@ -98,6 +130,8 @@ players_field = Table(
            nullable=False),
     Column("position", Integer, nullable=False),    # to preserve column order
     Column("options", JSONB, nullable=False, server_default=text("'[]'::jsonb")),    # only used for dropdowns
+    # sortable/filterable: maintain an expression index on players.data for this key
+    Column("indexed", Boolean, nullable=False, server_default="f"),
 )
 
 teams_category = Table(
@@ -156,6 +190,9 @@ players_x_teams = Table(
       ),
       nullable=True,
     ),
+    # also serves lookups by team_id
+    UniqueConstraint("team_id", "player_id", name="uq_players_x_teams_team_player"),
+    Index("ix_players_x_teams_player_id", "player_id"),
 )
 
 divisions = Table(
@@ -279,6 +316,7 @@ stage_items = Table(
         ),
         nullable=False,
     ),
+    Index("ix_stage_items_ranking_id", "ranking_id"),
 )
 
 stage_item_inputs = Table(
@@ -303,6 +341,16 @@ stage_item_inputs = Table(
     Column("losses", Integer, nullable=False, server_default="0"),
     UniqueConstraint("stage_item_id", "team_id"),
     UniqueConstraint("stage_item_id", "winner_from_stage_item_id", "winner_position"),
+    Index(
+        "ix_stage_item_inputs_team_id",
+        "team_id",
+        postgresql_where=text("team_id IS NOT NULL"),
+    ),
+    Index(
+        "ix_stage_item_inputs_winner_from_stage_item_id",
+        "winner_from_stage_item_id",
+        postgresql_where=text("winner_from_stage_item_id IS NOT NULL"),
+    ),
 )
 
 rounds = Table(
@@ -313,6 +361,7 @@ rounds = Table(
     Column("created", DateTimeTZ, nullable=False, server_default=func.now()),
     Column("is_draft", Boolean, nullable=False),
     Column("stage_item_id", BigInteger, ForeignKey("stage_items.id"), nullable=False),
+    Index("ix_rounds_stage_item_id_is_draft", "stage_item_id", "is_draft"),
 )
 
 
@@ -347,6 +396,21 @@ matches = Table(
     Column("stage_item_input1_score", Integer, nullable=False),
     Column("stage_item_input2_score", Integer, nullable=False),
     Column("position_in_schedule", Integer, nullable=True),
+    Index("ix_matches_round_id", "round_id"),
+    Index("ix_matches_stage_item_input1_id", "stage_item_input1_id"),
+    Index("ix_matches_stage_item_input2_id", "stage_item_input2_id"),
+    Index("ix_matches_court_id", "court_id"),
+    # only needed to delete matches, the foreign key checks look these up
+    Index(
+        "ix_matches_input1_winner_from_match_id",
+        "stage_item_input1_winner_from_match_id",
+        postgresql_where=text("stage_item_input1_winner_from_match_id IS NOT NULL"),
+    ),
+    Index(
+        "ix_matches_input2_winner_from_match_id",
+        "stage_item_input2_winner_from_match_id",
+        postgresql_where=text("stage_item_input2_winner_from_match_id IS NOT NULL"),
+    ),
 )
 
 courts = Table(
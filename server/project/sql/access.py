@@ -0,0 +1,55 @@
+import time
+from typing import Literal
+
+from project.config import config
+from project.database import database
+from project.utils.cache import TTLCache
+from project.utils.id_types import ClubId, TournamentId, UserId
+
+AccessKey = tuple[UserId, Literal["club", "tournament"], int]
+
+# Whether a user has access to a club or tournament, looked up on every tournament-scoped
+# request. Cleared whenever clubs or tournaments are created or deleted; the TTL bounds how stale
+# other workers' copies can get. Denials expire sooner, the ID may be created by another worker.
+_access: TTLCache[AccessKey, bool] = TTLCache(
+    max_size=10_000, ttl_seconds=config.access_cache_ttl_seconds
+)
+
+
+# Clubs and tournaments are shared by all organizers, like in `get_clubs_for_user_id` and
+# `sql_get_tournaments`, so a user has access to every one that exists.
+async def _club_exists(club_id: ClubId) -> bool:
+    query = "SELECT EXISTS (SELECT 1 FROM clubs WHERE id = :club_id)"
+    return bool(await database.fetch_val(query=query, values={"club_id": club_id}))
+
+
+async def _tournament_exists(tournament_id: TournamentId) -> bool:
+    query = "SELECT EXISTS (SELECT 1 FROM tournaments WHERE id = :tournament_id)"
+    return bool(await database.fetch_val(query=query, values={"tournament_id": tournament_id}))
+
+
+def _cache_access(key: AccessKey, has_access: bool) -> None:
+    expires_at = None if has_access else time.time() + config.access_denied_cache_ttl_seconds
+    _access.set(key, has_access, expires_at)
+
+
+async def get_user_access_to_tournament(tournament_id: TournamentId, user_id: UserId) -> bool:
+    key: AccessKey = (user_id, "tournament", tournament_id)
+    has_access = _access.get(key)
+    if has_access is None:
+        has_access = await _tournament_exists(tournament_id)
+        _cache_access(key, has_access)
+    return has_access
+
+
+async def get_user_access_to_club(club_id: ClubId, user_id: UserId) -> bool:
+    key: AccessKey = (user_id, "club", club_id)
+    has_access = _access.get(key)
+    if has_access is None:
+        has_access = await _club_exists(club_id)
+        _cache_access(key, has_access)
+    return has_access
+
+
+def invalidate_access_cache() -> None:
+    _access.clear()
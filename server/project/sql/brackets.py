@@ -1,15 +1,18 @@
+from collections.abc import AsyncIterator
 from typing import Iterable, List, Optional
 from project.database import database
 from project.models.db.bracket import (
     Bracket,
     BracketWithPlayers,
     BracketWithTeams,
+    DivisionWithBrackets,
     DivisionBracketsCreateBody,
     DivisionTeamBracketsCreateBody,
     BracketWithPlayersCreate,
     BracketWithTeamsCreate,
 )
-from project.utils.id_types import DivisionId, BracketId
+from project.utils.id_types import DivisionId, BracketId, TournamentId
+from project.utils.types import dict_without_none
 
 
 # --- Read: list brackets for a division (no players) ---
@@ -80,6 +83,114 @@ async def sql_list_division_brackets_with_teams(division_id: DivisionId) -> List
     return [BracketWithTeams.model_validate(dict(r._mapping)) for r in rows]
 
 
+# --- Read: all brackets of a tournament (players + teams), grouped per division ---
+# One set-based query instead of one with-players/with-teams request per division.
+def _tournament_brackets_query(division_ids: set[DivisionId] | None) -> str:
+    bracket_division_filter = (
+        "AND b.division_id = any(:division_ids)" if division_ids is not None else ""
+    )
+    division_filter = "AND d.id = any(:division_ids)" if division_ids is not None else ""
+    return f"""
+    WITH bracket_players AS (
+        SELECT
+          pxb.bracket_id,
+          JSONB_AGG(
+            JSONB_BUILD_OBJECT(
+              'player_id', p.id,
+              'bracket_idx', pxb.bracket_idx,
+              'name', p.name,
+              'club', c.name,
+              'code', p.code,
+              'participant_number', p.data->>'participant_number'
+            )
+            ORDER BY pxb.bracket_idx
+          ) AS players
+        FROM players_x_brackets pxb
+        JOIN brackets b ON b.id = pxb.bracket_id
+        JOIN divisions d ON d.id = b.division_id
+        JOIN players p ON p.id = pxb.player_id
+        LEFT JOIN clubs c ON c.id = p.club_id
+        WHERE d.tournament_id = :tournament_id
+        {bracket_division_filter}
+        GROUP BY pxb.bracket_id
+    ), bracket_teams AS (
+        SELECT
+          txb.bracket_id,
+          JSONB_AGG(
+            JSONB_BUILD_OBJECT(
+              'team_id', t.id,
+              'bracket_idx', txb.bracket_idx,
+              'name', t.code
+            )
+            ORDER BY txb.bracket_idx
+          ) AS teams
+        FROM teams_x_brackets txb
+        JOIN brackets b ON b.id = txb.bracket_id
+        JOIN divisions d ON d.id = b.division_id
+        JOIN teams t ON t.id = txb.team_id
+        WHERE d.tournament_id = :tournament_id
+        {bracket_division_filter}
+        GROUP BY txb.bracket_id
+    )
+    SELECT
+      d.id AS division_id, d.name, d.prefix, d.division_type,
+      COALESCE(
+        JSONB_AGG(
+          JSONB_BUILD_OBJECT(
+            'id', b.id,
+            'index', b."index",
+            'division_id', b.division_id,
+            'num_players', b.num_players,
+            'title', b.title,
+            'players', COALESCE(bp.players, '[]'::jsonb),
+            'teams', COALESCE(bt.teams, '[]'::jsonb)
+          )
+          ORDER BY b."index", b.id
+        ) FILTER (WHERE b.id IS NOT NULL),
+        '[]'::jsonb
+      ) AS brackets
+    FROM divisions d
+    LEFT JOIN brackets b ON b.division_id = d.id
+    LEFT JOIN bracket_players bp ON bp.bracket_id = b.id
+    LEFT JOIN bracket_teams bt ON bt.bracket_id = b.id
+    WHERE d.tournament_id = :tournament_id
+    {division_filter}
+    GROUP BY d.id
+    ORDER BY d.created DESC, d.id DESC
+"""
+
+
+async def sql_list_tournament_brackets(
+    tournament_id: TournamentId, division_ids: set[DivisionId] | None = None
+) -> List[DivisionWithBrackets]:
+    rows = await database.fetch_all(
+        _tournament_brackets_query(division_ids),
+        dict_without_none(
+            {
+                "tournament_id": tournament_id,
+                "division_ids": list(division_ids) if division_ids is not None else None,
+            }
+        ),
+    )
+    return [DivisionWithBrackets.model_validate(dict(r._mapping)) for r in rows]
+
+
+async def sql_iterate_tournament_brackets(
+    tournament_id: TournamentId, division_ids: set[DivisionId] | None = None
+) -> AsyncIterator[DivisionWithBrackets]:
+    """Same as sql_list_tournament_brackets, but yields divisions one by one from a cursor."""
+    async for row in database.iterate(
+        _tournament_brackets_query(division_ids),
+        dict_without_none(
+            {
+                "tournament_id": tournament_id,
+                "division_ids": list(division_ids) if division_ids is not None else None,
+            }
+        ),
+    ):
+        yield DivisionWithBrackets.model_validate(dict(row))
+
+
 # --- Delete all brackets (and their players/teams) for a division (used when replace=true) ---
 async def sql_delete_division_brackets(division_id: DivisionId) -> None:
     # players_x_brackets and teams_x_brackets depend on brackets; delete children via join for speed
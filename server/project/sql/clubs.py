@@ -1,5 +1,6 @@
 from project.database import database
 from project.models.db.club import Club, ClubCreateBody, ClubUpdateBody
+from project.sql.access import invalidate_access_cache
 from project.utils.id_types import ClubId, UserId
 from project.utils.types import assert_some
 
@@ -35,6 +36,7 @@ async def create_club(club: ClubCreateBody, creator_id: UserId) -> Club:
 
         club_created = Club.model_validate(dict(result._mapping))
 
+    invalidate_access_cache()
     return club_created
 
 
@@ -62,6 +64,7 @@ async def sql_delete_club(club_id: ClubId) -> None:
         WHERE id = :club_id
         """
     await database.execute(query=query, values={"club_id": club_id})
+    invalidate_access_cache()
 
 
 async def get_clubs_for_user_id(user_id: UserId) -> list[Club]:
@@ -75,6 +78,19 @@ async def get_clubs_for_user_id(user_id: UserId) -> list[Club]:
     return [Club.model_validate(dict(result._mapping)) for result in results]
 
 
+async def get_club_ids_by_name() -> dict[str, ClubId]:
+    """Lookup of lowercased club name and abbreviation to club id."""
+    query = "SELECT id, name, abbreviation FROM clubs ORDER BY id DESC"
+    results = await database.fetch_all(query=query)
+    lookup: dict[str, ClubId] = {}
+    for result in results:
+        lookup[result["abbreviation"].strip().lower()] = ClubId(result["id"])
+    # names take precedence over abbreviations
+    for result in results:
+        lookup[result["name"].strip().lower()] = ClubId(result["id"])
+    return lookup
+
+
 async def todo_get_club_for_user_id(club_id: ClubId, user_id: UserId) -> Club | None:
     query = """
         SELECT clubs.* FROM clubs
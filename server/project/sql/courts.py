@@ -1,4 +1,4 @@
-from project.database import database
+from project.database import database, read_database
 from project.models.db.court import Court, CourtBody
 from project.utils.id_types import CourtId, TournamentId
 
@@ -10,7 +10,7 @@ async def get_all_courts_in_tournament(tournament_id: TournamentId) -> list[Cour
         WHERE courts.tournament_id = :tournament_id
         ORDER BY name
         """
-    result = await database.fetch_all(query=query, values={"tournament_id": tournament_id})
+    result = await read_database().fetch_all(query=query, values={"tournament_id": tournament_id})
     return [Court.model_validate(dict(x._mapping)) for x in result]
 
 
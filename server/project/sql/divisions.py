@@ -5,7 +5,14 @@ from project.models.db.division import (
     DivisionUpdateBody,
 )
 from project.utils.id_types import DivisionId, TeamId, TournamentId
+from project.models.db.pagination import SortDirection
 from project.models.db.player import PlayerInDivision
+from project.models.db.player_fields import FieldInsertable
+from project.sql.player_fields import (
+    decode_player_fields,
+    player_field_expression,
+    player_fields_projection,
+)
 from project.models.db.team import TeamInDivision
 
 async def create_division(body: DivisionCreateBody) -> Division:
@@ -90,23 +97,57 @@ async def get_divisions_for_tournament(
     return [Division.model_validate(dict(r._mapping)) for r in results]
 
 
-async def sql_get_players_for_division(division_id: DivisionId) -> list[PlayerInDivision]:
-    query = """
+async def sql_get_division(division_id: DivisionId) -> Division | None:
+    result = await database.fetch_one(
+        query="SELECT * FROM divisions WHERE id = :division_id", values={"division_id": division_id}
+    )
+    return Division.model_validate(dict(result._mapping)) if result is not None else None
+
+
+async def sql_get_players_for_division(
+    division: Division,
+    fields: list[FieldInsertable] | None = None,
+    sort_field: FieldInsertable | None = None,
+    sort_direction: SortDirection = SortDirection.asc,
+) -> list[PlayerInDivision]:
+    """
+    Players of a division, with the typed values of the requested player `fields`. Sorting by a
+    player field orders on the same expression as the players list, but the players are reached
+    through `players_x_divisions`, so the division's rows are sorted rather than read from the
+    player field index.
+    """
+    fields = fields or []
+    direction = "DESC" if sort_direction is SortDirection.desc else "ASC"
+    order_by = (
+        f"{player_field_expression(sort_field.key, sort_field.type)} {direction}, p.id {direction}"
+        if sort_field is not None
+        else "p.name, p.id"
+    )
+    query = f"""
         SELECT
             p.id,
             p.name,
             c.name AS club,
             p.code,
             (p.data->>'participant_number') AS participant_number,
+            {player_fields_projection(fields)} AS fields,
             COALESCE(px.bias, FALSE) AS bias
         FROM players p
         JOIN clubs c ON c.id = p.club_id
         JOIN players_x_divisions px ON px.player_id = p.id
         WHERE px.division_id = :division_id
-        ORDER BY p.name, p.id
+        AND p.tournament_id = :tournament_id
+        ORDER BY {order_by}
     """
-    rows = await database.fetch_all(query, {"division_id": division_id})
-    return [PlayerInDivision.model_validate(dict(r._mapping)) for r in rows]
+    rows = await database.fetch_all(
+        query, {"division_id": division.id, "tournament_id": division.tournament_id}
+    )
+    return [
+        PlayerInDivision.model_validate(
+            {**dict(r._mapping), "fields": decode_player_fields(r["fields"], fields)}
+        )
+        for r in rows
+    ]
 
 
 async def sql_attach_players_to_division(division_id: DivisionId, player_ids: list[int], bias_player_ids: list[int] | None = None) -> None:
@@ -1,4 +1,3 @@
-from datetime import datetime
 
 from heliclockter import datetime_utc
 
@@ -170,7 +169,7 @@ async def sql_reschedule_match(
             "court_id": court_id,
             "match_id": match_id,
             "position_in_schedule": position_in_schedule,
-            "start_time": datetime.fromisoformat(start_time.isoformat()),
+            "start_time": start_time,
             "duration_minutes": duration_minutes,
             "margin_minutes": margin_minutes,
             "custom_duration_minutes": custom_duration_minutes,
@@ -0,0 +1,59 @@
+from collections.abc import Sequence
+from typing import Any
+
+from project.models.db.pagination import Cursor, Pagination, SortDirection
+from project.utils.types import JsonDict
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def like_pattern(search: str) -> str:
+    """Pattern for a case-insensitive substring match with ILIKE."""
+    return f"%{escape_like(search.strip())}%"
+
+
+def keyset_order(pagination: Pagination, alias: str, sort_key: str | None = None) -> str:
+    direction = "DESC" if pagination.sort_direction is SortDirection.desc else "ASC"
+    return f"ORDER BY {sort_key or f'{alias}.sort_key'} {direction}, {alias}.id {direction}"
+
+
+def keyset_page_clause(
+    pagination: Pagination, alias: str, sort_key: str | None = None, sort_type: str = "TEXT"
+) -> tuple[str, str, JsonDict]:
+    """
+    Keyset pagination over `{alias}.sort_key, {alias}.id`, the query has to select both columns.
+    `sort_key` replaces `{alias}.sort_key` with the expression itself, so the page can be taken
+    straight from an index on it; `sort_type` is the SQL type of that expression.
+    Returns the WHERE fragment, the ORDER BY (and LIMIT) fragment and the values they need.
+    One row more than `limit` is fetched, so `next_cursor` knows whether there is another page.
+    """
+    descending = pagination.sort_direction is SortDirection.desc
+    # cursor values are stored as text, cast them to the type the sort key compares as
+    cursor_value = (
+        ":cursor_value" if sort_type == "TEXT" else f"CAST(CAST(:cursor_value AS TEXT) AS {sort_type})"
+    )
+    cursor_filter = (
+        f"AND ({sort_key or f'{alias}.sort_key'}, {alias}.id) {'<' if descending else '>'} "
+        f"({cursor_value}, :cursor_id)"
+        if pagination.cursor is not None
+        else ""
+    )
+    limit = "LIMIT :limit" if pagination.limit is not None else ""
+    values: JsonDict = {}
+    if pagination.cursor is not None:
+        values |= {"cursor_value": pagination.cursor.value, "cursor_id": pagination.cursor.id}
+    if pagination.limit is not None:
+        values["limit"] = pagination.limit + 1
+
+    return cursor_filter, f"{keyset_order(pagination, alias, sort_key)} {limit}", values
+
+
+def next_cursor(rows: Sequence[Any], pagination: Pagination) -> Cursor | None:
+    """Cursor to the next page, given the rows fetched by a `keyset_page_clause` query."""
+    if pagination.limit is None or len(rows) <= pagination.limit:
+        return None
+
+    last = rows[pagination.limit - 1]
+    return Cursor(value=str(last["sort_key"]), id=last["id"])
@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from databases.core import Connection
+
+from project.config import config
+from project.database import database
+from project.models.db.player_fields import FieldInsertable, PlayerFieldTypes
+from project.utils.id_types import TournamentId
+from project.utils.logging import logger
+
+PLAYER_FIELD_INDEX_PREFIX = "ix_players_by_field_"
+PLAYER_FIELD_INDEX_LOCK = 0x706C6669  # advisory lock id, "plfi"
+PLAYER_FIELD_INDEX_LOCK_RETRY_SECONDS = 1.0
+TRUTHY_VALUES = {"true", "yes", "y", "1", "x"}
+
+
+def quote_literal(value: str) -> str:
+    """
+    SQL string literal for a value that is inlined into a query, e.g. because an expression
+    index only matches literal keys. Colons are escaped so they aren't taken for bind params.
+    """
+    return "'" + value.replace("'", "''").replace(":", "\\:") + "'"
+
+
+def player_field_sql_type(field_type: PlayerFieldTypes) -> str:
+    return "NUMERIC" if field_type is PlayerFieldTypes.NUMBER else "TEXT"
+
+
+def player_field_expression(key: str, field_type: PlayerFieldTypes, alias: str = "p") -> str:
+    """
+    Typed value of a single player field, never NULL: NUMBER fields compare numerically with
+    non-numbers last, other fields compare as text with missing values first. The expression
+    indexes are built on exactly these expressions, so queries that filter or sort on them can
+    use the index.
+    """
+    value = f"{alias + '.' if alias else ''}data ->> {quote_literal(key)}"
+    if field_type is PlayerFieldTypes.NUMBER:
+        return f"player_field_numeric({value})"
+    return f"COALESCE({value}, '')"
+
+
+def player_field_index_name(key: str, field_type: PlayerFieldTypes) -> str:
+    digest = hashlib.md5(key.encode()).hexdigest()[:16]
+    return f"{PLAYER_FIELD_INDEX_PREFIX}{player_field_sql_type(field_type).lower()}_{digest}"
+
+
+def player_fields_projection(fields: list[FieldInsertable], alias: str = "p") -> str:
+    """
+    JSON object with only the given fields of a player, instead of the whole `data` document.
+    Decode it with `decode_player_fields`.
+    """
+    pairs = ", ".join(
+        f"{quote_literal(field.key)}, {alias}.data -> {quote_literal(field.key)}" for field in fields
+    )
+    return f"jsonb_build_object({pairs})"
+
+
+def decode_player_field(value: Any, field_type: PlayerFieldTypes) -> Any:
+    if value is None:
+        return None
+    if field_type is PlayerFieldTypes.NUMBER:
+        try:
+            number = Decimal(str(value).strip())
+        except InvalidOperation:
+            return value
+        if not number.is_finite():
+            return value
+        return int(number) if number == number.to_integral_value() else float(number)
+    if field_type in (PlayerFieldTypes.BOOLEAN, PlayerFieldTypes.CHECKBOX):
+        return value if isinstance(value, bool) else str(value).strip().lower() in TRUTHY_VALUES
+    return value
+
+
+def decode_player_fields(
+    values: dict[str, Any], fields: list[FieldInsertable]
+) -> dict[str, Any]:
+    """Typed values of a `player_fields_projection`, missing fields are left out."""
+    return {
+        field.key: decode_player_field(values[field.key], field.type)
+        for field in fields
+        if values.get(field.key) is not None
+    }
+
+
+async def get_player_fields(tournament_id: TournamentId) -> list[FieldInsertable]:
+    query = """
+        SELECT key, label, include, type, options, position, indexed
+        FROM players_field
+        WHERE tournament_id = :tournament_id
+        ORDER BY position
+    """
+    result = await database.fetch_all(query=query, values={"tournament_id": tournament_id})
+    return [FieldInsertable.model_validate(dict(row._mapping)) for row in result]
+
+
+async def get_player_field_keys(tournament_id: TournamentId) -> set[str]:
+    query = "SELECT key FROM players_field WHERE tournament_id = :tournament_id"
+    result = await database.fetch_all(query=query, values={"tournament_id": tournament_id})
+    return {row["key"] for row in result}
+
+
+async def sync_player_field_indexes() -> None:
+    """
+    Creates the expression indexes for the indexed player fields (of any tournament) and drops
+    the ones that are no longer used. Indexes are per key and type, and include tournament_id
+    and id so keyset pagination can walk them. Indexes are built concurrently, so this can
+    run while players are being written.
+
+    All tournaments share the `players` table, so this is DDL on behalf of every tournament:
+    it's run by admins through the CLI, never by a request, and builds at most
+    `max_player_field_indexes` indexes. An advisory lock keeps concurrent runs apart.
+    """
+    async with database.connection() as connection:
+        # Polls rather than blocking in `pg_advisory_lock`: a waiting statement holds a
+        # snapshot, which CREATE INDEX CONCURRENTLY of the running sync would wait for
+        while not await connection.fetch_val(
+            "SELECT pg_try_advisory_lock(:lock_id)", {"lock_id": PLAYER_FIELD_INDEX_LOCK}
+        ):
+            await asyncio.sleep(PLAYER_FIELD_INDEX_LOCK_RETRY_SECONDS)
+        try:
+            await _sync_player_field_indexes(connection)
+        finally:
+            await connection.execute(
+                "SELECT pg_advisory_unlock(:lock_id)", {"lock_id": PLAYER_FIELD_INDEX_LOCK}
+            )
+
+
+async def _sync_player_field_indexes(connection: Connection) -> None:
+    """The sync itself, on a connection that holds the advisory lock."""
+    # The fields indexed by the most tournaments get the available indexes
+    fields = await connection.fetch_all(
+        """
+        SELECT key, type, count(*) OVER () AS total
+        FROM players_field
+        WHERE indexed IS TRUE
+        GROUP BY key, type
+        ORDER BY count(*) DESC, key, type
+        LIMIT :max_indexes
+        """,
+        {"max_indexes": config.max_player_field_indexes},
+    )
+    if fields and fields[0]["total"] > len(fields):
+        logger.warning(
+            f"Only indexing {len(fields)} of {fields[0]['total']} indexed player fields, "
+            "see `max_player_field_indexes`"
+        )
+
+    desired = {
+        player_field_index_name(row["key"], PlayerFieldTypes(row["type"])): (
+            row["key"],
+            PlayerFieldTypes(row["type"]),
+        )
+        for row in fields
+    }
+    # A failed concurrent build leaves an invalid index behind, those are rebuilt
+    indexes = await connection.fetch_all(
+        """
+        SELECT c.relname AS index_name, i.indisvalid AS valid
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = 'players'::regclass
+        AND starts_with(c.relname, :prefix)
+        """,
+        {"prefix": PLAYER_FIELD_INDEX_PREFIX},
+    )
+    existing = {row["index_name"] for row in indexes if row["valid"]}
+    invalid = {row["index_name"] for row in indexes if not row["valid"]}
+
+    for index_name in (existing - desired.keys()) | invalid:
+        logger.info(f"Dropping player field index {index_name}")
+        await connection.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+    for index_name in desired.keys() - existing:
+        key, field_type = desired[index_name]
+        logger.info(f"Creating player field index {index_name} for {key}")
+        await connection.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+            ON players (tournament_id, ({player_field_expression(key, field_type, alias="")}), id)
+            """
+        )
@@ -1,14 +1,32 @@
-import json
+import re
 from decimal import Decimal
 from typing import cast
 
 from heliclockter import datetime_utc
 
 from project.database import database
-from project.models.db.player import Player, PlayerBody, PlayerToInsert
+from project.models.db.pagination import Cursor, Pagination
+from project.models.db.player import (
+    Player,
+    PlayerBody,
+    PlayerCodeConflict,
+    PlayerCodeItem,
+    PlayerFilter,
+    PlayerSearchResult,
+    PlayerSortBy,
+    PlayerToInsert,
+)
 from project.schema import players
+from project.sql.pagination import (
+    escape_like,
+    keyset_order,
+    keyset_page_clause,
+    like_pattern,
+    next_cursor,
+)
+from project.sql.player_fields import player_field_expression, player_field_sql_type
 from project.utils.id_types import PlayerId, TournamentId
-from project.utils.types import dict_without_none
+from project.utils.types import JsonDict, assert_some, dict_without_none
 
 
 async def get_all_players_in_tournament(
@@ -16,7 +34,11 @@ async def get_all_players_in_tournament(
     *,
     not_in_team: bool = False,
 ) -> list[Player]:
-    not_in_team_filter = "AND players.team_id IS NULL" if not_in_team else ""
+    not_in_team_filter = (
+        "AND NOT EXISTS (SELECT 1 FROM players_x_teams pt WHERE pt.player_id = p.id)"
+        if not_in_team
+        else ""
+    )
     query = f"""
         SELECT
           p.id,
@@ -45,7 +67,7 @@ async def get_all_players_in_tournament(
     )
 
     return [
-        Player.model_validate({**dict(row), "data": json.loads(row["data"])})
+        Player.model_validate(dict(row))
         for row in result
     ]
 
@@ -72,24 +94,116 @@ async def get_player_by_id(player_id: PlayerId, tournament_id: TournamentId) ->
     )
     if result is None:
         return None
-    row = dict(result)
-    row["data"] = json.loads(row["data"])
-    return Player.model_validate(row)
+    return Player.model_validate(dict(result))
 
 
-async def get_player_count(
-    tournament_id: TournamentId,
-    *,
-    not_in_team: bool = False,
-) -> int:
-    not_in_team_filter = "AND players.team_id IS NULL" if not_in_team else ""
-    query = f"""
-        SELECT count(*)
-        FROM players
-        WHERE players.tournament_id = :tournament_id
+PLAYER_SORT_KEYS = {
+    PlayerSortBy.player_name: "p.name",
+    PlayerSortBy.code: "COALESCE(p.code, '')",
+    PlayerSortBy.club: "c.name",
+}
+
+
+def player_sort_key(filter_: PlayerFilter) -> str:
+    if filter_.sort_by is PlayerSortBy.field:
+        return player_field_expression(assert_some(filter_.sort_field), filter_.sort_field_type)
+    return PLAYER_SORT_KEYS[filter_.sort_by]
+
+
+async def get_players_page(
+    tournament_id: TournamentId, filter_: PlayerFilter, pagination: Pagination
+) -> tuple[list[Player], int, Cursor | None]:
+    """
+    One page of players with the total number of players matching the filter, both from a
+    single query. The page ends up empty (but the total is still returned) past the last row.
+
+    The page is selected on `players` directly rather than from a shared CTE, so that sorting by
+    an indexed player field walks its `(tournament_id, expression, id)` index instead of sorting
+    all players of the tournament.
+    """
+    club_filter = "AND p.club_id = :club_id" if filter_.club_id is not None else ""
+    division_filter = (
+        """
+        AND EXISTS (
+            SELECT 1 FROM players_x_divisions pd
+            WHERE pd.player_id = p.id AND pd.division_id = :division_id
+        )
+        """
+        if filter_.division_id is not None
+        else ""
+    )
+    not_in_team_filter = (
+        "AND NOT EXISTS (SELECT 1 FROM players_x_teams pt WHERE pt.player_id = p.id)"
+        if filter_.not_in_team
+        else ""
+    )
+    search_filter = (
+        "AND (p.name ILIKE :search OR p.code ILIKE :search OR c.name ILIKE :search)"
+        if filter_.search
+        else ""
+    )
+    filters = f"""
+        WHERE p.tournament_id = :tournament_id
+        {club_filter}
+        {division_filter}
         {not_in_team_filter}
+        {search_filter}
+    """
+    sort_key = player_sort_key(filter_)
+    sort_type = (
+        player_field_sql_type(filter_.sort_field_type)
+        if filter_.sort_by is PlayerSortBy.field
+        else "TEXT"
+    )
+    cursor_filter, order_by, page_values = keyset_page_clause(
+        pagination, "p", sort_key=sort_key, sort_type=sort_type
+    )
+    query = f"""
+        SELECT total.count AS total_count, page.*
+        FROM (
+            SELECT count(*)
+            FROM players p
+            JOIN clubs c ON c.id = p.club_id
+            {filters}
+        ) total
+        LEFT JOIN (
+            SELECT
+              p.id,
+              p.tournament_id,
+              p.name,
+              p.club_id,
+              c.name AS club,
+              p.code,
+              p.created,
+              p.wins,
+              p.data,
+              {sort_key} AS sort_key
+            FROM players p
+            JOIN clubs c ON c.id = p.club_id
+            {filters}
+            {cursor_filter}
+            {order_by}
+        ) page ON TRUE
+        {keyset_order(pagination, "page")}
         """
-    return cast(int, await database.fetch_val(query=query, values={"tournament_id": tournament_id}))
+    values = dict_without_none(
+        {
+            "tournament_id": tournament_id,
+            "club_id": filter_.club_id,
+            "division_id": filter_.division_id,
+            "search": like_pattern(filter_.search) if filter_.search else None,
+            **page_values,
+        }
+    )
+    result = await database.fetch_all(query=query, values=values)
+    rows = [row for row in result if row["id"] is not None]
+    total = int(result[0]["total_count"]) if result else 0
+
+    players_ = [
+        Player.model_validate(dict(row))
+        for row in rows[: pagination.limit]
+    ]
+    return players_, total, next_cursor(rows, pagination)
 
 
 async def sql_delete_player(tournament_id: TournamentId, player_id: PlayerId) -> None:
@@ -112,7 +226,7 @@ async def insert_player(player_body: PlayerBody, tournament_id: TournamentId) ->
     )
     query = """
         INSERT INTO players (tournament_id, name, club_id, code, created, wins, data)
-        VALUES (:tournament_id, :name, :club_id, NULL, :created, :wins, CAST(:data_json AS jsonb))
+        VALUES (:tournament_id, :name, :club_id, NULL, :created, :wins, CAST(:data AS jsonb))
         RETURNING id
     """
     row = await database.fetch_one(
@@ -123,9 +237,162 @@ async def insert_player(player_body: PlayerBody, tournament_id: TournamentId) ->
             "club_id": to_insert.club_id,
             "created": to_insert.created,
             "wins": to_insert.wins,
-            "data_json": json.dumps(to_insert.data),
+            "data": to_insert.data,
         },
     )
     if row is None:
         raise ValueError("Could not insert player")
     return cast(PlayerId, row["id"])
+
+
+async def sql_bulk_insert_players(players_: list[PlayerBody], tournament_id: TournamentId) -> int:
+    """Inserts all players with a single multi-row INSERT and returns the number of rows created."""
+    if not players_:
+        return 0
+
+    query = """
+        WITH inserted AS (
+            INSERT INTO players (tournament_id, name, club_id, code, created, wins, data)
+            SELECT :tournament_id, t.name, t.club_id, NULL, :created, 0, t.data
+            FROM UNNEST(
+                CAST(:names AS TEXT[]),
+                CAST(:club_ids AS BIGINT[]),
+                CAST(:datas AS JSONB[])
+            ) AS t(name, club_id, data)
+            RETURNING 1
+        )
+        SELECT count(*) FROM inserted
+    """
+    return cast(
+        int,
+        await database.fetch_val(
+            query=query,
+            values={
+                "tournament_id": tournament_id,
+                "created": datetime_utc.now(),
+                "names": [player.name for player in players_],
+                "club_ids": [player.club_id for player in players_],
+                "datas": [player.data for player in players_],
+            },
+        ),
+    )
+
+
+async def sql_update_player_codes(
+    codes: list[PlayerCodeItem], tournament_id: TournamentId
+) -> list[PlayerCodeConflict]:
+    """
+    Assigns all codes in one statement. Codes that are used twice within the batch, or that are
+    held by a player outside of the batch, are returned as conflicts; in that case nothing is
+    updated. Players that don't belong to the tournament are left out of the batch entirely, so
+    they are neither updated nor reported as conflicts.
+    """
+    query = """
+        WITH batch AS (
+            SELECT b.player_id, b.code
+            FROM UNNEST(CAST(:player_ids AS BIGINT[]), CAST(:codes AS TEXT[]))
+                AS b(player_id, code)
+            JOIN players p ON p.id = b.player_id AND p.tournament_id = :tournament_id
+        ), conflicts AS (
+            SELECT b.player_id, b.code, other.player_id AS conflicting_player_id
+            FROM batch b
+            JOIN batch other ON other.code = b.code AND other.player_id <> b.player_id
+            UNION ALL
+            SELECT b.player_id, b.code, p.id AS conflicting_player_id
+            FROM batch b
+            JOIN players p ON p.tournament_id = :tournament_id AND p.code = b.code
+            WHERE p.id <> ALL(CAST(:player_ids AS BIGINT[]))
+        ), updated AS (
+            UPDATE players p
+            SET code = b.code
+            FROM batch b
+            WHERE p.id = b.player_id
+            AND NOT EXISTS (SELECT 1 FROM conflicts)
+        )
+        SELECT player_id, code, conflicting_player_id
+        FROM conflicts
+        ORDER BY player_id, conflicting_player_id
+        """
+    result = await database.fetch_all(
+        query=query,
+        values={
+            "tournament_id": tournament_id,
+            "player_ids": [item.player_id for item in codes],
+            "codes": [item.code for item in codes],
+        },
+    )
+    return [PlayerCodeConflict.model_validate(dict(row._mapping)) for row in result]
+
+
+# Must match the expression of ix_players_search, otherwise the index isn't used
+PLAYER_SEARCH_DOCUMENT = "to_tsvector('simple', p.name || ' ' || coalesce(p.code, ''))"
+
+
+def search_terms_to_tsquery(search: str) -> str | None:
+    """Prefix query matching all words, e.g. "jo smi" -> "jo:* & smi:*"."""
+    words = re.findall(r"\w+", search.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+async def sql_search_players(
+    tournament_id: TournamentId,
+    search: str | None,
+    fields: JsonDict | None,
+    limit: int,
+) -> list[PlayerSearchResult]:
+    """
+    Players whose name or code contain words starting with the search terms, or whose code
+    starts with the search string, and whose data contains `fields`. Exact code matches rank
+    first, then players by full-text rank.
+    """
+    code = search.strip().lower() if search else ""
+    tsquery = search_terms_to_tsquery(code)
+
+    search_filter, rank = "", "0"
+    if code:
+        text_match = (
+            f"{PLAYER_SEARCH_DOCUMENT} @@ to_tsquery('simple', :tsquery) OR "
+            if tsquery is not None
+            else ""
+        )
+        search_filter = f"AND ({text_match}lower(p.code) LIKE :code_prefix)"
+        rank = "CASE WHEN lower(p.code) = :code THEN 1 ELSE 0 END"
+        if tsquery is not None:
+            rank += f" + ts_rank({PLAYER_SEARCH_DOCUMENT}, to_tsquery('simple', :tsquery))"
+
+    fields_filter = "AND p.data @> CAST(:fields AS jsonb)" if fields else ""
+    query = f"""
+        SELECT
+          p.id,
+          p.tournament_id,
+          p.name,
+          p.club_id,
+          c.name AS club,
+          p.code,
+          p.created,
+          p.wins,
+          p.data,
+          {rank} AS rank
+        FROM players p
+        JOIN clubs c ON c.id = p.club_id
+        WHERE p.tournament_id = :tournament_id
+        {search_filter}
+        {fields_filter}
+        ORDER BY rank DESC, p.name, p.id
+        LIMIT :limit
+        """
+    values = dict_without_none(
+        {
+            "tournament_id": tournament_id,
+            "tsquery": tsquery,
+            "code": code or None,
+            "code_prefix": f"{escape_like(code)}%" if code else None,
+            "fields": fields or None,
+            "limit": limit,
+        }
+    )
+    result = await database.fetch_all(query=query, values=values)
+    return [
+        PlayerSearchResult.model_validate(dict(row))
+        for row in result
+    ]
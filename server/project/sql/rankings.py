@@ -1,4 +1,4 @@
-from project.database import database
+from project.database import database, read_database
 from project.models.db.ranking import Ranking, RankingBody, RankingCreateBody
 from project.utils.id_types import RankingId, StageItemId, TournamentId
 
@@ -10,7 +10,7 @@ async def get_all_rankings_in_tournament(tournament_id: TournamentId) -> list[Ra
         WHERE rankings.tournament_id = :tournament_id
         ORDER BY position
         """
-    result = await database.fetch_all(query=query, values={"tournament_id": tournament_id})
+    result = await read_database().fetch_all(query=query, values={"tournament_id": tournament_id})
     return [Ranking.model_validate(dict(x._mapping)) for x in result]
 
 
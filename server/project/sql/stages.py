@@ -1,6 +1,6 @@
 from typing import Literal, cast
 
-from project.database import database
+from project.database import database, read_database
 from project.models.db.stage import Stage
 from project.models.db.util import StageWithStageItems
 from project.utils.id_types import RoundId, StageId, StageItemId, TournamentId
@@ -86,11 +86,11 @@ async def get_full_tournament_details(
             GROUP BY stage_items.id
             ORDER BY stage_items.id
         ), stage_items_with_rounds_and_inputs AS (
-            SELECT stage_items.*, stage_items_with_inputs.inputs, stage_items_with_rounds.rounds
-            FROM stage_items
-            JOIN stage_items_with_rounds ON stage_items_with_rounds.id = stage_items.id
-            LEFT JOIN stage_items_with_inputs ON stage_items_with_inputs.id = stage_items.id
-            ORDER BY stage_items.name
+            SELECT stage_items_with_rounds.*, stage_items_with_inputs.inputs
+            FROM stage_items_with_rounds
+            LEFT JOIN stage_items_with_inputs
+                ON stage_items_with_inputs.id = stage_items_with_rounds.id
+            ORDER BY stage_items_with_rounds.name
         )
         SELECT stages.*, to_json(array_agg(r.*)) AS stage_items
         FROM stages
@@ -110,7 +110,7 @@ async def get_full_tournament_details(
             "stage_item_ids": stage_item_ids,
         }
     )
-    result = await database.fetch_all(query=query, values=values)
+    result = await read_database().fetch_all(query=query, values=values)
     return [StageWithStageItems.model_validate(dict(x._mapping)) for x in result]
 
 
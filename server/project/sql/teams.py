@@ -2,8 +2,16 @@ from typing import cast
 
 from project.database import database
 from project.logic.ranking.statistics import TeamStatistics
-from project.models.db.team import FullTeamWithPlayers, Team
-from project.utils.id_types import StageItemInputId, TeamId, TournamentId
+from project.models.db.pagination import Cursor, Pagination
+from project.models.db.team import (
+    FullTeamWithPlayers,
+    Team,
+    TeamBody,
+    TeamFilter,
+    TeamSortBy,
+)
+from project.sql.pagination import keyset_page_clause, like_pattern, next_cursor
+from project.utils.id_types import PlayerId, StageItemInputId, TeamId, TournamentId
 from project.utils.types import dict_without_none
 
 
@@ -74,9 +82,11 @@ async def get_teams_with_members(
     *,
     only_active_teams: bool = False,
     team_id: TeamId | None = None,
+    team_ids: set[TeamId] | None = None,
 ) -> list[FullTeamWithPlayers]:
     active_team_filter = "AND teams.active IS TRUE" if only_active_teams else ""
     team_id_filter = "AND teams.id = :team_id" if team_id is not None else ""
+    team_ids_filter = "AND teams.id = any(:team_ids)" if team_ids is not None else ""
     query = f"""
         SELECT
             teams.id,
@@ -100,18 +110,121 @@ async def get_teams_with_members(
         WHERE teams.tournament_id = :tournament_id
         {active_team_filter}
         {team_id_filter}
+        {team_ids_filter}
         GROUP BY teams.id
         """
     values = dict_without_none(
         {
             "tournament_id": tournament_id,
             "team_id": team_id,
+            "team_ids": list(team_ids) if team_ids is not None else None,
         }
     )
     result = await database.fetch_all(query=query, values=values)
     return [FullTeamWithPlayers.model_validate(x) for x in result]
 
 
+TEAM_SORT_KEYS = {
+    TeamSortBy.code: "t.code",
+    TeamSortBy.club: "COALESCE(c.name, '')",
+    TeamSortBy.category: "COALESCE(tc.name, '')",
+}
+
+
+async def get_teams_page(
+    tournament_id: TournamentId, filter_: TeamFilter, pagination: Pagination
+) -> tuple[list[FullTeamWithPlayers], int, Cursor | None]:
+    """
+    One page of teams with their members and the total number of teams matching the filter,
+    both from a single query. Members are only aggregated for the teams on the page.
+    """
+    club_filter = "AND t.club_id = :club_id" if filter_.club_id is not None else ""
+    category_filter = "AND t.category_id = :category_id" if filter_.category_id is not None else ""
+    division_filter = (
+        """
+        AND EXISTS (
+            SELECT 1 FROM teams_x_divisions td
+            WHERE td.team_id = t.id AND td.division_id = :division_id
+        )
+        """
+        if filter_.division_id is not None
+        else ""
+    )
+    search_filter = (
+        """
+        AND (
+            t.code ILIKE :search
+            OR c.name ILIKE :search
+            OR EXISTS (
+                SELECT 1 FROM players_x_teams pt
+                JOIN players p ON p.id = pt.player_id
+                WHERE pt.team_id = t.id AND (p.name ILIKE :search OR p.code ILIKE :search)
+            )
+        )
+        """
+        if filter_.search
+        else ""
+    )
+    cursor_filter, order_by, page_values = keyset_page_clause(pagination, "page")
+    query = f"""
+        WITH filtered AS (
+            SELECT
+                t.id,
+                t.code,
+                t.club_id,
+                t.category_id,
+                tc.name AS category,
+                tc.color AS category_color,
+                t.created,
+                t.updated,
+                t.tournament_id,
+                t.active,
+                t.wins,
+                c.name AS club,
+                {TEAM_SORT_KEYS[filter_.sort_by]} AS sort_key
+            FROM teams t
+            LEFT JOIN clubs c ON c.id = t.club_id
+            LEFT JOIN teams_category tc ON tc.id = t.category_id
+            WHERE t.tournament_id = :tournament_id
+            {club_filter}
+            {category_filter}
+            {division_filter}
+            {search_filter}
+        )
+        SELECT
+            total.count AS total_count,
+            page.*,
+            COALESCE(
+                (
+                    SELECT to_json(array_agg(p.*))
+                    FROM players_x_teams pt
+                    JOIN players p ON p.id = pt.player_id
+                    WHERE pt.team_id = page.id
+                ),
+                '[]'::json
+            ) AS players
+        FROM (SELECT count(*) FROM filtered) total
+        LEFT JOIN filtered page ON TRUE {cursor_filter}
+        {order_by}
+        """
+    values = dict_without_none(
+        {
+            "tournament_id": tournament_id,
+            "club_id": filter_.club_id,
+            "category_id": filter_.category_id,
+            "division_id": filter_.division_id,
+            "search": like_pattern(filter_.search) if filter_.search else None,
+            **page_values,
+        }
+    )
+    result = await database.fetch_all(query=query, values=values)
+    rows = [row for row in result if row["id"] is not None]
+    total = int(result[0]["total_count"]) if result else 0
+
+    teams_ = [FullTeamWithPlayers.model_validate(dict(row)) for row in rows[: pagination.limit]]
+    return teams_, total, next_cursor(rows, pagination)
+
+
 async def get_team_count(
     tournament_id: TournamentId,
     *,
@@ -128,6 +241,85 @@ async def get_team_count(
     return cast(int, await database.fetch_val(query=query, values=values))
 
 
+async def sql_create_teams(
+    teams_: list[TeamBody], tournament_id: TournamentId
+) -> list[TeamId]:
+    """
+    Inserts all teams with one statement. Ids are drawn from the sequence up front, so they can
+    be returned in the same order as `teams_`.
+    """
+    query = """
+        WITH input AS (
+            SELECT nextval(pg_get_serial_sequence('teams', 'id')) AS id, t.*
+            FROM UNNEST(
+                CAST(:codes AS TEXT[]),
+                CAST(:club_ids AS BIGINT[]),
+                CAST(:category_ids AS BIGINT[]),
+                CAST(:actives AS BOOLEAN[])
+            ) WITH ORDINALITY AS t(code, club_id, category_id, active, ord)
+        ), inserted AS (
+            INSERT INTO teams (id, code, club_id, category_id, active, tournament_id)
+            SELECT id, code, club_id, category_id, active, CAST(:tournament_id AS BIGINT)
+            FROM input
+            RETURNING id
+        )
+        SELECT input.id
+        FROM input
+        JOIN inserted ON inserted.id = input.id
+        ORDER BY input.ord
+        """
+    result = await database.fetch_all(
+        query=query,
+        values={
+            "tournament_id": tournament_id,
+            "codes": [team.code for team in teams_],
+            "club_ids": [team.club_id for team in teams_],
+            "category_ids": [team.category_id for team in teams_],
+            "actives": [team.active for team in teams_],
+        },
+    )
+    return [TeamId(row.id) for row in result]  # type: ignore[attr-defined]
+
+
+async def sql_set_team_members(
+    team_ids: set[TeamId],
+    members: list[tuple[TeamId, PlayerId, str | None]],
+) -> None:
+    """
+    Makes `members` (team, player, position) the exact membership of the teams in `team_ids`:
+    memberships that are not listed are removed, the others are upserted in one statement.
+    """
+    query = """
+        WITH members AS (
+            SELECT *
+            FROM UNNEST(
+                CAST(:member_team_ids AS BIGINT[]),
+                CAST(:player_ids AS BIGINT[]),
+                CAST(:positions AS player_position_type[])
+            ) AS m(team_id, player_id, position)
+        ), deleted AS (
+            DELETE FROM players_x_teams pt
+            WHERE pt.team_id = any(:team_ids)
+            AND NOT EXISTS (
+                SELECT 1 FROM members m
+                WHERE m.team_id = pt.team_id AND m.player_id = pt.player_id
+            )
+        )
+        INSERT INTO players_x_teams (team_id, player_id, position)
+        SELECT team_id, player_id, position FROM members
+        ON CONFLICT (team_id, player_id) DO UPDATE SET position = EXCLUDED.position
+        """
+    await database.execute(
+        query=query,
+        values={
+            "team_ids": list(team_ids),
+            "member_team_ids": [team_id for team_id, _, _ in members],
+            "player_ids": [player_id for _, player_id, _ in members],
+            "positions": [position for _, _, position in members],
+        },
+    )
+
+
 async def update_team_stats(
     tournament_id: TournamentId,
     stage_item_input_id: StageItemInputId,
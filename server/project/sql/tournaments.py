@@ -2,8 +2,9 @@ from typing import Any
 
 from fastapi import HTTPException
 
-from project.database import database
+from project.database import database, read_database
 from project.models.db.tournament import Tournament, TournamentBody, TournamentUpdateBody
+from project.sql.access import invalidate_access_cache
 from project.utils.id_types import TournamentId
 
 
@@ -13,7 +14,7 @@ async def sql_get_tournament(tournament_id: TournamentId) -> Tournament:
         FROM tournaments
         WHERE id = :tournament_id
         """
-    result = await database.fetch_one(query=query, values={"tournament_id": tournament_id})
+    result = await read_database().fetch_one(query=query, values={"tournament_id": tournament_id})
     if result is None:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
@@ -27,7 +28,7 @@ async def sql_get_tournament_by_endpoint_name(endpoint_name: str) -> Tournament
         WHERE dashboard_endpoint = :endpoint_name
         AND dashboard_public IS TRUE
         """
-    result = await database.fetch_one(query=query, values={"endpoint_name": endpoint_name})
+    result = await read_database().fetch_one(query=query, values={"endpoint_name": endpoint_name})
     return Tournament.model_validate(result) if result is not None else None
 
 
@@ -42,7 +43,7 @@ async def sql_get_tournaments(endpoint_name: str | None = None) -> list[Tourname
         query += " WHERE dashboard_endpoint = :endpoint_name"
         params["endpoint_name"] = endpoint_name
 
-    result = await database.fetch_all(query=query, values=params)
+    result = await read_database().fetch_all(query=query, values=params)
     return [Tournament.model_validate(x) for x in result]
 
 
@@ -52,6 +53,7 @@ async def sql_delete_tournament(tournament_id: TournamentId) -> None:
         WHERE id = :tournament_id
         """
     await database.fetch_one(query=query, values={"tournament_id": tournament_id})
+    invalidate_access_cache()
 
 
 async def sql_update_tournament(
@@ -116,4 +118,5 @@ async def sql_create_tournament(tournament: TournamentBody) -> TournamentId:
         "auto_assign_courts": tournament.auto_assign_courts,
     }
     new_id = await database.fetch_val(query=query, values=values)
+    invalidate_access_cache()
     return TournamentId(new_id)
@@ -1,3 +1,4 @@
+from project.config import config
 from project.database import database
 from project.logic.tournaments import sql_delete_tournament_completely
 from project.models.db.account import UserAccountType
@@ -5,34 +6,15 @@ from project.models.db.user import User, UserInDB, UserInsertable, UserPublic, U
 from project.schema import users
 from project.sql.clubs import get_clubs_for_user_id, sql_delete_club
 from project.sql.tournaments import sql_get_tournaments
+from project.utils.cache import TTLCache
 from project.utils.db import fetch_one_parsed
-from project.utils.id_types import ClubId, TournamentId, UserId
+from project.utils.id_types import UserId
 from project.utils.types import assert_some
 
-
-async def get_user_access_to_tournament(tournament_id: TournamentId, user_id: UserId) -> bool:
-    query = """
-        SELECT DISTINCT t.id
-        FROM users_x_clubs
-        JOIN tournaments t ON t.club_id = users_x_clubs.club_id
-        WHERE user_id = :user_id
-        """
-    result = await database.fetch_all(query=query, values={"user_id": user_id})
-    return tournament_id in {tournament.id for tournament in result}  # type: ignore[attr-defined]
-
-
-async def get_which_clubs_has_user_access_to(user_id: UserId) -> set[ClubId]:
-    query = """
-        SELECT club_id
-        FROM users_x_clubs
-        WHERE user_id = :user_id
-        """
-    result = await database.fetch_all(query=query, values={"user_id": user_id})
-    return {club.club_id for club in result}  # type: ignore[attr-defined]
-
-
-async def get_user_access_to_club(club_id: ClubId, user_id: UserId) -> bool:
-    return club_id in await get_which_clubs_has_user_access_to(user_id)
+# Users by email, looked up on every authenticated request
+_users_by_email: TTLCache[str, UserInDB] = TTLCache(
+    max_size=1_000, ttl_seconds=config.auth_user_cache_ttl_seconds
+)
 
 
 async def update_user(user_id: UserId, user: UserToUpdate) -> None:
@@ -44,6 +26,7 @@ async def update_user(user_id: UserId, user: UserToUpdate) -> None:
     await database.execute(
         query=query, values={"user_id": user_id, "name": user.name, "email": user.email}
     )
+    invalidate_cached_users()
 
 
 async def update_user_account_type(user_id: UserId, account_type: UserAccountType) -> None:
@@ -55,6 +38,7 @@ async def update_user_account_type(user_id: UserId, account_type: UserAccountTyp
     await database.execute(
         query=query, values={"user_id": user_id, "account_type": account_type.value}
     )
+    invalidate_cached_users()
 
 
 async def update_user_password(user_id: UserId, password_hash: str) -> None:
@@ -64,6 +48,7 @@ async def update_user_password(user_id: UserId, password_hash: str) -> None:
         WHERE id = :user_id
         """
     await database.execute(query=query, values={"user_id": user_id, "password_hash": password_hash})
+    invalidate_cached_users()
 
 
 async def get_user_by_id(user_id: UserId) -> UserPublic | None:
@@ -112,6 +97,7 @@ async def delete_user(user_id: UserId) -> None:
         WHERE id = :user_id
         """
     await database.fetch_one(query=query, values={"user_id": user_id})
+    invalidate_cached_users()
 
 
 async def check_whether_email_is_in_use(email: str) -> bool:
@@ -128,6 +114,20 @@ async def get_user(email: str) -> UserInDB | None:
     return await fetch_one_parsed(database, UserInDB, users.select().where(users.c.email == email))
 
 
+async def get_user_cached(email: str) -> UserInDB | None:
+    """Like `get_user`, but served from a short-lived cache. Unknown emails aren't cached."""
+    user = _users_by_email.get(email)
+    if user is None:
+        user = await get_user(email)
+        if user is not None:
+            _users_by_email.set(email, user)
+    return user
+
+
+def invalidate_cached_users() -> None:
+    _users_by_email.clear()
+
+
 async def delete_user_and_owned_clubs(user_id: UserId) -> None:
     for club in await get_clubs_for_user_id(user_id):
         for tournament in await sql_get_tournaments((club.id,), None):
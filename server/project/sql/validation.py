@@ -1,16 +1,11 @@
-from collections.abc import Awaitable, Callable
+from collections import defaultdict
 from typing import Any, NoReturn, get_args
 
 from fastapi import HTTPException
 from pydantic import BaseModel
 from starlette import status
 
-from project.models.db.util import StageWithStageItems
-from project.sql.courts import get_all_courts_in_tournament
-from project.sql.players import get_all_players_in_tournament, get_player_by_id
-from project.sql.stages import get_full_tournament_details
 from project.database import database
-from project.sql.teams import get_team_by_id
 from project.utils.id_types import (
     CourtId,
     MatchId,
@@ -24,100 +19,102 @@ from project.utils.id_types import (
     TournamentId,
 )
 
-CheckCallableT = Callable[[Any, list[StageWithStageItems], TournamentId], Awaitable[bool]]
+# For every ID type: a condition on `ids.id` that holds when that row belongs to the tournament
+OWNERSHIP_CHECKS: dict[type[Any], str] = {
+    StageId: "SELECT 1 FROM stages s WHERE s.id = ids.id AND s.tournament_id = :tournament_id",
+    StageItemId: """
+        SELECT 1 FROM stage_items si
+        JOIN stages s ON s.id = si.stage_id
+        WHERE si.id = ids.id AND s.tournament_id = :tournament_id
+    """,
+    StageItemInputId: """
+        SELECT 1 FROM stage_item_inputs sii
+        WHERE sii.id = ids.id AND sii.tournament_id = :tournament_id
+    """,
+    RoundId: """
+        SELECT 1 FROM rounds r
+        JOIN stage_items si ON si.id = r.stage_item_id
+        JOIN stages s ON s.id = si.stage_id
+        WHERE r.id = ids.id AND s.tournament_id = :tournament_id
+    """,
+    MatchId: """
+        SELECT 1 FROM matches m
+        JOIN rounds r ON r.id = m.round_id
+        JOIN stage_items si ON si.id = r.stage_item_id
+        JOIN stages s ON s.id = si.stage_id
+        WHERE m.id = ids.id AND s.tournament_id = :tournament_id
+    """,
+    TeamId: "SELECT 1 FROM teams t WHERE t.id = ids.id AND t.tournament_id = :tournament_id",
+    TeamCategoryId: """
+        SELECT 1 FROM teams_category tc
+        WHERE tc.id = ids.id AND tc.tournament_id = :tournament_id
+    """,
+    PlayerId: "SELECT 1 FROM players p WHERE p.id = ids.id AND p.tournament_id = :tournament_id",
+    CourtId: "SELECT 1 FROM courts c WHERE c.id = ids.id AND c.tournament_id = :tournament_id",
+}
 
 
-async def check_stage_belongs_to_tournament(
-    stage_id: StageId, stages: list[StageWithStageItems], _: TournamentId
-) -> bool:
-    return any(stage.id == stage_id for stage in stages)
-
-
-async def check_team_belongs_to_tournament(
-    team_id: TeamId, _: list[StageWithStageItems], tournament_id: TournamentId
-) -> bool:
-    return await get_team_by_id(team_id, tournament_id) is not None
-
-
-async def check_stage_item_belongs_to_tournament(
-    stage_item_id: StageItemId, stages: list[StageWithStageItems], _: TournamentId
-) -> bool:
-    return any(
-        stage_item.id == stage_item_id for stage in stages for stage_item in stage.stage_items
-    )
-
-
-async def check_stage_item_input_belongs_to_tournament(
-    stage_item_input_id: StageItemInputId, stages: list[StageWithStageItems], _: TournamentId
-) -> bool:
-    return any(
-        stage_item_input.id == stage_item_input_id
-        for stage in stages
-        for stage_item in stage.stage_items
-        for stage_item_input in stage_item.inputs
-    )
-
-
-async def check_round_belongs_to_tournament(
-    round_id: RoundId, stages: list[StageWithStageItems], _: TournamentId
-) -> bool:
-    return any(
-        round_.id == round_id
-        for stage in stages
-        for stage_item in stage.stage_items
-        for round_ in stage_item.rounds
-    )
-
-
-async def check_match_belongs_to_tournament(
-    match_id: MatchId, stages: list[StageWithStageItems], _: TournamentId
-) -> bool:
-    return any(
-        match.id == match_id
-        for stage in stages
-        for stage_item in stage.stage_items
-        for round_ in stage_item.rounds
-        for match in round_.matches
-    )
-
-
-async def check_player_belongs_to_tournament(
-    player_id: PlayerId, _: list[StageWithStageItems], tournament_id: TournamentId
-) -> bool:
-    return await get_player_by_id(player_id, tournament_id) is not None
+def raise_exception(field_type: Any, field_value: Any) -> NoReturn:
+    field_name = field_type.__name__ if field_type is not None else "Unknown type"
+    msg = f"Could not find {field_name.replace('Id', '')}(s) with ID {field_value}"
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
 
 
-async def check_players_belong_to_tournament(
-    player_ids: set[PlayerId], tournament_id: TournamentId
-) -> bool:
-    return player_ids.issubset(
-        player.id for player in await get_all_players_in_tournament(tournament_id)
-    )
+def _annotation_types(annotation: Any) -> set[Any]:
+    """All types an annotation can contain, e.g. `list[PlayerId] | None` gives PlayerId too."""
+    return {annotation}.union(*(_annotation_types(arg) for arg in get_args(annotation)))
 
 
-async def check_court_belongs_to_tournament(
-    court_id: CourtId, _: list[StageWithStageItems], tournament_id: TournamentId
-) -> bool:
-    return any(court_id == court.id for court in await get_all_courts_in_tournament(tournament_id))
+def collect_foreign_keys(
+    some_body: BaseModel, ids_by_type: dict[type[Any], set[int]] | None = None
+) -> dict[type[Any], set[int]]:
+    """
+    Collects the IDs in a body (and nested bodies, also in lists) by their type, for the ID
+    types in `OWNERSHIP_CHECKS`.
+    """
+    ids_by_type = ids_by_type if ids_by_type is not None else defaultdict(set)
 
+    for field_key, field_info in type(some_body).model_fields.items():
+        field_value = getattr(some_body, field_key)
+        if field_value is None:
+            continue
 
-async def check_team_category_belongs_to_tournament(
-    category_id: TeamCategoryId, _: list[StageWithStageItems], tournament_id: TournamentId
-) -> bool:
-    row = await database.fetch_one(
+        values = list(field_value) if isinstance(field_value, list | set) else [field_value]
+        id_types = _annotation_types(field_info.annotation) & OWNERSHIP_CHECKS.keys()
+        for value in values:
+            if isinstance(value, BaseModel):
+                collect_foreign_keys(value, ids_by_type)
+            elif value is not None:
+                for id_type in id_types:
+                    ids_by_type[id_type].add(value)
+
+    return ids_by_type
+
+
+async def get_foreign_keys_not_in_tournament(
+    ids_by_type: dict[type[Any], set[int]], tournament_id: TournamentId
+) -> dict[type[Any], list[int]]:
+    """The IDs that don't belong to the tournament, checked for all types in a single query."""
+    ids_by_type = {id_type: ids for id_type, ids in ids_by_type.items() if ids}
+    if not ids_by_type:
+        return {}
+
+    id_types = {id_type.__name__: id_type for id_type in ids_by_type}
+    query = "\nUNION ALL\n".join(
+        f"""
+        SELECT '{id_type.__name__}' AS id_type, ids.id
+        FROM UNNEST(CAST(:{id_type.__name__.lower()}s AS BIGINT[])) AS ids(id)
+        WHERE NOT EXISTS ({OWNERSHIP_CHECKS[id_type]})
         """
-        SELECT 1 FROM teams_category
-        WHERE id = :id AND tournament_id = :tid
-        """,
-        {"id": category_id, "tid": tournament_id},
+        for id_type in ids_by_type
     )
-    return row is not None
-
+    values = {f"{id_type.__name__.lower()}s": sorted(ids) for id_type, ids in ids_by_type.items()}
+    result = await database.fetch_all(query, {**values, "tournament_id": tournament_id})
 
-def raise_exception(field_type: Any, field_value: Any) -> NoReturn:
-    field_name = field_type.__name__ if field_type is not None else "Unknown type"
-    msg = f"Could not find {field_name.replace('Id', '')}(s) with ID {field_value}"
-    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
+    missing: dict[type[Any], list[int]] = defaultdict(list)
+    for row in result:
+        missing[id_types[row["id_type"]]].append(row["id"])
+    return missing
 
 
 async def check_foreign_keys_belong_to_tournament(
@@ -128,42 +125,8 @@ async def check_foreign_keys_belong_to_tournament(
     is indeed part of the tournament. This prohibits e.g. adding players from another tournament to
     a certain team.
     """
-    stages = await get_full_tournament_details(tournament_id)
-
-    check_lookup: dict[type[Any], CheckCallableT] = {
-        StageId: check_stage_belongs_to_tournament,
-        TeamId: check_team_belongs_to_tournament,
-        TeamCategoryId: check_team_category_belongs_to_tournament,
-        StageItemId: check_stage_item_belongs_to_tournament,
-        StageItemInputId: check_stage_item_input_belongs_to_tournament,
-        RoundId: check_round_belongs_to_tournament,
-        PlayerId: check_player_belongs_to_tournament,
-        MatchId: check_match_belongs_to_tournament,
-        CourtId: check_court_belongs_to_tournament,
-    }
-
-    for field_key, field_info in some_body.model_fields.items():
-        field_value = getattr(some_body, field_key)
-        if field_value is None:
-            continue
-
-        if isinstance(field_value, BaseModel):
-            await check_foreign_keys_belong_to_tournament(field_value, tournament_id)
-        elif isinstance(field_value, set):
-            if field_info.annotation == set[PlayerId]:
-                if not await check_players_belong_to_tournament(field_value, tournament_id):
-                    raise_exception(PlayerId, field_value)
-            else:
-                raise Exception(f"Unknown set type: {field_info.annotation}")
-        elif isinstance(field_value, list):
-            if get_args(field_info.annotation) and get_args(field_info.annotation)[0] == PlayerId:
-                if not await check_players_belong_to_tournament(set(field_value), tournament_id):
-                    raise_exception(PlayerId, field_value)
-        else:
-            possible_types = [field_info.annotation, *get_args(field_info.annotation)]
-            for possible_type in possible_types:
-                check_callable = check_lookup.get(possible_type)
-                if check_callable is not None and not await check_callable(
-                    field_value, stages, tournament_id
-                ):
-                    raise_exception(possible_type, field_value)
+    missing = await get_foreign_keys_not_in_tournament(
+        collect_foreign_keys(some_body), tournament_id
+    )
+    for id_type, ids in missing.items():
+        raise_exception(id_type, set(ids))
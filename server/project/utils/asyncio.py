@@ -11,17 +11,31 @@ if TYPE_CHECKING:
 
 class AsyncioTasksManager:
     _tasks: ClassVar[set[asyncio.Task[Any]]] = set()
+    _long_running_tasks: ClassVar[set[asyncio.Task[Any]]] = set()
 
     @classmethod
-    def add_coroutine(cls, coroutine: Awaitable[Any]) -> asyncio.Task[Any]:
+    def add_coroutine(
+        cls, coroutine: Awaitable[Any], long_running: bool = False
+    ) -> asyncio.Task[Any]:
+        """
+        Runs the coroutine in the background until it's done or the app shuts down. Tasks that
+        run as long as the app (`long_running`) aren't counted by `pending_count`.
+        """
         task = asyncio.create_task(coroutine)  # type: ignore[var-annotated,arg-type]
-        task.add_done_callback(cls._tasks.discard)
-        cls._tasks.add(task)
+        tasks = cls._long_running_tasks if long_running else cls._tasks
+        task.add_done_callback(tasks.discard)
+        tasks.add(task)
         return task
 
+    @classmethod
+    def pending_count(cls) -> int:
+        """Background tasks that haven't finished yet, excluding the long running ones."""
+        return len(cls._tasks)
+
     @classmethod
     async def gather(cls) -> None:
-        if cls._tasks:
-            logger.info(f"Cancelling {len(cls._tasks)} tasks")
-            for task in cls._tasks:
+        tasks = cls._tasks | cls._long_running_tasks
+        if tasks:
+            logger.info(f"Cancelling {len(tasks)} tasks")
+            for task in tasks:
                 task.cancel()
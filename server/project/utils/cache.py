@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process LRU cache where every entry expires at its own (wall clock) time. Holds at most
+    `max_size` entries, the least recently used entry is evicted first. Not thread-safe, meant to
+    be used from the event loop only.
+    """
+
+    def __init__(
+        self, max_size: int, ttl_seconds: float, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, expires_at: float | None = None) -> None:
+        """Stores `value` until `expires_at`, but never longer than the cache's TTL."""
+        max_expires_at = self._clock() + self.ttl_seconds
+        expires_at = max_expires_at if expires_at is None else min(expires_at, max_expires_at)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
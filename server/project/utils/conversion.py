@@ -1,15 +1,14 @@
 from collections.abc import Mapping
+from enum import Enum
 from typing import Any
 
 from heliclockter import datetime_tz
 from pydantic import BaseModel
 
-from project.utils.types import EnumAutoStr
-
 
 def _map_to_str(value: Any) -> Any:
     match value:
-        case EnumAutoStr():
+        case Enum():
             return value.value
         case datetime_tz():
             return value.isoformat()
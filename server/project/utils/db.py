@@ -62,11 +62,7 @@ async def insert_generic(
         if raw is None:
             raise RuntimeError("Insert succeeded but read-back failed")
 
-        row = dict(raw._mapping)
-        if "data" in row and isinstance(row["data"], str):
-            row["data"] = json.loads(row["data"])
-
-        row_inserted = return_type.model_validate(row)
+        row_inserted = return_type.model_validate(dict(raw._mapping))
         assert isinstance(row_inserted, return_type), f"Unexpected type: {row_inserted}"
         return last_record_id, row_inserted
     except Exception:
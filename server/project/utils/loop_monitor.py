@@ -0,0 +1,59 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from project.models.metrics import LoopMetrics
+from project.utils.logging import logger
+
+
+class EventLoopMonitor:
+    """
+    Measures how late the event loop wakes up a task that sleeps for `interval_seconds`, which
+    is how long any request has to wait for synchronous work on the loop to finish.
+
+    A watchdog thread checks that the monitor task keeps running: when the loop doesn't get to
+    it for `block_threshold_seconds`, the stack of the loop's thread is logged while it's still
+    blocked, showing which callback stalls every other request. Logged once per stall.
+    """
+
+    def __init__(
+        self, metrics: LoopMetrics, interval_seconds: float, block_threshold_seconds: float
+    ) -> None:
+        self.metrics = metrics
+        self.interval_seconds = interval_seconds
+        self.block_threshold_seconds = block_threshold_seconds
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+
+    async def run(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        watchdog.start()
+        try:
+            while True:
+                start_time = time.perf_counter()
+                self._heartbeat = time.monotonic()
+                await asyncio.sleep(self.interval_seconds)
+                lag = time.perf_counter() - start_time - self.interval_seconds
+                self.metrics.observe_lag(max(lag, 0.0))
+        finally:
+            self._stopped.set()
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+        while not self._stopped.wait(self.block_threshold_seconds / 2):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval_seconds
+            if blocked_for < self.block_threshold_seconds or heartbeat == reported_heartbeat:
+                continue
+
+            reported_heartbeat = heartbeat
+            self.metrics.blocked += 1
+            frames = sys._current_frames()  # pylint: disable=protected-access
+            frame = frames.get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            logger.warning(f"Event loop blocked for more than {blocked_for:.2f} s, at:\n{stack}")
@@ -0,0 +1,90 @@
+from collections.abc import Awaitable, Callable
+from urllib.parse import parse_qs
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, PlainTextResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from project.utils.logging import logger
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_QUERY_PARAM = "profile"
+REPORT_FORMATS = ("html", "text", "speedscope")
+
+
+def _requested_format(scope: Scope) -> str | None:
+    """`html`, `text` or `speedscope` from the `X-Profile` header or `?profile=` flag."""
+    requested: str | None = None
+    for name, value in scope["headers"]:
+        if name == PROFILE_HEADER:
+            requested = value.decode("latin-1")
+    if requested is None and PROFILE_QUERY_PARAM.encode() in scope["query_string"]:
+        query = parse_qs(scope["query_string"].decode("latin-1"))
+        requested = query.get(PROFILE_QUERY_PARAM, [None])[0]
+    if requested is None:
+        return None
+    return requested if requested in REPORT_FORMATS else REPORT_FORMATS[0]
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a single request on demand, when it has an `X-Profile` header or `?profile=` query
+    flag and `is_authorized` accepts it. The response of the route is replaced by the report:
+    an interactive call tree (`html`), a plain text call tree (`text`) or a flame graph for
+    https://www.speedscope.app (`speedscope`). The status code of the route is in the
+    `X-Profiled-Status` header. Time spent awaiting, e.g. on the database, shows up as `await`.
+
+    Only added to the app when `REQUEST_PROFILING` is enabled, so normally it costs nothing.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        is_authorized: Callable[[Request], Awaitable[bool]],
+        interval_seconds: float = 0.001,
+    ) -> None:
+        self.app = app
+        self.is_authorized = is_authorized
+        self.interval_seconds = interval_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (report_format := _requested_format(scope)) is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.is_authorized(Request(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def discard_response(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        profiler = Profiler(interval=self.interval_seconds, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard_response)
+        finally:
+            profiler.stop()
+
+        logger.info(f"Profiled {scope['method']} {scope['path']} ({report_format})")
+        headers = {"X-Profiled-Status": str(status_code)}
+        response: Response
+        if report_format == "html":
+            response = HTMLResponse(profiler.output_html(), headers=headers)
+        elif report_format == "text":
+            response = PlainTextResponse(
+                profiler.output_text(unicode=True, show_all=False), headers=headers
+            )
+        else:
+            response = Response(
+                profiler.output(SpeedscopeRenderer()),
+                media_type="application/json",
+                headers=headers,
+            )
+        await response(scope, receive, send)
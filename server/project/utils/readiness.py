@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+from project.config import config
+from project.database import InstrumentedDatabase, database, replica_database
+from project.models.metrics import DatabaseReadiness, PoolReadiness, Readiness, get_loop_metrics
+from project.utils.asyncio import AsyncioTasksManager
+
+
+async def check_database(db: InstrumentedDatabase) -> DatabaseReadiness:
+    """Runs a trivial query, which also has to wait for a connection when the pool is busy."""
+    start_time = time.perf_counter()
+    try:
+        await asyncio.wait_for(db.fetch_val("SELECT 1"), config.readiness_db_timeout_seconds)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return DatabaseReadiness(name=db.pool_name, reachable=False, latency_ms=None)
+    latency_ms = round((time.perf_counter() - start_time) * 1000, 1)
+    return DatabaseReadiness(name=db.pool_name, reachable=True, latency_ms=latency_ms)
+
+
+async def check_readiness() -> Readiness:
+    dbs = [db for db in (database, replica_database) if db is not None]
+    databases = list(await asyncio.gather(*(check_database(db) for db in dbs)))
+    pools = [
+        PoolReadiness(
+            name=pool.name,
+            in_use=pool.size - pool.idle,
+            max_size=pool.max_size,
+            waiting=pool.metrics.waiting,
+        )
+        for db in dbs
+        if (pool := db.pool_stats()) is not None
+    ]
+    loop_lag = get_loop_metrics().latest_lag if config.loop_monitor_enabled else None
+    background_tasks = AsyncioTasksManager.pending_count()
+
+    failures = [
+        f"database {db.name} did not respond within {config.readiness_db_timeout_seconds} s"
+        for db in databases
+        if not db.reachable
+    ]
+    failures += [
+        f"{pool.waiting} requests are waiting for a connection of pool {pool.name}"
+        for pool in pools
+        if pool.waiting > config.readiness_max_pool_waiting
+    ]
+    if loop_lag is not None and loop_lag > config.readiness_max_loop_lag_seconds:
+        failures.append(f"event loop lags {loop_lag:.2f} s behind")
+    if background_tasks > config.readiness_max_background_tasks:
+        failures.append(f"{background_tasks} background tasks are pending")
+
+    return Readiness(
+        ready=not failures,
+        failures=failures,
+        databases=databases,
+        pools=pools,
+        loop_lag_seconds=loop_lag,
+        background_tasks=background_tasks,
+    )
@@ -1,5 +1,21 @@
+from collections.abc import Sequence
+from typing import cast
+
 from starlette.requests import Request
-from starlette.routing import Match, Route
+from starlette.routing import BaseRoute, Match, Route
+from starlette.types import Scope
+
+
+def _find_route(routes: Sequence[BaseRoute], scope: Scope) -> Route | None:
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match is Match.FULL:
+            # FastAPI wraps included routers in a route without a path, look inside those
+            if (router := getattr(route, "original_router", None)) is not None:
+                return _find_route(router.routes, scope)
+            return cast(Route, route)
+
+    return None
 
 
 def _get_route_for_request(request: Request) -> Route | None:
@@ -13,13 +29,10 @@ def _get_route_for_request(request: Request) -> Route | None:
     if route is not None:
         return route
 
-    for route in request.app.routes:
-        match, _ = route.matches(request.scope)
-        if match is Match.FULL:
-            request.state.__route_cached__ = route
-            return route
-
-    return None
+    route = _find_route(request.app.routes, request.scope)
+    if route is not None:
+        request.state.__route_cached__ = route
+    return route
 
 
 def get_route_path(request: Request) -> str:
@@ -28,4 +41,5 @@ def get_route_path(request: Request) -> str:
         assert isinstance(route.path, str), msg
         return route.path
 
-    return f"unhandled:{request.url.path}"
+    # not the path itself: it's used as a metrics label, unmatched paths would add a series each
+    return "unhandled"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import IO, Any
+
+from project.config import config
+
+_render_executor = ThreadPoolExecutor(
+    max_workers=config.export_worker_threads, thread_name_prefix="render"
+)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+# Chunks waiting for a slow client, after which the render thread waits too
+STREAM_QUEUE_SIZE = 8
+
+
+class RenderCancelledError(Exception):
+    """Raised in the render thread when the response it renders into has been closed."""
+
+
+class _QueueWriter(io.RawIOBase):
+    """
+    Write-only, non-seekable file object that forwards everything written to it (from a worker
+    thread) to a bounded asyncio queue owned by the event loop, waiting while the queue is full.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue[bytes | None],
+        cancelled: threading.Event,
+    ):
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+        self._cancelled = cancelled
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        if self._cancelled.is_set():
+            raise RenderCancelledError()
+
+        chunk = bytes(data)
+        if chunk:
+            asyncio.run_coroutine_threadsafe(self._queue.put(chunk), self._loop).result()
+        return len(chunk)
+
+
+async def stream_from_thread(render: Callable[[IO[bytes]], None]) -> AsyncIterator[bytes]:
+    """
+    Runs `render` in the render thread pool and yields the bytes it writes as soon as they are
+    flushed, so rendering doesn't block the event loop. Whether bytes are written while the
+    document is still being generated depends on the renderer.
+
+    At most `STREAM_QUEUE_SIZE` chunks are buffered. When the response is closed early (e.g. the
+    client disconnected), the render is stopped at its next write.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    cancelled = threading.Event()
+
+    def run() -> None:
+        writer = io.BufferedWriter(
+            _QueueWriter(loop, queue, cancelled), buffer_size=STREAM_CHUNK_SIZE
+        )
+        try:
+            render(writer)
+            writer.flush()
+        except RenderCancelledError:
+            with suppress(RenderCancelledError):
+                writer.close()
+        finally:
+            if not cancelled.is_set():
+                asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+    future = loop.run_in_executor(_render_executor, run)
+    try:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+    except (GeneratorExit, asyncio.CancelledError):
+        # Stop the render, and drain the queue to release a write waiting for space
+        cancelled.set()
+        while not queue.empty():
+            queue.get_nowait()
+        raise
+
+    # Re-raise any exception that happened while rendering
+    await future
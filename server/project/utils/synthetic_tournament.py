@@ -0,0 +1,557 @@
+"""
+Generates large, realistic tournaments for load and scale testing: clubs, players with custom
+fields, individual and team divisions with brackets, teams with positions, and three stages
+(round robin pools, a Swiss stage and a single elimination final) with scheduled and scored
+matches. The same size and seed always generate the same data. Rows are built in memory and
+loaded with COPY, using IDs reserved from the tables' sequences.
+"""
+
+import math
+import random
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, NamedTuple
+from zoneinfo import ZoneInfo
+
+from heliclockter import datetime_utc
+
+from project.database import database
+from project.logic.scheduling.round_robin import get_round_robin_combinations
+from project.schema import metadata
+from project.utils.id_types import TournamentId
+from project.utils.logging import logger
+
+SYNTHETIC_USER_EMAIL = "synthetic@example.com"
+TEAM_POSITIONS = ["SENPO", "JIHOU", "CHUKEN", "FUKUSHOU", "TAISHO"]
+RANKS = [f"{kyu} kyu" for kyu in range(6, 0, -1)] + [f"{dan} dan" for dan in range(1, 8)]
+INDIVIDUAL_DIVISIONS = [
+    ("Men's Open", "M"),
+    ("Women's Open", "W"),
+    ("Kyu", "K"),
+    ("Youth", "Y"),
+    ("Senior", "S"),
+    ("Masters", "X"),
+]
+FIRST_NAMES = [
+    "Aiko", "Ben", "Chen", "Daiki", "Emma", "Felix", "Grace", "Haruto", "Ines", "Jun",
+    "Kenji", "Liam", "Mei", "Noah", "Olivia", "Priya", "Quinn", "Ren", "Sora", "Taro",
+    "Uma", "Victor", "Wei", "Yuki", "Zoe",
+]  # fmt: skip
+LAST_NAMES = [
+    "Abe", "Brown", "Chang", "Davis", "Endo", "Fujita", "Garcia", "Hayashi", "Ito", "Jones",
+    "Kato", "Lee", "Mori", "Nguyen", "Ono", "Park", "Rossi", "Sato", "Tanaka", "Ueda",
+    "Wang", "Yamada", "Zhang",
+]  # fmt: skip
+CLUB_PLACES = [
+    "Toronto", "Montreal", "Vancouver", "Ottawa", "Calgary", "Waterloo", "Kingston", "Halifax",
+    "Winnipeg", "Quebec", "Victoria", "Edmonton", "Hamilton", "London", "Guelph", "Regina",
+]  # fmt: skip
+
+
+class SyntheticTournamentSize(NamedTuple):
+    players: int = 2000
+    clubs: int = 40
+    courts: int = 8
+    bracket_size: int = 8
+    pool_size: int = 4
+    swiss_rounds: int = 5
+    swiss_group_size: int = 64
+    elimination_size: int = 16
+
+
+def validate_size(size: SyntheticTournamentSize) -> None:
+    """Raises a ValueError for sizes that can't form at least two teams to play each other."""
+    min_players = 2 * len(TEAM_POSITIONS)
+    if size.players < min_players:
+        raise ValueError(f"At least {min_players} players are needed to form two teams")
+    if size.clubs < 1 or size.courts < 1:
+        raise ValueError("At least one club and one court are needed")
+    if size.pool_size < 2:
+        raise ValueError("The pool size must be at least 2")
+    if size.bracket_size < 2 or size.swiss_group_size < 2:
+        raise ValueError("Brackets and Swiss groups need room for at least two entrants")
+    if size.elimination_size not in (2, 4, 8, 16):
+        raise ValueError("Elimination size must be 2, 4, 8 or 16")
+
+
+class SyntheticTournamentGenerator:
+    def __init__(self, size: SyntheticTournamentSize, seed: int) -> None:
+        validate_size(size)
+        self.size = size
+        self.random = random.Random(seed)
+        self.start_time = datetime_utc(2025, 6, 7, 9, tzinfo=ZoneInfo("UTC"))
+        self.rows: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+    def add(self, table: str, **values: Any) -> int:
+        """Adds a row with a provisional ID, the IDs are replaced with real ones on load."""
+        row_id = len(self.rows[table]) + 1
+        self.rows[table].append({"id": row_id, **values})
+        return row_id
+
+    def generate(self, tournaments: int) -> list[int]:
+        user_id = self.add(
+            "users",
+            email=SYNTHETIC_USER_EMAIL,
+            name="Synthetic data",
+            password_hash="",
+            account_type="REGULAR",
+        )
+        clubs = [self.generate_club(index, user_id) for index in range(self.size.clubs)]
+        return [self.generate_tournament(index, clubs) for index in range(tournaments)]
+
+    def generate_club(self, index: int, user_id: int) -> tuple[int, str]:
+        place = CLUB_PLACES[index % len(CLUB_PLACES)]
+        suffix = f" {index // len(CLUB_PLACES) + 1}" if index >= len(CLUB_PLACES) else ""
+        name = f"{place} Kendo Club{suffix}"
+        abbreviation = f"{place[:3].upper()}{index // len(CLUB_PLACES) or ''}"
+        club_id = self.add(
+            "clubs",
+            name=name,
+            abbreviation=abbreviation,
+            representative=None,
+            contact_email=None,
+            creator_id=user_id,
+        )
+        return club_id, abbreviation
+
+    def generate_tournament(self, index: int, clubs: list[tuple[int, str]]) -> int:
+        tournament_id = self.add(
+            "tournaments",
+            name=f"Synthetic Open {index + 1}",
+            organizer="Synthetic data",
+            start_time=self.start_time,
+            location=None,
+            description=None,
+            dashboard_public=True,
+            logo_path=None,
+            dashboard_endpoint=None,
+        )
+        ranking_id = self.add(
+            "rankings",
+            tournament_id=tournament_id,
+            position=0,
+            win_points=1.0,
+            draw_points=0.5,
+            loss_points=0.0,
+            add_score_points=False,
+        )
+        categories = [
+            self.add("teams_category", tournament_id=tournament_id, name=name, color=color)
+            for name, color in (("Mixed", "#1c7ed6"), ("Womens", "#d6336c"))
+        ]
+        courts = [
+            self.add("courts", name=f"Court {court + 1}", tournament_id=tournament_id)
+            for court in range(self.size.courts)
+        ]
+        for position, (key, label, type_, options) in enumerate(
+            [
+                ("participant_number", "Participant #", "TEXT", []),
+                ("rank", "Rank", "DROPDOWN", RANKS),
+                ("age", "Age", "NUMBER", []),
+                ("paid", "Paid", "CHECKBOX", []),
+            ]
+        ):
+            self.add(
+                "players_field",
+                tournament_id=tournament_id,
+                key=key,
+                label=label,
+                type=type_,
+                position=position,
+                options=options,
+            )
+
+        players = self.generate_players(tournament_id, clubs)
+        self.generate_individual_divisions(tournament_id, players)
+        teams = self.generate_teams(tournament_id, players, clubs, categories)
+        self.generate_stages(tournament_id, ranking_id, teams, courts)
+        return tournament_id
+
+    def generate_players(
+        self, tournament_id: int, clubs: list[tuple[int, str]]
+    ) -> list[tuple[int, int]]:
+        """Returns (player id, club id) for every player."""
+        players = []
+        # club sizes follow a long tail: a few big clubs, many small ones
+        weights = [1 / (rank + 1) for rank in range(len(clubs))]
+        for number in range(1, self.size.players + 1):
+            club_id, _ = self.random.choices(clubs, weights)[0]
+            data = {
+                "participant_number": str(number),
+                "rank": self.random.choice(RANKS),
+                "age": self.random.randint(10, 75),
+                "paid": self.random.random() < 0.9,
+            }
+            player_id = self.add(
+                "players",
+                tournament_id=tournament_id,
+                name=f"{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}",
+                club_id=club_id,
+                code=f"E{number:05d}",
+                wins=0,
+                data=data,
+            )
+            players.append((player_id, club_id))
+        return players
+
+    def add_division(self, tournament_id: int, name: str, prefix: str, type_: str) -> int:
+        return self.add(
+            "divisions",
+            name=name,
+            prefix=prefix,
+            tournament_id=tournament_id,
+            duration_mins=5 if type_ == "INDIVIDUALS" else 25,
+            margin_mins=1 if type_ == "INDIVIDUALS" else 5,
+            division_type=type_,
+        )
+
+    def add_brackets(self, division_id: int, entrant_ids: list[int], link_table: str) -> None:
+        entrant_column = "player_id" if link_table == "players_x_brackets" else "team_id"
+        bracket_size = self.size.bracket_size
+        for index, offset in enumerate(range(0, len(entrant_ids), bracket_size)):
+            entrants = entrant_ids[offset : offset + bracket_size]
+            bracket_id = self.add(
+                "brackets",
+                index=index,
+                division_id=division_id,
+                num_players=bracket_size,
+                title=f"Bracket {index + 1}",
+            )
+            for bracket_idx, entrant_id in enumerate(entrants):
+                self.add(
+                    link_table,
+                    **{entrant_column: entrant_id},
+                    bracket_id=bracket_id,
+                    bracket_idx=bracket_idx,
+                )
+
+    def generate_individual_divisions(
+        self, tournament_id: int, players: list[tuple[int, int]]
+    ) -> None:
+        entrants: dict[int, list[int]] = defaultdict(list)
+        divisions = [
+            self.add_division(tournament_id, name, prefix, "INDIVIDUALS")
+            for name, prefix in INDIVIDUAL_DIVISIONS
+        ]
+        for player_id, _ in players:
+            division_id = self.random.choice(divisions)
+            entrants[division_id].append(player_id)
+            self.add("players_x_divisions", player_id=player_id, division_id=division_id)
+
+        for division_id in divisions:
+            self.add_brackets(division_id, entrants[division_id], "players_x_brackets")
+
+    def generate_teams(
+        self,
+        tournament_id: int,
+        players: list[tuple[int, int]],
+        clubs: list[tuple[int, str]],
+        categories: list[int],
+    ) -> list[int]:
+        """Every club fields as many full teams as it has players for."""
+        abbreviations = dict(clubs)
+        players_by_club: dict[int, list[int]] = defaultdict(list)
+        for player_id, club_id in players:
+            players_by_club[club_id].append(player_id)
+
+        division_id = self.add_division(tournament_id, "Teams", "T", "TEAMS")
+        teams = []
+        team_size = len(TEAM_POSITIONS)
+        for club_id, club_players in players_by_club.items():
+            for team_index in range(len(club_players) // team_size):
+                team_id = self.add(
+                    "teams",
+                    code=f"{abbreviations[club_id]} {chr(ord('A') + team_index % 26)}",
+                    club_id=club_id,
+                    category_id=self.random.choice(categories),
+                    tournament_id=tournament_id,
+                    active=True,
+                    wins=0,
+                )
+                members = club_players[team_index * team_size : (team_index + 1) * team_size]
+                for player_id, position in zip(members, TEAM_POSITIONS):
+                    self.add(
+                        "players_x_teams", player_id=player_id, team_id=team_id, position=position
+                    )
+                self.add("teams_x_divisions", team_id=team_id, division_id=division_id)
+                teams.append(team_id)
+
+        self.random.shuffle(teams)
+        self.add_brackets(division_id, teams, "teams_x_brackets")
+        return teams
+
+    def generate_stages(
+        self, tournament_id: int, ranking_id: int, teams: list[int], courts: list[int]
+    ) -> None:
+        size = self.size
+        schedule = MatchScheduler(self, courts)
+
+        pools_stage = self.add("stages", name="Pools", tournament_id=tournament_id, is_active=False)
+        pools = []
+        for index, offset in enumerate(range(0, len(teams), size.pool_size)):
+            pool_teams = teams[offset : offset + size.pool_size]
+            if len(pool_teams) < 2:
+                break
+            stage_item_id, inputs = self.add_stage_item(
+                tournament_id, pools_stage, ranking_id, f"Pool {index + 1}", "ROUND_ROBIN",
+                [{"team_id": team_id} for team_id in pool_teams],
+            )  # fmt: skip
+            for round_index, pairs in enumerate(get_round_robin_combinations(len(inputs))):
+                round_id = self.add_round(stage_item_id, round_index, is_draft=False)
+                for first, second in pairs:
+                    if first < len(inputs) and second < len(inputs):
+                        schedule.add(round_id, inputs[first], inputs[second], scored=True)
+            pools.append(stage_item_id)
+        schedule.next_block()
+
+        swiss_stage = self.add("stages", name="Swiss", tournament_id=tournament_id, is_active=True)
+        for index, offset in enumerate(range(0, len(teams), size.swiss_group_size)):
+            group = teams[offset : offset + size.swiss_group_size]
+            stage_item_id, inputs = self.add_stage_item(
+                tournament_id, swiss_stage, ranking_id, f"Swiss {index + 1}", "SWISS",
+                [{"team_id": team_id} for team_id in group],
+            )  # fmt: skip
+            for round_index in range(size.swiss_rounds):
+                # the last round is still being drafted, so it has no scores yet
+                is_draft = round_index == size.swiss_rounds - 1
+                round_id = self.add_round(stage_item_id, round_index, is_draft=is_draft)
+                order = self.random.sample(inputs, len(inputs))
+                for first, second in zip(order[::2], order[1::2]):
+                    schedule.add(round_id, first, second, scored=not is_draft)
+        schedule.next_block()
+
+        # small tournaments may not have enough teams for two pools to play a final
+        if len(pools) >= 2:
+            self.generate_finals(tournament_id, ranking_id, pools, schedule)
+
+        schedule.finish()
+
+    def generate_finals(
+        self, tournament_id: int, ranking_id: int, pools: list[int], schedule: "MatchScheduler"
+    ) -> None:
+        """A single elimination between the winners of the pools, as many as fit a bracket."""
+        finals_stage = self.add(
+            "stages", name="Finals", tournament_id=tournament_id, is_active=False
+        )
+        elimination_size = min(self.size.elimination_size, 2 ** int(math.log2(len(pools))))
+        stage_item_id, inputs = self.add_stage_item(
+            tournament_id, finals_stage, ranking_id, "Finals", "SINGLE_ELIMINATION",
+            [
+                {"winner_from_stage_item_id": pool_id, "winner_position": 1}
+                for pool_id in pools[:elimination_size]
+            ],
+        )  # fmt: skip
+        round_id = self.add_round(stage_item_id, 0, is_draft=False)
+        previous = [
+            schedule.add(round_id, first, second)
+            for first, second in zip(inputs[::2], inputs[1::2])
+        ]
+        for round_index in range(1, int(math.log2(len(inputs)))):
+            round_id = self.add_round(stage_item_id, round_index, is_draft=False)
+            previous = [
+                schedule.add_winners_match(round_id, first, second)
+                for first, second in zip(previous[::2], previous[1::2])
+            ]
+
+    def add_stage_item(
+        self,
+        tournament_id: int,
+        stage_id: int,
+        ranking_id: int,
+        name: str,
+        type_: str,
+        inputs: list[dict[str, Any]],
+    ) -> tuple[int, list[int]]:
+        stage_item_id = self.add(
+            "stage_items",
+            name=name,
+            stage_id=stage_id,
+            team_count=len(inputs),
+            ranking_id=ranking_id,
+            type=type_,
+        )
+        input_ids = [
+            self.add(
+                "stage_item_inputs",
+                slot=slot,
+                tournament_id=tournament_id,
+                stage_item_id=stage_item_id,
+                **{
+                    "team_id": None,
+                    "winner_from_stage_item_id": None,
+                    "winner_position": None,
+                    **input_,
+                },
+                points=0.0,
+                wins=0,
+                draws=0,
+                losses=0,
+            )
+            for slot, input_ in enumerate(inputs, start=1)
+        ]
+        return stage_item_id, input_ids
+
+    def add_round(self, stage_item_id: int, round_index: int, *, is_draft: bool) -> int:
+        return self.add(
+            "rounds",
+            name=f"Round {round_index + 1:02d}",
+            is_draft=is_draft,
+            stage_item_id=stage_item_id,
+        )
+
+    async def allocate_ids(self) -> dict[str, list[int]]:
+        """Reserves as many IDs from the sequence of every table as rows were generated."""
+        return {
+            table: await database.fetch_val(
+                """
+                SELECT array_agg(nextval(pg_get_serial_sequence(:table, 'id')))
+                FROM generate_series(1, :count)
+                """,
+                {"table": table, "count": len(rows)},
+            )
+            for table, rows in self.rows.items()
+            if rows
+        }
+
+    async def load(self) -> dict[str, list[int]]:
+        """
+        Replaces the provisional IDs (and the foreign keys referencing them) by IDs from the
+        sequences, and COPYs all rows, parents before children, in a single transaction.
+        """
+        ids = await self.allocate_ids()
+        async with database.connection() as connection:
+            raw_connection = connection.raw_connection
+            async with connection.transaction():
+                for table in metadata.sorted_tables:
+                    rows = self.rows.get(table.name)
+                    if not rows:
+                        continue
+
+                    id_columns = {"id": ids[table.name]} | {
+                        foreign_key.parent.name: ids[foreign_key.column.table.name]
+                        for foreign_key in table.foreign_keys
+                        if foreign_key.column.table.name in ids
+                    }
+                    columns = list(rows[0].keys())
+                    records = [
+                        tuple(
+                            id_columns[column][row[column] - 1]
+                            if column in id_columns and row[column] is not None
+                            else row[column]
+                            for column in columns
+                        )
+                        for row in rows
+                    ]
+                    await raw_connection.copy_records_to_table(
+                        table.name, records=records, columns=columns
+                    )
+                    logger.info(f"Loaded {len(rows)} rows into {table.name}")
+        return ids
+
+
+class MatchScheduler:
+    """Spreads matches over the courts, and scores them like a round-robin ranking would."""
+
+    def __init__(self, generator: SyntheticTournamentGenerator, courts: list[int]) -> None:
+        self.generator = generator
+        self.courts = courts
+        self.slot = 0
+        self.position = 0
+        self.match_count = 0
+        self.stats: dict[int, list[int]] = defaultdict(lambda: [0, 0, 0])  # wins, draws, losses
+
+    def next_block(self) -> None:
+        """The next stage starts once all matches of the previous one are over."""
+        if self.match_count % len(self.courts):
+            self.slot += 1
+        self.position = self.slot * len(self.courts)
+
+    def _add(
+        self,
+        round_id: int,
+        inputs: tuple[int | None, int | None],
+        winners_from: tuple[int | None, int | None],
+        scored: bool,
+    ) -> int:
+        random_ = self.generator.random
+        scores = (random_.randint(0, 2), random_.randint(0, 2)) if scored else (0, 0)
+        court_index = self.position % len(self.courts)
+        slot = self.position // len(self.courts)
+        match_id = self.generator.add(
+            "matches",
+            start_time=self.generator.start_time + timedelta(minutes=15 * slot),
+            duration_minutes=10,
+            margin_minutes=5,
+            custom_duration_minutes=None,
+            custom_margin_minutes=None,
+            round_id=round_id,
+            stage_item_input1_id=inputs[0],
+            stage_item_input2_id=inputs[1],
+            stage_item_input1_conflict=False,
+            stage_item_input2_conflict=False,
+            stage_item_input1_winner_from_match_id=winners_from[0],
+            stage_item_input2_winner_from_match_id=winners_from[1],
+            court_id=self.courts[court_index],
+            stage_item_input1_score=scores[0],
+            stage_item_input2_score=scores[1],
+            position_in_schedule=slot,
+        )
+        self.position += 1
+        self.slot = self.position // len(self.courts)
+        self.match_count += 1
+
+        if scored and inputs[0] is not None and inputs[1] is not None:
+            first, second = self.stats[inputs[0]], self.stats[inputs[1]]
+            if scores[0] == scores[1]:
+                first[1] += 1
+                second[1] += 1
+            else:
+                winner, loser = (first, second) if scores[0] > scores[1] else (second, first)
+                winner[0] += 1
+                loser[2] += 1
+        return match_id
+
+    def add(self, round_id: int, first: int, second: int, scored: bool = False) -> int:
+        return self._add(round_id, (first, second), (None, None), scored)
+
+    def add_winners_match(self, round_id: int, first_match: int, second_match: int) -> int:
+        return self._add(round_id, (None, None), (first_match, second_match), scored=False)
+
+    def finish(self) -> None:
+        """Writes the standings of the scored matches into the stage item inputs."""
+        for row in self.generator.rows["stage_item_inputs"]:
+            if (stats := self.stats.get(row["id"])) is not None:
+                row["wins"], row["draws"], row["losses"] = stats
+                row["points"] = stats[0] + 0.5 * stats[1]
+
+
+async def sql_get_synthetic_tournament_ids() -> list[TournamentId]:
+    """The tournaments generated before, found through the clubs of the synthetic user."""
+    query = """
+        SELECT DISTINCT p.tournament_id
+        FROM players p
+        JOIN clubs c ON c.id = p.club_id
+        JOIN users u ON u.id = c.creator_id
+        WHERE u.email = :email
+        ORDER BY p.tournament_id
+    """
+    result = await database.fetch_all(query, {"email": SYNTHETIC_USER_EMAIL})
+    return [TournamentId(row["tournament_id"]) for row in result]
+
+
+async def sql_create_synthetic_tournaments(
+    size: SyntheticTournamentSize, seed: int, tournaments: int = 1
+) -> list[TournamentId]:
+    existing_user = await database.fetch_val(
+        "SELECT id FROM users WHERE email = :email", {"email": SYNTHETIC_USER_EMAIL}
+    )
+    if existing_user is not None:
+        raise ValueError(
+            f"Synthetic data already exists (user {SYNTHETIC_USER_EMAIL}), reset the database first"
+        )
+
+    generator = SyntheticTournamentGenerator(size, seed)
+    tournament_ids = generator.generate(tournaments)
+    ids = await generator.load()
+    await database.execute("ANALYZE")
+    return [TournamentId(ids["tournaments"][tournament_id - 1]) for tournament_id in tournament_ids]
@@ -0,0 +1,228 @@
+"""
+Lightweight tracing: spans for the requests, the `logic` functions decorated with `traced` and
+the SQL queries, nested through a context variable. Finished spans go to the configured
+exporters (see `init_tracing`), and to Sentry as performance spans when Sentry tracing is
+enabled. Without exporters and Sentry tracing, spans aren't created at all.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from queue import SimpleQueue
+from threading import Thread
+from typing import Any, Protocol, TypeVar, cast
+
+import orjson
+import sentry_sdk
+
+from project.config import config
+from project.utils.cache import TTLCache
+from project.utils.logging import logger
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# How long the console exporter waits for the root span of a trace, and keeps ignoring late spans
+TRACE_TTL_SECONDS = 300
+
+
+@dataclass
+class Span:
+    name: str
+    op: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    duration: float = 0.0
+    status: str = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set_attribute(self, name: str, value: Any) -> None:
+        self.attributes[name] = value
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Keeps all finished spans, for tests."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class JsonFileSpanExporter:
+    """
+    Appends every finished span to a file as a line of JSON. The file is written by a thread of
+    its own, so exporting a span doesn't block the event loop on disk I/O.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lines: SimpleQueue[bytes | None] = SimpleQueue()
+        self._writer = Thread(target=self._write_lines, name="span-writer", daemon=True)
+        self._writer.start()
+
+    def export(self, span: Span) -> None:
+        self._lines.put(orjson.dumps(asdict(span), default=str) + b"\n")
+
+    def close(self) -> None:
+        """Writes the spans exported so far and stops the writer thread."""
+        self._lines.put(None)
+        self._writer.join()
+
+    def _write_lines(self) -> None:
+        with open(self.path, "ab") as file:
+            while (line := self._lines.get()) is not None:
+                file.write(line)
+                # buffered while more spans are queued, flushed once the queue is empty
+                if self._lines.empty():
+                    file.flush()
+
+
+class ConsoleSpanExporter:
+    """
+    Logs every trace as a waterfall once its root span has finished. Spans that finish after
+    their root, e.g. in a task started by the request, are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._pending: TTLCache[str, list[Span]] = TTLCache(
+            max_size=1000, ttl_seconds=TRACE_TTL_SECONDS
+        )
+        self._finished: TTLCache[str, bool] = TTLCache(
+            max_size=10_000, ttl_seconds=TRACE_TTL_SECONDS
+        )
+
+    def export(self, span: Span) -> None:
+        if self._finished.get(span.trace_id):
+            return
+
+        spans = self._pending.get(span.trace_id)
+        if spans is None:
+            spans = []
+            self._pending.set(span.trace_id, spans)
+        spans.append(span)
+        if span.parent_id is None:
+            self._pending.pop(span.trace_id)
+            self._finished.set(span.trace_id, True)
+            logger.info(self.format_waterfall(spans))
+
+    @staticmethod
+    def format_waterfall(spans: list[Span]) -> str:
+        depths: dict[str | None, int] = {None: -1}
+        root = next(span for span in spans if span.parent_id is None)
+        lines = [f"Trace {root.trace_id}: {root.name} {root.duration * 1000:.1f} ms"]
+        for span in sorted(spans, key=lambda span: span.start_time):
+            depth = depths[span.span_id] = depths.get(span.parent_id, -1) + 1
+            offset = (span.start_time - root.start_time) * 1000
+            error = " (error)" if span.status != "ok" else ""
+            lines.append(
+                f"{offset:9.1f} ms {span.duration * 1000:9.1f} ms  "
+                f"{'  ' * depth}{span.name}{error}"
+            )
+        return "\n".join(lines)
+
+
+_exporters: list[SpanExporter] = []
+_sentry_tracing = False
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def set_span_exporters(exporters: list[SpanExporter]) -> None:
+    _exporters[:] = exporters
+
+
+def init_tracing() -> None:
+    global _sentry_tracing  # pylint: disable=global-statement
+    _sentry_tracing = bool(config.sentry_dsn) and config.sentry_traces_sample_rate > 0
+    exporters: list[SpanExporter] = []
+    if config.tracing_exporter == "console":
+        exporters.append(ConsoleSpanExporter())
+    elif config.tracing_exporter == "json":
+        exporters.append(JsonFileSpanExporter(config.tracing_json_path))
+    set_span_exporters(exporters)
+
+
+def is_tracing() -> bool:
+    return bool(_exporters) or _sentry_tracing
+
+
+@contextmanager
+def trace_span(name: str, op: str = "function", **attributes: Any) -> Iterator[Span | None]:
+    """A span around the block, a child of the current span. Yields None when not tracing."""
+    if not is_tracing():
+        yield None
+        return
+
+    parent = _current_span.get()
+    span = Span(
+        name=name,
+        op=op,
+        trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+        parent_id=parent.span_id if parent else None,
+        start_time=time.time(),
+        attributes=attributes,
+    )
+    token = _current_span.set(span)
+    start_time = time.perf_counter()
+    with ExitStack() as stack:
+        sentry_span = (
+            stack.enter_context(sentry_sdk.start_span(op=op, name=name))
+            if _sentry_tracing
+            else None
+        )
+        try:
+            yield span
+        except BaseException as exc:
+            span.status = "error"
+            span.set_attribute("error", type(exc).__name__)
+            raise
+        finally:
+            span.duration = time.perf_counter() - start_time
+            _current_span.reset(token)
+            if sentry_span is not None:
+                for key, value in span.attributes.items():
+                    sentry_span.set_data(key, value)
+            for exporter in _exporters:
+                exporter.export(span)
+
+
+def traced(func: F) -> F:
+    """Traces every call of the (async) function as a span named after it."""
+    name = f"{func.__module__.removeprefix('project.')}.{func.__qualname__}"
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not is_tracing():
+                return await func(*args, **kwargs)
+            with trace_span(name):
+                return await func(*args, **kwargs)
+
+        return cast(F, async_wrapper)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not is_tracing():
+            return func(*args, **kwargs)
+        with trace_span(name):
+            return func(*args, **kwargs)
+
+    return cast(F, wrapper)
@@ -0,0 +1,94 @@
+"""
+Microbenchmark of the asyncpg codecs registered in `project.database.asyncpg_init`: fetches
+10k player-like rows (two timestamps and a JSONB document each) and decodes them the old way
+(text timestamps parsed from ISO strings, `json.loads` per row) and with the binary/orjson
+codecs. Needs a database, run with `PG_DSN=... python -m tests.benchmarks.db_codecs_benchmark`.
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import asyncpg
+from heliclockter import datetime_utc
+
+from project.config import config
+from project.database import asyncpg_init
+
+ROWS = 10_000
+REPEATS = 7
+QUERY = """
+    SELECT
+        g AS id,
+        timestamptz '2024-05-01 12:00:00.123456+00' - g * interval '1 minute' AS created,
+        timestamptz '2024-05-01 12:00:00.123456+00' + g * interval '1 second' AS updated,
+        jsonb_build_object(
+            'participant_number', g::text,
+            'rank', (g % 9)::text || ' dan',
+            'age', 18 + g % 40,
+            'paid', g % 2 = 0
+        ) AS data
+    FROM generate_series(1, $1) g
+"""
+
+
+def legacy_datetime_decoder(value: str) -> datetime_utc:
+    value = value.split(".")[0].replace("+00", "+00:00")
+    return datetime_utc.fromisoformat(value)
+
+
+async def legacy_init(connection: asyncpg.Connection) -> None:
+    for timestamp_type in ("timestamp", "timestamptz"):
+        await connection.set_type_codec(
+            timestamp_type,
+            encoder=datetime_utc.isoformat,
+            decoder=legacy_datetime_decoder,
+            schema="pg_catalog",
+        )
+
+
+async def fetch_legacy(connection: asyncpg.Connection) -> list[dict[str, Any]]:
+    rows = await connection.fetch(QUERY, ROWS)
+    return [{**dict(row), "data": json.loads(row["data"])} for row in rows]
+
+
+async def fetch_codecs(connection: asyncpg.Connection) -> list[dict[str, Any]]:
+    rows = await connection.fetch(QUERY, ROWS)
+    return [dict(row) for row in rows]
+
+
+async def measure(
+    name: str,
+    init: Callable[[asyncpg.Connection], Awaitable[None]],
+    fetch: Callable[[asyncpg.Connection], Awaitable[list[dict[str, Any]]]],
+) -> list[dict[str, Any]]:
+    connection = await asyncpg.connect(str(config.pg_dsn), server_settings={"timezone": "UTC"})
+    try:
+        await init(connection)
+        result = await fetch(connection)  # warm up the statement cache
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            result = await fetch(connection)
+            timings.append(time.perf_counter() - start)
+    finally:
+        await connection.close()
+
+    print(
+        f"{name:>8}: median {statistics.median(timings) * 1000:7.1f} ms, "
+        f"min {min(timings) * 1000:7.1f} ms for {ROWS} rows"
+    )
+    return result
+
+
+async def main() -> None:
+    legacy = await measure("legacy", legacy_init, fetch_legacy)
+    codecs = await measure("codecs", asyncpg_init, fetch_codecs)
+    assert legacy == codecs, "Codecs decode rows differently than before"
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
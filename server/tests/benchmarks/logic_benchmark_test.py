@@ -0,0 +1,121 @@
+"""
+Benchmarks of the pure logic hot paths (swiss suggestions, ranking, conflicts, elimination
+updates, round robin schedules, available inputs and the court schedule) at 16 to 1024 inputs
+and 1 to 50 rounds. Runs with pytest-benchmark, baselines are stored per machine in
+`tests/benchmarks/baselines` and later runs are compared against the latest one:
+
+    pytest tests/benchmarks --benchmark-storage=tests/benchmarks/baselines --benchmark-autosave \
+        --benchmark-compare --benchmark-compare-fail=median:25%
+
+The conflict check compares all pairs of matches, so its sizes are capped at about a thousand
+matches to keep the suite fast.
+"""
+
+import random
+from typing import Any
+
+import pytest
+
+from project.logic.planning.conflicts import get_conflicting_matches
+from project.logic.planning.matches import get_scheduled_matches_per_court
+from project.logic.ranking.calculation import determine_ranking_for_stage_item
+from project.logic.ranking.elimination import (
+    get_inputs_to_update_in_subsequent_elimination_rounds,
+)
+from project.logic.scheduling.builder import determine_available_inputs
+from project.logic.scheduling.ladder_teams import get_possible_upcoming_matches_for_swiss
+from project.logic.scheduling.round_robin import get_round_robin_combinations
+from project.models.db.match import MatchFilter
+from tests.benchmarks.logic_fixtures import (
+    RANKING,
+    build_teams,
+    elimination_stage_item,
+    swiss_stage_item,
+    tournament_stages,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+INPUT_COUNTS = [16, 64, 256, 1024]
+ROUND_COUNTS = [1, 10, 50]
+MAX_CONFLICT_MATCHES = 1_024
+SIZES = [
+    pytest.param(inputs, rounds, id=f"{inputs}-inputs-{rounds}-rounds")
+    for inputs in INPUT_COUNTS
+    for rounds in ROUND_COUNTS
+]
+CONFLICT_SIZES = [
+    pytest.param(inputs, rounds, id=f"{inputs}-inputs-{rounds}-rounds")
+    for inputs in INPUT_COUNTS
+    for rounds in ROUND_COUNTS
+    if inputs * rounds <= MAX_CONFLICT_MATCHES
+]
+MATCH_FILTER = MatchFilter(
+    elo_diff_threshold=200, iterations=2_000, limit=20, only_recommended=False
+)
+
+
+@pytest.fixture(autouse=True)
+def seed_random() -> None:
+    """Swiss suggestions sample the inputs randomly, seed for comparable timings."""
+    random.seed(0)
+
+
+@pytest.mark.parametrize(("input_count", "rounds_count"), SIZES)
+def test_swiss_suggestions(benchmark: Any, input_count: int, rounds_count: int) -> None:
+    stage_item = swiss_stage_item(input_count, rounds_count)
+    draft_round = stage_item.rounds[-1]
+    result = benchmark(
+        get_possible_upcoming_matches_for_swiss,
+        MATCH_FILTER,
+        [round_ for round_ in stage_item.rounds if not round_.is_draft],
+        stage_item.inputs,
+        draft_round,
+    )
+    assert isinstance(result, list)
+
+
+@pytest.mark.parametrize(("input_count", "rounds_count"), SIZES)
+def test_ranking(benchmark: Any, input_count: int, rounds_count: int) -> None:
+    stage_item = swiss_stage_item(input_count, rounds_count)
+    result = benchmark(determine_ranking_for_stage_item, stage_item, RANKING)
+    assert len(result) == input_count
+
+
+@pytest.mark.parametrize(("input_count", "rounds_count"), CONFLICT_SIZES)
+def test_conflicting_matches(benchmark: Any, input_count: int, rounds_count: int) -> None:
+    stages = tournament_stages(input_count, rounds_count)
+    conflicts_to_set, conflicts_to_clear = benchmark(get_conflicting_matches, stages)
+    assert len(conflicts_to_set) + len(conflicts_to_clear) == input_count * rounds_count
+
+
+@pytest.mark.parametrize("input_count", INPUT_COUNTS)
+def test_elimination_updates(benchmark: Any, input_count: int) -> None:
+    stage_item = elimination_stage_item(input_count)
+    first_round = stage_item.rounds[0]
+    result = benchmark(
+        get_inputs_to_update_in_subsequent_elimination_rounds, first_round.id, stage_item
+    )
+    # the played first round, and the second round matches that get the winners as inputs
+    assert len(result) == input_count // 2 + input_count // 4
+
+
+@pytest.mark.parametrize("team_count", INPUT_COUNTS)
+def test_round_robin_combinations(benchmark: Any, team_count: int) -> None:
+    result = benchmark(get_round_robin_combinations, team_count)
+    assert len(result) == team_count - 1
+
+
+@pytest.mark.parametrize("team_count", INPUT_COUNTS)
+def test_available_inputs(benchmark: Any, team_count: int) -> None:
+    teams = build_teams(team_count)
+    stages = tournament_stages(team_count, 1)
+    result = benchmark(determine_available_inputs, teams, stages)
+    assert len(result) == len(stages)
+
+
+@pytest.mark.parametrize(("input_count", "rounds_count"), SIZES)
+def test_scheduled_matches_per_court(benchmark: Any, input_count: int, rounds_count: int) -> None:
+    stages = tournament_stages(input_count, rounds_count)
+    result = benchmark(get_scheduled_matches_per_court, stages)
+    assert sum(len(matches) for matches in result.values()) == input_count * rounds_count
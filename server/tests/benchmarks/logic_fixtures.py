@@ -0,0 +1,240 @@
+"""
+Builds tournament models of a given size for the logic benchmarks, without a database. Fixtures
+are deterministic (seeded) and cached, so building them doesn't count towards the timings.
+
+The API caps stage items at 64 teams; the per-stage-item fixtures go beyond that to show how the
+algorithms scale, so those are built with `model_construct`, which skips that validation.
+"""
+
+import random
+from datetime import timedelta
+from decimal import Decimal
+from functools import cache
+
+from project.models.db.match import MatchWithDetails, MatchWithDetailsDefinitive
+from project.models.db.ranking import Ranking
+from project.models.db.stage_item import StageType
+from project.models.db.stage_item_inputs import StageItemInputFinal
+from project.models.db.team import FullTeamWithPlayers, Team
+from project.models.db.util import RoundWithMatches, StageItemWithRounds, StageWithStageItems
+from project.utils.dummy_records import (
+    DUMMY_MATCH1,
+    DUMMY_MOCK_TIME,
+    DUMMY_RANKING1,
+    DUMMY_TEAM1,
+)
+from project.utils.id_types import (
+    CourtId,
+    MatchId,
+    RankingId,
+    RoundId,
+    StageId,
+    StageItemId,
+    StageItemInputId,
+    TeamId,
+    TournamentId,
+)
+
+TOURNAMENT_ID = TournamentId(1)
+STAGE_ITEM_SIZE = 16
+COURTS = 8
+RANKING = Ranking(**DUMMY_RANKING1.model_dump(), id=RankingId(1), created=DUMMY_MOCK_TIME)
+
+
+class IdSequence:
+    def __init__(self) -> None:
+        self.last = 0
+
+    def __call__(self) -> int:
+        self.last += 1
+        return self.last
+
+
+def build_teams(count: int) -> list[FullTeamWithPlayers]:
+    return [
+        FullTeamWithPlayers(
+            **DUMMY_TEAM1.model_dump(exclude={"code"}),
+            id=TeamId(team_id),
+            code=f"T{team_id}",
+        )
+        for team_id in range(1, count + 1)
+    ]
+
+
+def build_inputs(
+    teams: list[FullTeamWithPlayers], stage_item_id: StageItemId, ids: IdSequence
+) -> list[StageItemInputFinal]:
+    return [
+        StageItemInputFinal(
+            id=StageItemInputId(ids()),
+            slot=slot,
+            tournament_id=TOURNAMENT_ID,
+            stage_item_id=stage_item_id,
+            team_id=team.id,
+            team=Team.model_validate(team.model_dump(exclude={"players"})),
+            points=Decimal(1200 + (slot * 37) % 400),
+        )
+        for slot, team in enumerate(teams, start=1)
+    ]
+
+
+def build_match(
+    match_id: int,
+    round_id: RoundId,
+    position: int,
+    input1: StageItemInputFinal | None = None,
+    input2: StageItemInputFinal | None = None,
+    winner_from: tuple[MatchId | None, MatchId | None] = (None, None),
+    scores: tuple[int, int] = (0, 0),
+) -> MatchWithDetailsDefinitive | MatchWithDetails:
+    values = DUMMY_MATCH1.model_dump() | {
+        "id": MatchId(match_id),
+        "round_id": round_id,
+        "court_id": CourtId(position % COURTS + 1),
+        "position_in_schedule": position // COURTS,
+        "start_time": DUMMY_MOCK_TIME + timedelta(minutes=15 * (position // COURTS)),
+        "stage_item_input1_id": input1.id if input1 else None,
+        "stage_item_input2_id": input2.id if input2 else None,
+        "stage_item_input1_winner_from_match_id": winner_from[0],
+        "stage_item_input2_winner_from_match_id": winner_from[1],
+        "stage_item_input1_score": scores[0],
+        "stage_item_input2_score": scores[1],
+    }
+    if input1 is not None and input2 is not None:
+        return MatchWithDetailsDefinitive(
+            **values, stage_item_input1=input1, stage_item_input2=input2
+        )
+    return MatchWithDetails(**values)
+
+
+def build_round(
+    round_id: RoundId,
+    stage_item_id: StageItemId,
+    matches: list[MatchWithDetailsDefinitive | MatchWithDetails],
+    *,
+    is_draft: bool = False,
+) -> RoundWithMatches:
+    return RoundWithMatches(
+        id=round_id,
+        stage_item_id=stage_item_id,
+        matches=matches,
+        created=DUMMY_MOCK_TIME,
+        is_draft=is_draft,
+        name=f"Round {round_id:02d}",
+    )
+
+
+def build_stage_item(
+    stage_item_id: StageItemId,
+    type_: StageType,
+    inputs: list[StageItemInputFinal],
+    rounds: list[RoundWithMatches],
+) -> StageItemWithRounds:
+    return StageItemWithRounds.model_construct(
+        id=stage_item_id,
+        stage_id=StageId(1),
+        name=f"Stage item {stage_item_id}",
+        created=DUMMY_MOCK_TIME,
+        type=type_,
+        type_name=type_.value.lower().capitalize().replace("_", " "),
+        team_count=len(inputs),
+        ranking_id=RANKING.id,
+        inputs=inputs,
+        rounds=rounds,
+    )
+
+
+def build_paired_rounds(
+    inputs: list[StageItemInputFinal],
+    stage_item_id: StageItemId,
+    rounds_count: int,
+    seed: int,
+    round_ids: IdSequence,
+    match_ids: IdSequence,
+) -> list[RoundWithMatches]:
+    """Every round pairs up all inputs randomly, like a Swiss round would."""
+    random_ = random.Random(seed)
+    rounds = []
+    position = 0
+    for _ in range(rounds_count):
+        round_id = RoundId(round_ids())
+        order = random_.sample(inputs, len(inputs))
+        matches = []
+        for input1, input2 in zip(order[::2], order[1::2]):
+            scores = (random_.randint(0, 2), random_.randint(0, 2))
+            matches.append(
+                build_match(match_ids(), round_id, position, input1, input2, scores=scores)
+            )
+            position += 1
+        rounds.append(build_round(round_id, stage_item_id, matches))
+    return rounds
+
+
+@cache
+def swiss_stage_item(input_count: int, rounds_count: int) -> StageItemWithRounds:
+    """Played rounds, followed by an empty draft round to suggest matches for."""
+    stage_item_id = StageItemId(1)
+    inputs = build_inputs(build_teams(input_count), stage_item_id, IdSequence())
+    round_ids = IdSequence()
+    rounds = build_paired_rounds(
+        inputs, stage_item_id, rounds_count, seed=input_count, round_ids=round_ids,
+        match_ids=IdSequence(),
+    )  # fmt: skip
+    rounds.append(build_round(RoundId(round_ids()), stage_item_id, [], is_draft=True))
+    return build_stage_item(stage_item_id, StageType.SWISS, inputs, rounds)
+
+
+@cache
+def elimination_stage_item(input_count: int) -> StageItemWithRounds:
+    """A bracket with all first round matches played and the subsequent rounds still empty."""
+    stage_item_id = StageItemId(1)
+    inputs = build_inputs(build_teams(input_count), stage_item_id, IdSequence())
+    round_ids, match_ids = IdSequence(), IdSequence()
+
+    round_id = RoundId(round_ids())
+    previous = [
+        build_match(match_ids(), round_id, position, input1, input2, scores=(2, position % 2))
+        for position, (input1, input2) in enumerate(zip(inputs[::2], inputs[1::2]))
+    ]
+    rounds = [build_round(round_id, stage_item_id, previous)]
+    while len(previous) > 1:
+        round_id = RoundId(round_ids())
+        previous = [
+            build_match(match_ids(), round_id, position, winner_from=(match1.id, match2.id))
+            for position, (match1, match2) in enumerate(zip(previous[::2], previous[1::2]))
+        ]
+        rounds.append(build_round(round_id, stage_item_id, previous))
+    return build_stage_item(stage_item_id, StageType.SINGLE_ELIMINATION, inputs, rounds)
+
+
+@cache
+def tournament_stages(team_count: int, rounds_count: int) -> list[StageWithStageItems]:
+    """
+    Two stages, each dividing all teams over stage items of 16 teams, where every round pairs up
+    the teams in a stage item. Matches are spread over the courts in order.
+    """
+    teams = build_teams(team_count)
+    stage_item_ids, input_ids, round_ids, match_ids = (IdSequence() for _ in range(4))
+    stages = []
+    for stage_id, type_ in ((StageId(1), StageType.ROUND_ROBIN), (StageId(2), StageType.SWISS)):
+        stage_items = []
+        for offset in range(0, team_count, STAGE_ITEM_SIZE):
+            stage_item_id = StageItemId(stage_item_ids())
+            stage_item_teams = teams[offset : offset + STAGE_ITEM_SIZE]
+            inputs = build_inputs(stage_item_teams, stage_item_id, input_ids)
+            rounds = build_paired_rounds(
+                inputs, stage_item_id, rounds_count, seed=stage_item_id, round_ids=round_ids,
+                match_ids=match_ids,
+            )  # fmt: skip
+            stage_items.append(build_stage_item(stage_item_id, type_, inputs, rounds))
+        stages.append(
+            StageWithStageItems(
+                id=stage_id,
+                tournament_id=TOURNAMENT_ID,
+                name=f"Stage {stage_id}",
+                created=DUMMY_MOCK_TIME,
+                is_active=stage_id == 1,
+                stage_items=stage_items,
+            )
+        )
+    return stages
@@ -0,0 +1,301 @@
+"""
+Load test that replays a tournament day against the app, in process, on a local database:
+spectators poll the stages, rankings and courts, table officials enter scores concurrently and an
+admin starts Swiss rounds, reschedules matches and activates stages. Reports per endpoint the
+throughput, p50/p95/p99 latency, database queries per request and error rate.
+
+Authentication goes through the normal dependencies, only the Firebase token verification is
+stubbed. Without `--tournament-id`, a synthetic tournament is generated first (see
+`project.utils.synthetic_tournament`), or reused when the database already has synthetic data;
+its size stays within the limits of a regular account.
+Run from the server directory (the app mounts `./static`), with a database and the usual
+environment (`PG_DSN`, `JWT_SECRET`, `FIREBASE_CREDENTIALS`):
+
+    python -m tests.benchmarks.tournament_day_load --duration 60 --spectators 200 --officials 8
+
+The client runs on the same event loop as the app, so the numbers include its overhead: they
+are a lower bound of the capacity, to compare between versions and before an event.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+import click
+import httpx
+
+from project.app import app
+from project.config import config
+from project.database import database
+from project.routes.auth import set_token_verifier
+from project.utils.synthetic_tournament import (
+    SYNTHETIC_USER_EMAIL,
+    SyntheticTournamentSize,
+    sql_create_synthetic_tournaments,
+    sql_get_synthetic_tournament_ids,
+)
+from project.utils.types import JsonDict
+
+# Stays within the limits of a regular account, e.g. at most 64 rounds and stage items
+LOAD_TEST_SIZE = SyntheticTournamentSize(players=320, clubs=12, courts=8)
+
+
+@dataclass
+class EndpointStats:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, tournament_id: int, duration: float) -> None:
+        self.client = client
+        self.tournament_id = tournament_id
+        self.deadline = time.monotonic() + duration
+        self.stats: defaultdict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.random = random.Random(0)
+
+    @property
+    def running(self) -> bool:
+        return time.monotonic() < self.deadline
+
+    async def request(
+        self, user: str, method: str, endpoint: str, json: JsonDict | None = None, **params: Any
+    ) -> Any:
+        """Requests `endpoint` (a path template) as `user`, recording stats per template."""
+        stats = self.stats[f"{method} {endpoint}"]
+        url = endpoint.format(tournament_id=self.tournament_id, **params)
+        start_time = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, json=json, headers={"Authorization": f"Bearer {user}"}
+            )
+        except httpx.HTTPError as exc:
+            stats.latencies.append(time.perf_counter() - start_time)
+            stats.queries.append(0)
+            stats.errors[type(exc).__name__] += 1
+            return None
+
+        stats.latencies.append(time.perf_counter() - start_time)
+        stats.queries.append(int(response.headers.get("X-DB-Queries", 0)))
+        if response.status_code >= 400:
+            stats.errors[str(response.status_code)] += 1
+            return None
+        return response.json()
+
+    async def think(self, seconds: float) -> None:
+        await asyncio.sleep(self.random.uniform(0.5 * seconds, 1.5 * seconds))
+
+    async def stages(self, user: str, *, no_draft_rounds: bool = False) -> list[JsonDict]:
+        query = "?no_draft_rounds=true" if no_draft_rounds else ""
+        result = await self.request(user, "GET", "/tournaments/{tournament_id}/stages" + query)
+        return result["data"] if result else []
+
+    async def spectator(self, user: str, poll_interval: float) -> None:
+        while self.running:
+            await self.stages(user, no_draft_rounds=True)
+            await self.request(user, "GET", "/tournaments/{tournament_id}/rankings")
+            await self.request(user, "GET", "/tournaments/{tournament_id}/courts")
+            await self.request(user, "GET", "/tournaments/{tournament_id}")
+            await self.think(poll_interval)
+
+    async def official(self, user: str, think_time: float) -> None:
+        """Enters scores for random matches of the active stage, refreshing it after every match."""
+        while self.running:
+            matches = [
+                match
+                for stage in await self.stages(user)
+                if stage["is_active"]
+                for stage_item in stage["stage_items"]
+                for round_ in stage_item["rounds"]
+                if not round_["is_draft"]
+                for match in round_["matches"]
+                if match["stage_item_input1_id"] and match["stage_item_input2_id"]
+            ]
+            if matches:
+                match = self.random.choice(matches)
+                await self.request(
+                    user,
+                    "PUT",
+                    "/tournaments/{tournament_id}/matches/{match_id}",
+                    json={
+                        "round_id": match["round_id"],
+                        "stage_item_input1_score": self.random.randint(0, 2),
+                        "stage_item_input2_score": self.random.randint(0, 2),
+                        "court_id": match["court_id"],
+                        "custom_duration_minutes": match["custom_duration_minutes"],
+                        "custom_margin_minutes": match["custom_margin_minutes"],
+                    },
+                    match_id=match["id"],
+                )
+            await self.think(think_time)
+
+    async def admin(self, user: str, think_time: float) -> None:
+        actions = [self.start_swiss_round, self.reschedule_match, self.toggle_stage]
+        while self.running:
+            await actions[self.random.randrange(len(actions))](user)
+            await self.think(think_time)
+
+    async def start_swiss_round(self, user: str) -> None:
+        """Closes the draft round of a Swiss stage item, and starts the next one."""
+        swiss_items = [
+            stage_item
+            for stage in await self.stages(user)
+            for stage_item in stage["stage_items"]
+            if stage_item["type"] == "SWISS"
+        ]
+        if not swiss_items:
+            return
+
+        stage_item = self.random.choice(swiss_items)
+        for round_ in stage_item["rounds"]:
+            if round_["is_draft"]:
+                await self.request(
+                    user,
+                    "PUT",
+                    "/tournaments/{tournament_id}/rounds/{round_id}",
+                    json={"name": round_["name"], "is_draft": False},
+                    round_id=round_["id"],
+                )
+        await self.request(
+            user,
+            "POST",
+            "/tournaments/{tournament_id}/stage_items/{stage_item_id}/start_next_round",
+            json={},
+            stage_item_id=stage_item["id"],
+        )
+
+    async def reschedule_match(self, user: str) -> None:
+        matches = [
+            match
+            for stage in await self.stages(user)
+            for stage_item in stage["stage_items"]
+            for round_ in stage_item["rounds"]
+            for match in round_["matches"]
+            if match["court_id"] is not None and match["position_in_schedule"] is not None
+        ]
+        if not matches:
+            return
+
+        match, target = self.random.sample(matches, 2) if len(matches) > 1 else matches * 2
+        await self.request(
+            user,
+            "POST",
+            "/tournaments/{tournament_id}/matches/{match_id}/reschedule",
+            json={
+                "old_court_id": match["court_id"],
+                "old_position": match["position_in_schedule"],
+                "new_court_id": target["court_id"],
+                "new_position": target["position_in_schedule"],
+            },
+            match_id=match["id"],
+        )
+
+    async def toggle_stage(self, user: str) -> None:
+        direction = self.random.choice(["next", "previous"])
+        await self.request(
+            user,
+            "POST",
+            "/tournaments/{tournament_id}/stages/activate",
+            json={"direction": direction},
+        )
+
+    def report(self, duration: float) -> str:
+        lines = [
+            f"{'endpoint':<80} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'queries':>7} {'errors':>7}"
+        ]
+        for endpoint, stats in sorted(self.stats.items()):
+            count = len(stats.latencies)
+            cut_points = (
+                statistics.quantiles(stats.latencies, n=100) if count > 1 else stats.latencies * 99
+            )
+            p50, p95, p99 = (cut_points[index] * 1000 for index in (49, 94, 98))
+            lines.append(
+                f"{endpoint:<80} {count / duration:7.1f} {p50:8.1f} {p95:8.1f} {p99:8.1f} "
+                f"{statistics.mean(stats.queries):7.1f} {stats.errors.total() / count:7.1%}"
+            )
+
+        errors = [
+            f"{endpoint}: "
+            + ", ".join(f"{count}x {error}" for error, count in stats.errors.items())
+            for endpoint, stats in sorted(self.stats.items())
+            if stats.errors
+        ]
+        return "\n".join(lines + (["", "Errors:", *errors] if errors else []))
+
+
+async def get_or_create_tournament(tournament_id: int | None) -> int:
+    if tournament_id is not None:
+        return tournament_id
+
+    # Synthetic data can be generated only once per database, so later runs reuse it
+    if existing_ids := await sql_get_synthetic_tournament_ids():
+        print(
+            f"Reusing synthetic tournament {existing_ids[0]}, "
+            "pass --tournament-id to run against another tournament"
+        )
+        return existing_ids[0]
+
+    (tournament_id,) = await sql_create_synthetic_tournaments(LOAD_TEST_SIZE, seed=0)
+    return tournament_id
+
+
+async def run(
+    tournament_id: int | None,
+    duration: float,
+    spectators: int,
+    officials: int,
+    poll_interval: float,
+    think_time: float,
+) -> None:
+    set_token_verifier(lambda _: {"email": SYNTHETIC_USER_EMAIL, "exp": time.time() + 3600})
+    config.query_stats_headers = True
+    await database.connect()
+    try:
+        tournament_id = await get_or_create_tournament(tournament_id)
+        # unhandled exceptions become 500 responses, like behind a server
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+            load_test = LoadTest(client, tournament_id, duration)
+            start_time = time.monotonic()
+            await asyncio.gather(
+                *(load_test.spectator(f"spectator-{n}", poll_interval) for n in range(spectators)),
+                *(load_test.official(f"official-{n}", think_time) for n in range(officials)),
+                load_test.admin("admin", 2 * think_time),
+            )
+            elapsed = time.monotonic() - start_time
+    finally:
+        await database.disconnect()
+
+    print(
+        f"Tournament {tournament_id}: {spectators} spectators, {officials} officials and an admin "
+        f"for {elapsed:.0f} s"
+    )
+    print(load_test.report(elapsed))
+
+
+@click.command()
+@click.option("--tournament-id", type=int, help="Existing tournament, generated when omitted.")
+@click.option("--duration", default=60.0, help="Seconds to run.")
+@click.option("--spectators", default=100, help="Concurrent spectators polling the dashboard.")
+@click.option("--officials", default=8, help="Concurrent table officials entering scores.")
+@click.option("--poll-interval", default=5.0, help="Mean seconds between spectator polls.")
+@click.option("--think-time", default=2.0, help="Mean seconds between official actions.")
+def main(
+    tournament_id: int | None,
+    duration: float,
+    spectators: int,
+    officials: int,
+    poll_interval: float,
+    think_time: float,
+) -> None:
+    asyncio.run(run(tournament_id, duration, spectators, officials, poll_interval, think_time))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
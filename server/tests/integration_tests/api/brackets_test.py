@@ -0,0 +1,155 @@
+import orjson
+
+from project.models.db.bracket import BracketInsertable
+from project.models.db.division import DivisionInsertable, DivisionType
+from project.utils.dummy_records import DUMMY_MOCK_TIME, DUMMY_PLAYER1, DUMMY_PLAYER2, DUMMY_TEAM1
+from project.utils.http import HTTPMethod
+from tests.integration_tests.api.shared import (
+    send_tournament_request,
+    send_tournament_request_bytes,
+)
+from tests.integration_tests.models import AuthContext
+from tests.integration_tests.sql import (
+    inserted_bracket,
+    inserted_division,
+    inserted_player_in_bracket,
+    inserted_team_category,
+    inserted_team_in_bracket,
+)
+
+
+def division(
+    auth_context: AuthContext, name: str, division_type: DivisionType
+) -> DivisionInsertable:
+    return DivisionInsertable(
+        name=name,
+        tournament_id=auth_context.tournament.id,
+        duration_mins=10,
+        margin_mins=5,
+        division_type=division_type,
+        created=DUMMY_MOCK_TIME,
+    )
+
+
+async def test_tournament_brackets_endpoint(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    assert await send_tournament_request(HTTPMethod.GET, "brackets", auth_context, {}) == {
+        "data": []
+    }
+
+
+async def test_tournament_brackets_with_entries(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    update = {"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+    individuals = division(auth_context, "Juniors", DivisionType.INDIVIDUALS)
+    team_division = division(auth_context, "Teams", DivisionType.TEAMS)
+    async with (
+        inserted_team_category(auth_context.tournament.id) as category,
+        inserted_division(individuals) as juniors,
+        inserted_division(team_division) as teams,
+        inserted_bracket(BracketInsertable(index=1, division_id=juniors.id, num_players=4)) as b2,
+        inserted_bracket(
+            BracketInsertable(index=0, division_id=juniors.id, num_players=2, title="Pool A")
+        ) as b1,
+        inserted_bracket(BracketInsertable(index=0, division_id=teams.id, num_players=2)) as b3,
+        inserted_bracket(BracketInsertable(index=1, division_id=teams.id, num_players=2)) as b4,
+        inserted_player_in_bracket(DUMMY_PLAYER1.model_copy(update=update), b1.id, 1) as player1,
+        inserted_player_in_bracket(DUMMY_PLAYER2.model_copy(update=update), b1.id, 0) as player2,
+        inserted_team_in_bracket(
+            DUMMY_TEAM1.model_copy(update={**update, "category_id": category.id}), b3.id, 0
+        ) as team,
+    ):
+        response = await send_tournament_request(HTTPMethod.GET, "brackets", auth_context)
+
+        def player_slot(player_id: int, bracket_idx: int, name: str) -> dict[str, object]:
+            return {
+                "player_id": player_id,
+                "bracket_idx": bracket_idx,
+                "name": name,
+                "club": auth_context.club.name,
+                "code": None,
+                "participant_number": None,
+            }
+
+        # newest division first, brackets by index, slots by bracket_idx
+        assert response["data"] == [
+            {
+                "division_id": teams.id,
+                "name": "Teams",
+                "prefix": None,
+                "division_type": "TEAMS",
+                "brackets": [
+                    {
+                        "id": b3.id,
+                        "index": 0,
+                        "division_id": teams.id,
+                        "num_players": 2,
+                        "title": None,
+                        "players": [],
+                        "teams": [{"team_id": team.id, "bracket_idx": 0, "name": team.code}],
+                    },
+                    {
+                        "id": b4.id,
+                        "index": 1,
+                        "division_id": teams.id,
+                        "num_players": 2,
+                        "title": None,
+                        "players": [],
+                        "teams": [],
+                    },
+                ],
+            },
+            {
+                "division_id": juniors.id,
+                "name": "Juniors",
+                "prefix": None,
+                "division_type": "INDIVIDUALS",
+                "brackets": [
+                    {
+                        "id": b1.id,
+                        "index": 0,
+                        "division_id": juniors.id,
+                        "num_players": 2,
+                        "title": "Pool A",
+                        "players": [
+                            player_slot(player2.id, 0, player2.name),
+                            player_slot(player1.id, 1, player1.name),
+                        ],
+                        "teams": [],
+                    },
+                    {
+                        "id": b2.id,
+                        "index": 1,
+                        "division_id": juniors.id,
+                        "num_players": 4,
+                        "title": None,
+                        "players": [],
+                        "teams": [],
+                    },
+                ],
+            },
+        ]
+
+
+async def test_tournament_brackets_streamed(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    update = {"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+    async with (
+        inserted_division(division(auth_context, "Juniors", DivisionType.INDIVIDUALS)) as juniors,
+        inserted_division(division(auth_context, "Seniors", DivisionType.INDIVIDUALS)) as seniors,
+        inserted_bracket(BracketInsertable(index=0, division_id=juniors.id, num_players=2)) as b1,
+        inserted_player_in_bracket(DUMMY_PLAYER1.model_copy(update=update), b1.id, 0),
+    ):
+        status, content_type, body = await send_tournament_request_bytes(
+            HTTPMethod.GET, "brackets?stream=true", auth_context
+        )
+        assert (status, content_type) == (200, "application/x-ndjson")
+
+        # one division per line, the same as the non-streamed response
+        lines = body.decode().splitlines()
+        assert [orjson.loads(line)["division_id"] for line in lines] == [seniors.id, juniors.id]
+        expected = await send_tournament_request(HTTPMethod.GET, "brackets", auth_context)
+        assert [orjson.loads(line) for line in lines] == expected["data"]
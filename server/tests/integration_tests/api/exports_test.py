@@ -0,0 +1,51 @@
+import io
+
+from openpyxl import load_workbook
+
+from project.models.db.bracket import BracketInsertable
+from project.models.db.division import DivisionInsertable, DivisionType
+from project.utils.dummy_records import DUMMY_MOCK_TIME
+from project.utils.http import HTTPMethod
+from tests.integration_tests.api.shared import send_tournament_request_bytes
+from tests.integration_tests.models import AuthContext
+from tests.integration_tests.sql import inserted_bracket, inserted_division
+
+
+def division(auth_context: AuthContext, name: str) -> DivisionInsertable:
+    return DivisionInsertable(
+        name=name,
+        tournament_id=auth_context.tournament.id,
+        duration_mins=10,
+        margin_mins=5,
+        division_type=DivisionType.INDIVIDUALS,
+        created=DUMMY_MOCK_TIME,
+    )
+
+
+async def test_export_brackets(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    async with (
+        inserted_division(division(auth_context, "Juniors")) as juniors,
+        inserted_division(division(auth_context, "Seniors")) as seniors,
+        inserted_bracket(BracketInsertable(index=0, division_id=juniors.id, num_players=4)),
+        inserted_bracket(BracketInsertable(index=0, division_id=seniors.id, num_players=2)),
+    ):
+        status, content_type, body = await send_tournament_request_bytes(
+            HTTPMethod.GET, "export/brackets?format=pdf", auth_context
+        )
+        assert (status, content_type) == (200, "application/pdf")
+        assert body.startswith(b"%PDF-")
+        assert body.count(b"/Type /Page\n") == 2
+
+        status, content_type, body = await send_tournament_request_bytes(
+            HTTPMethod.GET, f"export/brackets?format=xlsx&division_ids={seniors.id}", auth_context
+        )
+        assert status == 200
+        assert content_type.endswith("spreadsheetml.sheet")
+        assert load_workbook(io.BytesIO(body)).sheetnames == ["Seniors"]
+
+        status, _, _ = await send_tournament_request_bytes(
+            HTTPMethod.GET, "export/brackets?format=docx", auth_context
+        )
+        assert status == 422
@@ -1,7 +1,14 @@
 from project.utils.http import HTTPMethod
-from tests.integration_tests.api.shared import send_request_raw
+from tests.integration_tests.api.shared import send_request, send_request_raw
 
 
 async def test_metrics_endpoint(startup_and_shutdown_uvicorn_server: None) -> None:
     text_response = await send_request_raw(HTTPMethod.GET, "metrics")
-    assert "HELP bracket_response_time" in text_response
+    assert "HELP bracket_request_duration_seconds" in text_response
+
+
+async def test_ready_endpoint(startup_and_shutdown_uvicorn_server: None) -> None:
+    response = await send_request(HTTPMethod.GET, "ready")
+    assert response["ready"] is True
+    assert response["failures"] == []
+    assert [db["reachable"] for db in response["databases"]] == [True]
@@ -1,12 +1,32 @@
+from contextlib import AsyncExitStack
+
+import aiohttp
+
 from project.database import database
 from project.models.db.player import Player
 from project.schema import players
 from project.utils.db import fetch_one_parsed_certain
-from project.utils.dummy_records import DUMMY_MOCK_TIME, DUMMY_PLAYER1, DUMMY_TEAM1
+from project.utils.dummy_records import (
+    DUMMY_CLUB,
+    DUMMY_MOCK_TIME,
+    DUMMY_PLAYER1,
+    DUMMY_PLAYER2,
+    DUMMY_TEAM1,
+)
 from project.utils.http import HTTPMethod
-from tests.integration_tests.api.shared import SUCCESS_RESPONSE, send_tournament_request
+from project.utils.id_types import TournamentId
+from tests.integration_tests.api.shared import (
+    SUCCESS_RESPONSE,
+    fetch_page_ids,
+    send_tournament_request,
+)
 from tests.integration_tests.models import AuthContext
-from tests.integration_tests.sql import assert_row_count_and_clear, inserted_player, inserted_team
+from tests.integration_tests.sql import (
+    assert_row_count_and_clear,
+    inserted_club,
+    inserted_player,
+    inserted_team,
+)
 
 
 async def test_players_endpoint(
@@ -57,6 +77,73 @@ async def test_create_players(
     await assert_row_count_and_clear(players, 2)
 
 
+async def players_club_ids(tournament_id: TournamentId) -> dict[str, int]:
+    query = players.select().where(players.c.tournament_id == tournament_id)
+    return {row["name"]: row["club_id"] for row in await database.fetch_all(query)}
+
+
+async def test_create_players_bulk(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    other_club = DUMMY_CLUB.model_copy(
+        update={"name": "Other Club", "abbreviation": "OC", "creator_id": auth_context.user.id}
+    )
+    async with inserted_club(other_club) as club:
+        body = {
+            "club_id": auth_context.club.id,
+            "players": [
+                {"name": "Default club"},
+                {"name": "Club by name", "club": "other club"},
+                {"name": "Club by id", "club_id": club.id},
+                {"name": "Unknown club", "club": "Nonexistent"},
+                {"name": " "},
+            ],
+        }
+        response = await send_tournament_request(
+            HTTPMethod.POST, "players/bulk", auth_context, json=body
+        )
+        assert response["data"]["created"] == 3
+        assert [error["row"] for error in response["data"]["errors"]] == [3, 4]
+        assert response["data"]["errors"][0]["detail"] == "Unknown club: Nonexistent"
+
+        assert await players_club_ids(auth_context.tournament.id) == {
+            "Default club": auth_context.club.id,
+            "Club by name": club.id,
+            "Club by id": club.id,
+        }
+        await assert_row_count_and_clear(players, 3)
+
+
+async def test_import_players_file(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    other_club = DUMMY_CLUB.model_copy(
+        update={"name": "Other Club", "abbreviation": "OC", "creator_id": auth_context.user.id}
+    )
+    async with inserted_club(other_club) as club:
+        data = aiohttp.FormData()
+        data.add_field(
+            "file",
+            b"Name,Club,Rank\nTaro Yamada,OC,3 dan\nHanako Suzuki,,2 dan\nJiro Sato,Nowhere,\n",
+            filename="players.csv",
+            content_type="text/csv",
+        )
+        data.add_field("club", auth_context.club.name)
+        response = await send_tournament_request(
+            HTTPMethod.POST, "players/import", auth_context, body=data
+        )
+        assert response["data"] == {
+            "created": 2,
+            "errors": [{"row": 4, "detail": "Unknown club: Nowhere"}],
+        }
+
+        assert await players_club_ids(auth_context.tournament.id) == {
+            "Taro Yamada": club.id,
+            "Hanako Suzuki": auth_context.club.id,
+        }
+        await assert_row_count_and_clear(players, 2)
+
+
 async def test_delete_player(
     startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
 ) -> None:
@@ -99,3 +186,110 @@ async def test_update_player(
             assert response["data"]["name"] == body["name"]
 
             await assert_row_count_and_clear(players, 1)
+
+
+async def test_update_player_codes_conflict(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    update = {"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+    async with (
+        inserted_player(DUMMY_PLAYER1.model_copy(update=update)) as player1,
+        inserted_player(DUMMY_PLAYER2.model_copy(update=update)) as player2,
+    ):
+        body = {"codes": [{"player_id": player1.id, "code": "A1"}, {"player_id": player2.id, "code": "A1"}]}
+        response = await send_tournament_request(
+            HTTPMethod.PUT, "players/codes", auth_context, json=body
+        )
+        assert [
+            (conflict["player_id"], conflict["conflicting_player_id"])
+            for conflict in response["detail"]
+        ] == [(player1.id, player2.id), (player2.id, player1.id)]
+
+        updated_player = await fetch_one_parsed_certain(
+            database, Player, query=players.select().where(players.c.id == player1.id)
+        )
+        assert updated_player.code is None
+        await assert_row_count_and_clear(players, 2)
+
+
+async def test_update_player_codes_ignores_other_players(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    async with inserted_player(
+        DUMMY_PLAYER1.model_copy(
+            update={"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+        )
+    ) as player_inserted:
+        # a player that isn't in the tournament doesn't conflict with the ones that are
+        body = {"codes": [{"player_id": player_inserted.id, "code": "A1"}, {"player_id": -1, "code": "A1"}]}
+        response = await send_tournament_request(
+            HTTPMethod.PUT, "players/codes", auth_context, json=body
+        )
+        assert response == SUCCESS_RESPONSE
+
+        updated_player = await fetch_one_parsed_certain(
+            database, Player, query=players.select().where(players.c.id == player_inserted.id)
+        )
+        assert updated_player.code == "A1"
+        await assert_row_count_and_clear(players, 1)
+
+
+async def test_players_endpoint_paginated(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    async with inserted_player(
+        DUMMY_PLAYER1.model_copy(
+            update={"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+        )
+    ) as player_inserted:
+        response = await send_tournament_request(
+            HTTPMethod.GET, "players?limit=1&sort_by=code&search=player", auth_context, {}
+        )
+        assert [player["id"] for player in response["data"]["players"]] == [player_inserted.id]
+        assert response["data"]["count"] == 1
+        assert response["data"]["next_cursor"] is None
+
+
+async def test_players_pages_with_tied_sort_keys(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    update = {"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+    async with AsyncExitStack() as stack:
+        inserted = [
+            await stack.enter_async_context(
+                inserted_player(DUMMY_PLAYER1.model_copy(update={**update, "name": name}))
+            )
+            for name in ("Tie", "Tie", "Alone", "Tie", "Tie")
+        ]
+        alone = inserted[2].id
+        tied = sorted(player.id for player in inserted if player.id != alone)
+
+        # ties on the name are broken by id, in the same direction as the name
+        asc_pages = await fetch_page_ids(
+            "players?limit=2&sort_by=name&sort_direction=asc", "players", auth_context
+        )
+        assert asc_pages == [[alone, tied[0]], [tied[1], tied[2]], [tied[3]]]
+
+        desc_pages = await fetch_page_ids(
+            "players?limit=2&sort_by=name&sort_direction=desc", "players", auth_context
+        )
+        assert desc_pages == [[tied[3], tied[2]], [tied[1], tied[0]], [alone]]
+
+
+async def test_search_players(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    async with inserted_player(
+        DUMMY_PLAYER1.model_copy(
+            update={"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+        )
+    ) as player_inserted:
+        response = await send_tournament_request(
+            HTTPMethod.GET, "players/search?q=play", auth_context, {}
+        )
+        assert [player["id"] for player in response["data"]] == [player_inserted.id]
+
+        response = await send_tournament_request(
+            HTTPMethod.GET, "players/search?q=nobody", auth_context, {}
+        )
+        assert response["data"] == []
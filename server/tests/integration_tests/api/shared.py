@@ -121,3 +121,32 @@ async def send_tournament_request(
         json=json,
         headers=auth_context.headers,
     )
+
+
+async def fetch_page_ids(
+    endpoint: str, items_key: str, auth_context: AuthContext
+) -> list[list[int]]:
+    """Follows `next_cursor` from the first page to the last, returns the ids of every page."""
+    pages: list[list[int]] = []
+    cursor = None
+    while True:
+        separator = "&" if "?" in endpoint else "?"
+        page_endpoint = endpoint if cursor is None else f"{endpoint}{separator}cursor={cursor}"
+        response = await send_tournament_request(HTTPMethod.GET, page_endpoint, auth_context)
+        pages.append([item["id"] for item in response["data"][items_key]])
+        cursor = response["data"]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+async def send_tournament_request_bytes(
+    method: HTTPMethod, endpoint: str, auth_context: AuthContext
+) -> tuple[int, str, bytes]:
+    """Status, content type and body of a request whose response isn't JSON."""
+    async with aiohttp.ClientSession() as session:
+        async with session.request(
+            method=method.value,
+            url=f"{get_root_uvicorn_url()}tournaments/{auth_context.tournament.id}/{endpoint}",
+            headers=auth_context.headers,
+        ) as resp:
+            return resp.status, resp.content_type, await resp.read()
@@ -1,13 +1,20 @@
+from contextlib import AsyncExitStack
+
 from project.database import database
 from project.models.db.team import Team
 from project.schema import teams
 from project.utils.db import fetch_one_parsed_certain
-from project.utils.dummy_records import DUMMY_MOCK_TIME, DUMMY_TEAM1
+from project.utils.dummy_records import DUMMY_MOCK_TIME, DUMMY_PLAYER1, DUMMY_TEAM1, DUMMY_TEAM2
 from project.utils.http import HTTPMethod
-from tests.integration_tests.api.shared import SUCCESS_RESPONSE, send_tournament_request
+from tests.integration_tests.api.shared import (
+    SUCCESS_RESPONSE,
+    fetch_page_ids,
+    send_tournament_request,
+)
 from tests.integration_tests.models import AuthContext
 from tests.integration_tests.sql import (
     assert_row_count_and_clear,
+    inserted_player_in_team,
     inserted_team,
     inserted_team_category,
 )
@@ -50,6 +57,63 @@ async def test_teams_endpoint(
             }
 
 
+async def test_teams_pages_with_and_without_members(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    update = {"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+    async with inserted_team_category(auth_context.tournament.id) as category:
+        update_team = {**update, "category_id": category.id}
+        async with (
+            inserted_team(DUMMY_TEAM1.model_copy(update=update_team)) as team1,
+            inserted_team(DUMMY_TEAM2.model_copy(update=update_team)) as team2,
+            inserted_player_in_team(DUMMY_PLAYER1.model_copy(update=update), team1.id) as player,
+        ):
+            first_page = await send_tournament_request(
+                HTTPMethod.GET, "teams?limit=1", auth_context
+            )
+            # sorted by code, so the team without members ("NOR B") comes first
+            assert [team["id"] for team in first_page["data"]["teams"]] == [team2.id]
+            assert first_page["data"]["teams"][0]["players"] == []
+            assert first_page["data"]["count"] == 2
+
+            cursor = first_page["data"]["next_cursor"]
+            second_page = await send_tournament_request(
+                HTTPMethod.GET, f"teams?limit=1&cursor={cursor}", auth_context
+            )
+            assert [team["id"] for team in second_page["data"]["teams"]] == [team1.id]
+            assert [p["id"] for p in second_page["data"]["teams"][0]["players"]] == [player.id]
+
+
+async def test_teams_pages_with_tied_sort_keys(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    update = {"tournament_id": auth_context.tournament.id, "club_id": auth_context.club.id}
+    async with inserted_team_category(auth_context.tournament.id) as category:
+        async with AsyncExitStack() as stack:
+            inserted = [
+                await stack.enter_async_context(
+                    inserted_team(
+                        DUMMY_TEAM1.model_copy(
+                            update={**update, "category_id": category.id, "code": f"T{i}"}
+                        )
+                    )
+                )
+                for i in range(5)
+            ]
+            ids = sorted(team.id for team in inserted)
+
+            # all teams have the same club, so the order is by id alone
+            asc_pages = await fetch_page_ids(
+                "teams?limit=2&sort_by=club&sort_direction=asc", "teams", auth_context
+            )
+            assert asc_pages == [ids[0:2], ids[2:4], ids[4:]]
+
+            desc_pages = await fetch_page_ids(
+                "teams?limit=2&sort_by=club&sort_direction=desc", "teams", auth_context
+            )
+            assert desc_pages == [[ids[4], ids[3]], [ids[2], ids[1]], [ids[0]]]
+
+
 async def test_create_team(
     startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
 ) -> None:
@@ -144,3 +208,25 @@ async def test_update_team_invalid_players(
                 HTTPMethod.PUT, f"teams/{team_inserted.id}", auth_context, None, body
             )
             assert response == {"detail": "Could not find Player(s) with ID {-1}"}
+
+
+async def test_create_teams_bulk(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    async with inserted_team_category(auth_context.tournament.id) as cat_mix:
+        body = {
+            "teams": [
+                {
+                    "code": f"UOT {letter}",
+                    "club_id": auth_context.club.id,
+                    "category_id": cat_mix.id,
+                    "active": True,
+                }
+                for letter in "ABC"
+            ]
+        }
+        response = await send_tournament_request(
+            HTTPMethod.POST, "teams/bulk", auth_context, None, body
+        )
+        assert sorted(team["code"] for team in response["data"]) == ["UOT A", "UOT B", "UOT C"]
+        await assert_row_count_and_clear(teams, 3)
@@ -175,3 +175,11 @@ async def test_tournament_upload_and_remove_logo(
     assert not await aiofiles.os.path.exists(
         f"static/tournament-logos/{response['data']['logo_path']}"
     )
+
+
+async def test_tournament_scoped_route_unknown_tournament(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    assert await send_auth_request(
+        HTTPMethod.GET, "tournaments/-1/courts", auth_context, {}
+    ) == {"detail": "You don't have access to this tournament"}
@@ -0,0 +1,217 @@
+"""
+Query plan regression tests: seeds a few hundred tournaments worth of stages, matches and
+teams, and checks with EXPLAIN that the hot queries reach the big tables through indexes. At
+this size Postgres only picks a sequential scan when there is no usable index, so a missing or
+unused index shows up as a "Seq Scan" node. Everything runs in a transaction that is rolled
+back, so the seeded rows (and their statistics) don't leak into other tests.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from project.database import database
+from project.sql.shared import sql_delete_stage_item_with_foreign_keys
+from project.sql.stages import get_full_tournament_details
+from project.sql.teams import get_teams_with_members
+from project.utils.id_types import StageItemId, TournamentId
+
+TOURNAMENTS = 200
+BIG_TABLES = {"matches", "rounds", "stage_item_inputs", "stage_items", "players_x_teams", "teams"}
+
+SEED_QUERIES = [
+    """
+    INSERT INTO users (email, name, password_hash, account_type)
+    VALUES ('query-plans@example.com', 'Query plans', '', 'REGULAR')
+    """,
+    """
+    INSERT INTO clubs (name, abbreviation, creator_id)
+    SELECT 'Query plans', 'QP', id FROM users WHERE email = 'query-plans@example.com'
+    """,
+    """
+    INSERT INTO tournaments (name, organizer, start_time, dashboard_public)
+    SELECT 'query-plans-' || g, 'Query plans', now(), false
+    FROM generate_series(1, :tournaments) g
+    """,
+    """
+    CREATE TEMPORARY TABLE seeded_tournaments ON COMMIT DROP AS
+    SELECT id FROM tournaments WHERE name LIKE 'query-plans-%'
+    """,
+    """
+    INSERT INTO rankings (tournament_id, position, win_points, draw_points, loss_points, add_score_points)
+    SELECT id, 0, 1, 0.5, 0, false FROM seeded_tournaments
+    """,
+    """
+    INSERT INTO teams_category (tournament_id, name, color)
+    SELECT id, 'Mixed', '#000000' FROM seeded_tournaments
+    """,
+    """
+    INSERT INTO courts (name, tournament_id)
+    SELECT 'Court ' || g, t.id FROM seeded_tournaments t, generate_series(1, 4) g
+    """,
+    """
+    INSERT INTO stages (name, tournament_id, is_active)
+    SELECT 'Stage ' || g, t.id, g = 1 FROM seeded_tournaments t, generate_series(1, 2) g
+    """,
+    """
+    INSERT INTO stage_items (name, stage_id, team_count, ranking_id, type)
+    SELECT 'Pool ' || g, s.id, 8, r.id, 'ROUND_ROBIN'
+    FROM stages s
+    JOIN seeded_tournaments t ON t.id = s.tournament_id
+    JOIN rankings r ON r.tournament_id = t.id,
+    generate_series(1, 4) g
+    """,
+    """
+    INSERT INTO teams (code, club_id, category_id, tournament_id)
+    SELECT 'T' || g, c.id, tc.id, t.id
+    FROM seeded_tournaments t
+    JOIN teams_category tc ON tc.tournament_id = t.id
+    CROSS JOIN (SELECT id FROM clubs WHERE abbreviation = 'QP') c,
+    generate_series(1, 16) g
+    """,
+    """
+    INSERT INTO players (tournament_id, name, club_id, wins, data)
+    SELECT teams.tournament_id, teams.code || '-' || g, teams.club_id, 0, '{}'
+    FROM teams
+    JOIN seeded_tournaments t ON t.id = teams.tournament_id,
+    generate_series(1, 4) g
+    """,
+    """
+    INSERT INTO players_x_teams (player_id, team_id)
+    SELECT p.id, teams.id
+    FROM teams
+    JOIN seeded_tournaments t ON t.id = teams.tournament_id
+    JOIN players p ON p.tournament_id = teams.tournament_id AND p.name LIKE teams.code || '-%'
+    """,
+    """
+    INSERT INTO stage_item_inputs (slot, tournament_id, stage_item_id, team_id)
+    SELECT teams.rank, s.tournament_id, si.id, teams.id
+    FROM stage_items si
+    JOIN stages s ON s.id = si.stage_id
+    JOIN seeded_tournaments t ON t.id = s.tournament_id
+    JOIN (
+        SELECT id, tournament_id, row_number() OVER (PARTITION BY tournament_id ORDER BY id) AS rank
+        FROM teams
+    ) teams ON teams.tournament_id = s.tournament_id AND teams.rank <= si.team_count
+    """,
+    """
+    INSERT INTO rounds (name, is_draft, stage_item_id)
+    SELECT 'Round ' || g, g = 5, si.id
+    FROM stage_items si
+    JOIN stages s ON s.id = si.stage_id
+    JOIN seeded_tournaments t ON t.id = s.tournament_id,
+    generate_series(1, 5) g
+    """,
+    """
+    INSERT INTO matches (
+        round_id, stage_item_input1_id, stage_item_input2_id, court_id, start_time,
+        duration_minutes, margin_minutes, position_in_schedule,
+        stage_item_input1_conflict, stage_item_input2_conflict,
+        stage_item_input1_score, stage_item_input2_score
+    )
+    SELECT r.id, sii1.id, sii2.id, c.id, now(), 10, 5, g, false, false, 0, 0
+    FROM rounds r
+    JOIN stage_items si ON si.id = r.stage_item_id
+    JOIN stages s ON s.id = si.stage_id
+    JOIN seeded_tournaments t ON t.id = s.tournament_id
+    CROSS JOIN generate_series(1, 4) g
+    JOIN stage_item_inputs sii1 ON sii1.stage_item_id = si.id AND sii1.slot = 2 * g - 1
+    JOIN stage_item_inputs sii2 ON sii2.stage_item_id = si.id AND sii2.slot = 2 * g
+    JOIN courts c ON c.tournament_id = t.id AND c.name = 'Court ' || g
+    """,
+    "ANALYZE",
+]
+
+# Foreign keys that Postgres checks (by looking up the referencing rows) on deletes
+FOREIGN_KEYS_QUERY = """
+    SELECT conrelid::regclass::text AS table_name, a.attname AS column_name
+    FROM pg_constraint con
+    JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = con.conkey[1]
+    WHERE con.contype = 'f'
+    AND con.connamespace = 'public'::regnamespace
+    AND conrelid::regclass::text = any(:tables)
+    ORDER BY 1, 2
+"""
+
+
+async def capture_queries(call: Callable[[], Awaitable[Any]]) -> list[tuple[str, dict[str, Any]]]:
+    """Runs `call` without touching the database, returning the queries it would have run."""
+    queries: list[tuple[str, dict[str, Any]]] = []
+
+    def recorder(result: Any) -> Callable[..., Awaitable[Any]]:
+        async def record(query: str, values: dict[str, Any] | None = None) -> Any:
+            queries.append((query, values or {}))
+            return result
+
+        return record
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(database, "fetch_all", recorder([]))
+        for method in ("execute", "fetch_one", "fetch_val"):
+            patch.setattr(database, method, recorder(None))
+        await call()
+
+    return queries
+
+
+def sequential_scans(plan: dict[str, Any]) -> set[str]:
+    scans = set()
+    if plan["Node Type"] == "Seq Scan" and plan["Relation Name"] in BIG_TABLES:
+        scans.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        scans |= sequential_scans(child)
+    return scans
+
+
+async def explain_sequential_scans(query: str, values: dict[str, Any]) -> set[str]:
+    result = await database.fetch_val(f"EXPLAIN (FORMAT JSON) {query}", values)
+    return sequential_scans(result[0]["Plan"])
+
+
+async def test_hot_queries_use_indexes() -> None:
+    async with database.transaction(force_rollback=True):
+        for query in SEED_QUERIES:
+            values = {"tournaments": TOURNAMENTS} if ":tournaments" in query else {}
+            await database.execute(query, values)
+
+        tournament_id = TournamentId(
+            await database.fetch_val(
+                "SELECT id FROM tournaments WHERE name = :name",
+                {"name": f"query-plans-{TOURNAMENTS // 2}"},
+            )
+        )
+        stage_item_id = StageItemId(
+            await database.fetch_val(
+                """
+                SELECT si.id FROM stage_items si
+                JOIN stages s ON s.id = si.stage_id
+                WHERE s.tournament_id = :tournament_id
+                LIMIT 1
+                """,
+                {"tournament_id": tournament_id},
+            )
+        )
+
+        queries = [
+            *await capture_queries(lambda: get_full_tournament_details(tournament_id)),
+            *await capture_queries(
+                lambda: get_full_tournament_details(tournament_id, no_draft_rounds=True)
+            ),
+            *await capture_queries(lambda: get_teams_with_members(tournament_id)),
+            *await capture_queries(lambda: sql_delete_stage_item_with_foreign_keys(stage_item_id)),
+        ]
+        foreign_keys = await database.fetch_all(
+            FOREIGN_KEYS_QUERY, {"tables": sorted(BIG_TABLES)}
+        )
+        queries += [
+            (f"SELECT 1 FROM {key['table_name']} WHERE {key['column_name']} = :id", {"id": 1})
+            for key in foreign_keys
+        ]
+
+        regressions = {
+            query: scans
+            for query, values in queries
+            if (scans := await explain_sequential_scans(query, values))
+        }
+        assert not regressions, f"Sequential scans on big tables: {regressions}"
@@ -5,8 +5,10 @@ from typing import cast
 from sqlalchemy import Table
 
 from project.database import database
+from project.models.db.bracket import Bracket, BracketInsertable
 from project.models.db.club import Club, ClubInsertable
 from project.models.db.court import Court, CourtInsertable
+from project.models.db.division import Division, DivisionInsertable
 from project.models.db.match import Match, MatchInsertable
 from project.models.db.player import Player, PlayerInsertable
 from project.models.db.player_x_team import PlayerXTeamInsertable
@@ -25,10 +27,13 @@ from project.models.db.team_category import TeamCategory, TeamCategoryInsertable
 from project.models.db.tournament import Tournament, TournamentInsertable
 from project.models.db.user import UserInDB, UserInsertable
 from project.schema import (
+    brackets,
     clubs,
     courts,
+    divisions,
     matches,
     players,
+    players_x_brackets,
     players_x_teams,
     rankings,
     rounds,
@@ -37,13 +42,14 @@ from project.schema import (
     stages,
     teams,
     teams_category,
+    teams_x_brackets,
     tournaments,
     users,
 )
 from project.sql.teams import get_teams_by_id
 from project.utils.db import insert_generic
 from project.utils.dummy_records import DUMMY_CLUB, DUMMY_RANKING1, DUMMY_TOURNAMENT
-from project.utils.id_types import TeamId, TournamentId
+from project.utils.id_types import BracketId, TeamId, TournamentId
 from project.utils.types import BaseModelT
 from tests.integration_tests.mocks import get_mock_user
 from tests.integration_tests.models import AuthContext
@@ -117,6 +123,18 @@ async def inserted_court(court: CourtInsertable) -> AsyncIterator[Court]:
         yield cast(Court, row_inserted)
 
 
+@asynccontextmanager
+async def inserted_division(division: DivisionInsertable) -> AsyncIterator[Division]:
+    async with inserted_generic(division, divisions, Division) as row_inserted:
+        yield cast(Division, row_inserted)
+
+
+@asynccontextmanager
+async def inserted_bracket(bracket: BracketInsertable) -> AsyncIterator[Bracket]:
+    async with inserted_generic(bracket, brackets, Bracket) as row_inserted:
+        yield cast(Bracket, row_inserted)
+
+
 @asynccontextmanager
 async def inserted_ranking(ranking: RankingInsertable) -> AsyncIterator[Ranking]:
     async with inserted_generic(ranking, rankings, Ranking) as row_inserted:
@@ -142,6 +160,36 @@ async def inserted_player_in_team(
             yield cast(Player, row_inserted)
 
 
+@asynccontextmanager
+async def inserted_player_in_bracket(
+    player: PlayerInsertable, bracket_id: BracketId, bracket_idx: int
+) -> AsyncIterator[Player]:
+    async with inserted_generic(player, players, Player) as row_inserted:
+        # the slot is deleted together with the player
+        await database.execute(
+            query=players_x_brackets.insert(),
+            values={
+                "player_id": cast(Player, row_inserted).id,
+                "bracket_id": bracket_id,
+                "bracket_idx": bracket_idx,
+            },
+        )
+        yield cast(Player, row_inserted)
+
+
+@asynccontextmanager
+async def inserted_team_in_bracket(
+    team: TeamInsertable, bracket_id: BracketId, bracket_idx: int
+) -> AsyncIterator[Team]:
+    async with inserted_team(team) as team_inserted:
+        # the slot is deleted together with the team
+        await database.execute(
+            query=teams_x_brackets.insert(),
+            values={"team_id": team_inserted.id, "bracket_id": bracket_id, "bracket_idx": bracket_idx},
+        )
+        yield team_inserted
+
+
 @asynccontextmanager
 async def inserted_stage(stage: StageInsertable) -> AsyncIterator[Stage]:
     async with inserted_generic(stage, stages, Stage) as row_inserted:
@@ -0,0 +1,21 @@
+from project.utils.cache import TTLCache
+
+
+def test_ttl_cache_expiry_and_lru() -> None:
+    now = 1000.0
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=60, clock=lambda: now)
+
+    cache.set("a", 1)
+    cache.set("b", 2, expires_at=now + 10)
+    assert cache.get("a") == 1  # `a` is now the most recently used entry
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    now += 30
+    cache.set("d", 4, expires_at=now + 3600)  # capped at the cache's TTL
+    assert cache.get("a") is None
+    now += 59
+    assert (cache.get("c"), cache.get("d")) == (None, 4)
+    now += 1
+    assert cache.get("d") is None
+    assert len(cache) == 0
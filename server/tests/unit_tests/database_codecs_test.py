@@ -0,0 +1,20 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from heliclockter import datetime_utc
+
+from project.database import jsonb_decoder, jsonb_encoder, timestamp_decoder, timestamp_encoder
+
+
+def test_timestamp_codec_round_trip() -> None:
+    value = datetime_utc(2024, 5, 1, 12, 30, 15, 999, tzinfo=ZoneInfo("UTC"))
+    decoded = timestamp_decoder(timestamp_encoder(value))
+
+    assert type(decoded) is datetime_utc
+    assert decoded == value.replace(microsecond=0)
+    assert timestamp_encoder(datetime(2000, 1, 1, 0, 0, 1)) == (1_000_000,)
+
+
+def test_jsonb_codec_round_trip() -> None:
+    value = {"rank": "3 dan", "age": 21, "paid": True, "clubs": [1, 2]}
+    assert jsonb_decoder(jsonb_encoder(value)) == value
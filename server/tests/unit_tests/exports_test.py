@@ -0,0 +1,131 @@
+import asyncio
+import io
+import threading
+from typing import IO
+
+from openpyxl import load_workbook
+
+from project.logic.exports import render_brackets_pdf, render_brackets_xlsx
+from project.models.db.bracket import DivisionWithBrackets
+from project.models.db.division import DivisionType
+from project.utils.streaming import STREAM_CHUNK_SIZE, STREAM_QUEUE_SIZE, stream_from_thread
+
+# As they come from the database
+DIVISIONS = [
+    DivisionWithBrackets.model_validate(
+        {
+            "division_id": 1,
+            "name": "Men's singles: A",
+            "division_type": DivisionType.INDIVIDUALS,
+            "brackets": [
+                {
+                    "id": 1,
+                    "index": 0,
+                    "division_id": 1,
+                    "num_players": 3,
+                    "players": [
+                        {"player_id": 2, "bracket_idx": 1, "name": "Bob", "club": "Ajax"},
+                        {"player_id": 1, "bracket_idx": 0, "name": "Ann", "club": "PSV"},
+                        # Left over from a larger bracket, not shown in either format
+                        {"player_id": 3, "bracket_idx": 3, "name": "Cas", "club": "PSV"},
+                    ],
+                }
+            ],
+        }
+    ),
+    DivisionWithBrackets.model_validate(
+        {
+            "division_id": 2,
+            "name": "Teams",
+            "division_type": DivisionType.TEAMS,
+            "brackets": [
+                {
+                    "id": 2,
+                    "index": 0,
+                    "division_id": 2,
+                    "num_players": 2,
+                    "title": "Pool A",
+                    "teams": [{"team_id": 5, "bracket_idx": 0, "name": "Red"}],
+                }
+            ],
+        }
+    ),
+]
+
+
+def test_render_brackets_xlsx() -> None:
+    out = io.BytesIO()
+    render_brackets_xlsx(DIVISIONS, out)
+
+    workbook = load_workbook(io.BytesIO(out.getvalue()))
+    assert workbook.sheetnames == ["Men's singles_ A", "Teams"]
+    assert list(workbook["Men's singles_ A"].values) == [
+        ("group_index", "group_title", "bracket_id", "slot", "player_id", "code", "name", "club"),
+        (0, None, 1, 0, 1, None, "Ann", "PSV"),
+        (0, None, 1, 1, 2, None, "Bob", "Ajax"),
+    ]
+    assert list(workbook["Teams"].values) == [
+        ("group_index", "group_title", "bracket_id", "slot", "team_id", "name"),
+        (0, "Pool A", 2, 0, 5, "Red"),
+    ]
+
+
+def test_render_brackets_pdf() -> None:
+    out = io.BytesIO()
+    render_brackets_pdf(DIVISIONS, out)
+
+    pdf = out.getvalue()
+    assert pdf.startswith(b"%PDF-")
+    assert pdf.count(b"/Type /Page\n") == 2
+
+
+def test_render_brackets_pdf_embeds_unicode_font() -> None:
+    division = DIVISIONS[0].model_copy(update={"name": "Юниоры: Đorđević"})
+    out = io.BytesIO()
+    render_brackets_pdf([division], out)
+
+    pdf = out.getvalue()
+    assert b"/FontFile2" in pdf
+    assert b"Helvetica" not in pdf
+
+
+def test_render_brackets_without_divisions() -> None:
+    out = io.BytesIO()
+    render_brackets_xlsx([], out)
+    assert load_workbook(io.BytesIO(out.getvalue())).sheetnames == ["brackets"]
+
+
+def test_stream_from_thread_yields_everything_written() -> None:
+    def render(out: IO[bytes]) -> None:
+        for i in range(100):
+            out.write(bytes([i]) * 1000)
+
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in stream_from_thread(render)])
+
+    assert asyncio.run(collect()) == b"".join(bytes([i]) * 1000 for i in range(100))
+
+
+def test_stream_from_thread_stops_render_when_closed() -> None:
+    writes = 0
+    finished = threading.Event()
+
+    def render(out: IO[bytes]) -> None:
+        nonlocal writes
+        try:
+            while True:
+                out.write(b"x" * STREAM_CHUNK_SIZE)
+                writes += 1
+        finally:
+            finished.set()
+
+    async def read_one_chunk() -> None:
+        stream = stream_from_thread(render)
+        await anext(stream)
+        await asyncio.sleep(0.05)
+        await stream.aclose()
+
+    asyncio.run(read_one_chunk())
+
+    assert finished.wait(5)
+    assert writes <= STREAM_QUEUE_SIZE + 3
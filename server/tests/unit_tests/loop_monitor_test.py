@@ -0,0 +1,22 @@
+import asyncio
+import time
+
+from project.models.metrics import LoopMetrics
+from project.utils.loop_monitor import EventLoopMonitor
+
+
+def test_loop_monitor_measures_blocking_calls() -> None:
+    metrics = LoopMetrics()
+
+    async def block_the_loop() -> None:
+        monitor = asyncio.create_task(EventLoopMonitor(metrics, 0.01, 0.1).run())
+        await asyncio.sleep(0.05)
+        time.sleep(0.3)
+        await asyncio.sleep(0.05)
+        monitor.cancel()
+
+    asyncio.run(block_the_loop())
+
+    assert metrics.blocked == 1
+    assert metrics.lag.count >= 2
+    assert metrics.lag.sum > 0.25
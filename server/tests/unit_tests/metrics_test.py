@@ -0,0 +1,70 @@
+import pytest
+from pydantic import ValidationError
+
+from project.config import Config
+from project.models.metrics import (
+    Histogram,
+    MetricDefinition,
+    PoolMetrics,
+    PoolStats,
+    PrometheusMetricType,
+    RequestMetrics,
+    pools_to_prometheus,
+)
+
+
+def test_histogram_prometheus_format() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0), bucket_counts=[0, 0])
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    definition = MetricDefinition(
+        name="latency", description="Some latency", type_=PrometheusMetricType.histogram
+    )
+    assert definition.format_for_prometheus_histogram([({"url": "/x"}, histogram)]) == (
+        "# HELP latency Some latency\n"
+        "# TYPE latency histogram\n"
+        'latency_bucket{url="/x",le="0.1"} 2.0\n'
+        'latency_bucket{url="/x",le="1.0"} 3.0\n'
+        'latency_bucket{url="/x",le="+Inf"} 4.0\n'
+        'latency_sum{url="/x"} 3.65\n'
+        'latency_count{url="/x"} 4.0\n'
+    )
+
+
+def test_pool_metrics_are_labeled_per_pool() -> None:
+    pools = [
+        PoolStats(name="primary", size=4, max_size=10, idle=1, metrics=PoolMetrics(waiting=2)),
+        PoolStats(name="replica", size=2, max_size=10, idle=2, metrics=PoolMetrics()),
+    ]
+    output = pools_to_prometheus(pools)
+    assert 'bracket_db_pool_in_use{pool="primary"} 3\n' in output
+    assert 'bracket_db_pool_in_use{pool="replica"} 0\n' in output
+    assert 'bracket_db_pool_waiting{pool="primary"} 2\n' in output
+
+
+def test_request_metrics_per_route_and_status() -> None:
+    metrics = RequestMetrics(buckets=(0.1, 1.0))
+    route_key = ("GET", "/tournaments/{tournament_id}")
+    for duration, status_code in ((0.05, 200), (0.5, 200), (2.0, 500)):
+        metrics.start_request(route_key)
+        metrics.finish_request(route_key, status_code, duration)
+    metrics.start_request(route_key)
+
+    output = metrics.to_prometheus()
+    labels = 'method="GET",url="/tournaments/{tournament_id}"'
+    assert f'bracket_request_duration_seconds_bucket{{{labels},le="0.1"}} 1.0\n' in output
+    assert f'bracket_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3.0\n' in output
+    assert f'bracket_request_count{{{labels},status="200"}} 2\n' in output
+    assert f'bracket_request_count{{{labels},status="500"}} 1\n' in output
+    assert f"bracket_requests_in_flight{{{labels}}} 1\n" in output
+    assert "# TYPE bracket_version gauge\n" in output
+
+
+def test_latency_buckets_are_sorted_and_validated() -> None:
+    config = Config(jwt_secret="x", request_latency_buckets=[1.0, 0.1, 0.5])
+    assert config.request_latency_buckets == [0.1, 0.5, 1.0]
+
+    for buckets in ([], [0.0, 1.0], [0.1, 0.1]):
+        with pytest.raises(ValidationError):
+            Config(jwt_secret="x", request_latency_buckets=buckets)
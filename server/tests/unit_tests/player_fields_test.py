@@ -0,0 +1,45 @@
+from project.models.db.player_fields import FieldInsertable, PlayerFieldTypes
+from project.sql.player_fields import decode_player_fields, player_field_expression
+
+
+def test_player_field_expression() -> None:
+    assert (
+        player_field_expression("participant_number", PlayerFieldTypes.NUMBER)
+        == "player_field_numeric(p.data ->> 'participant_number')"
+    )
+    assert (
+        player_field_expression("it's:rank", PlayerFieldTypes.TEXT, alias="")
+        == "COALESCE(data ->> 'it''s\\:rank', '')"
+    )
+
+
+def test_decode_player_fields() -> None:
+    fields = [
+        FieldInsertable(key=key, label=key, include=True, type=field_type, position=position)
+        for position, (key, field_type) in enumerate(
+            [
+                ("number", PlayerFieldTypes.NUMBER),
+                ("score", PlayerFieldTypes.NUMBER),
+                ("bad_number", PlayerFieldTypes.NUMBER),
+                ("paid", PlayerFieldTypes.CHECKBOX),
+                ("rank", PlayerFieldTypes.TEXT),
+                ("missing", PlayerFieldTypes.TEXT),
+            ]
+        )
+    ]
+    projection = {
+        "number": " 12 ",
+        "score": 2.5,
+        "bad_number": "n/a",
+        "paid": "Yes",
+        "rank": "3 dan",
+        "missing": None,
+    }
+
+    assert decode_player_fields(projection, fields) == {
+        "number": 12,
+        "score": 2.5,
+        "bad_number": "n/a",
+        "paid": True,
+        "rank": "3 dan",
+    }
@@ -0,0 +1,56 @@
+from project.logic.players_import import spreadsheet_rows_to_players
+
+
+def test_spreadsheet_rows_to_players() -> None:
+    rows = [
+        ["Registration sheet", None, None, None],
+        ["First Name", "Last Name", "Rank", "Club"],
+        ["Taro", "Yamada", "3 dan", None],
+        ["Hanako", " Suzuki ", 2, "UofT"],
+        [None, None, None, None],
+        ["Ignored", "After empty row", None, None],
+    ]
+
+    assert list(spreadsheet_rows_to_players(rows, header_row=2, default_club="Default")) == [
+        (
+            3,
+            {
+                "name": "Taro Yamada",
+                "club": "Default",
+                "data": {
+                    "first_name": "Taro",
+                    "last_name": "Yamada",
+                    "rank": "3 dan",
+                    "club": None,
+                },
+            },
+        ),
+        (
+            4,
+            {
+                "name": "Hanako Suzuki",
+                "club": "UofT",
+                "data": {
+                    "first_name": "Hanako",
+                    "last_name": "Suzuki",
+                    "rank": "2",
+                    "club": "UofT",
+                },
+            },
+        ),
+    ]
+
+
+def test_spreadsheet_rows_to_players_from_data_row() -> None:
+    rows = [
+        ["Name", "Club"],
+        ["Example: Taro Yamada", "Club name"],
+        ["Hanako Suzuki", None],
+    ]
+
+    assert [
+        (row_number, player["name"], player["club"])
+        for row_number, player in spreadsheet_rows_to_players(
+            rows, header_row=1, default_club="Default", data_row=3
+        )
+    ] == [(3, "Hanako Suzuki", "Default")]
@@ -0,0 +1,40 @@
+import asyncio
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from project.utils.profiling import ProfilingMiddleware
+
+
+async def endpoint(_: Request) -> JSONResponse:
+    return JSONResponse({"ok": True}, status_code=201)
+
+
+async def is_authorized(request: Request) -> bool:
+    return request.headers.get("Authorization") == "Bearer admin"
+
+
+async def get(url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+    app = Starlette(routes=[Route("/", endpoint)])
+    app.add_middleware(ProfilingMiddleware, is_authorized=is_authorized)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(url, headers=headers)
+
+
+def test_profiling_only_for_authorized_requests() -> None:
+    admin = {"Authorization": "Bearer admin"}
+
+    assert asyncio.run(get("/", admin)).json() == {"ok": True}
+    assert asyncio.run(get("/?profile=text")).json() == {"ok": True}
+
+    response = asyncio.run(get("/?profile=text", admin))
+    assert response.status_code == 200
+    assert response.headers["X-Profiled-Status"] == "201"
+    assert "Recorded:" in response.text
+
+    response = asyncio.run(get("/", {**admin, "X-Profile": "speedscope"}))
+    assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,66 @@
+from project.database import (
+    SlowQueryLog,
+    database,
+    is_plain_select,
+    normalize_query,
+    parameter_shapes,
+    track_queries,
+)
+from project.schema import matches
+
+
+def test_normalize_query_ignores_literals_and_formatting() -> None:
+    query = """
+        UPDATE matches SET position_in_schedule = 3
+        WHERE stage_item_input1_id = :input_id AND court_id IN (1, 2, 3) AND name = 'it''s'
+    """
+    assert normalize_query(query) == (
+        "UPDATE matches SET position_in_schedule = ? "
+        "WHERE stage_item_input1_id = :input_id AND court_id IN (?) AND name = ?"
+    )
+    assert normalize_query(matches.select().where(matches.c.id == 1)).startswith("SELECT")
+
+
+def test_only_plain_selects_are_explained() -> None:
+    assert is_plain_select("SELECT * FROM stages WHERE tournament_id = :tournament_id")
+    assert is_plain_select("WITH s AS (SELECT id FROM stages) SELECT count(*) FROM s")
+    assert not is_plain_select("SELECT * FROM matches WHERE id = :id FOR UPDATE")
+    assert not is_plain_select("UPDATE matches SET court_id = NULL")
+    assert not is_plain_select(
+        "WITH updated AS (UPDATE players SET code = :code RETURNING id) SELECT id FROM updated"
+    )
+
+
+def test_track_queries_reports_repeated_statements() -> None:
+    with track_queries() as stats:
+        for position in range(12):
+            stats.record(f"UPDATE matches SET position_in_schedule = {position}", 0, 0.001)
+        stats.record("SELECT * FROM courts", 4, 0.002)
+
+    assert (stats.queries, stats.rows) == (13, 4)
+    assert stats.repeated_statements(10) == [("UPDATE matches SET position_in_schedule = ?", 12)]
+    assert stats.repeated_statements(12) == []
+
+
+def test_slow_query_log_keeps_shapes_of_parameters() -> None:
+    assert parameter_shapes({"tournament_id": 1, "ids": [1, 2, 3], "name": None}) == {
+        "tournament_id": "int",
+        "ids": "list[3]",
+        "name": "NoneType",
+    }
+
+    log = SlowQueryLog(size=2)
+    for tournament_id in range(3):
+        log.record(
+            database,
+            f"SELECT * FROM stages WHERE tournament_id = {tournament_id} AND id = :id",
+            {"id": 1},
+            0.5,
+            "GET /tournaments/{tournament_id}/stages",
+        )
+
+    assert [entry.id for entry in log.entries] == [2, 3]
+    assert log.entries[-1].statement == "SELECT * FROM stages WHERE tournament_id = ? AND id = :id"
+    assert log.entries[-1].parameters == {"id": "int"}
+    assert log.entries[-1].duration_ms == 500
+    assert log.entries[-1].plan is None
@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+import project.utils.readiness
+from project.config import config
+from project.database import database
+from project.models.metrics import LoopMetrics, PoolMetrics, PoolStats, Readiness
+from project.utils.asyncio import AsyncioTasksManager
+from project.utils.readiness import check_readiness
+
+
+@pytest.fixture(autouse=True)
+def healthy(monkeypatch: pytest.MonkeyPatch) -> LoopMetrics:
+    """A database that responds at once, an idle pool and a loop without lag."""
+
+    async def fetch_val(*_: Any, **__: Any) -> int:
+        return 1
+
+    loop_metrics = LoopMetrics()
+    monkeypatch.setattr(database, "fetch_val", fetch_val)
+    monkeypatch.setattr(database, "pool_stats", lambda: pool_stats(waiting=0))
+    monkeypatch.setattr(config, "loop_monitor_enabled", True)
+    monkeypatch.setattr(project.utils.readiness, "get_loop_metrics", lambda: loop_metrics)
+    return loop_metrics
+
+
+def pool_stats(waiting: int) -> PoolStats:
+    return PoolStats(
+        name="primary", size=10, max_size=10, idle=0, metrics=PoolMetrics(waiting=waiting)
+    )
+
+
+def test_ready() -> None:
+    readiness = asyncio.run(check_readiness())
+    assert readiness.ready is True
+    assert readiness.failures == []
+
+
+def test_not_ready_when_database_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fetch_val(*_: Any, **__: Any) -> int:
+        await asyncio.sleep(1)
+        return 1
+
+    monkeypatch.setattr(database, "fetch_val", fetch_val)
+    monkeypatch.setattr(config, "readiness_db_timeout_seconds", 0.01)
+
+    readiness = asyncio.run(check_readiness())
+    assert readiness.ready is False
+    assert readiness.failures == ["database primary did not respond within 0.01 s"]
+    assert readiness.databases[0].reachable is False
+
+
+def test_not_ready_when_requests_wait_for_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    waiting = config.readiness_max_pool_waiting + 1
+    monkeypatch.setattr(database, "pool_stats", lambda: pool_stats(waiting))
+
+    readiness = asyncio.run(check_readiness())
+    assert readiness.ready is False
+    assert readiness.failures == [
+        f"{waiting} requests are waiting for a connection of pool primary"
+    ]
+
+
+def test_not_ready_when_event_loop_lags(healthy: LoopMetrics) -> None:
+    healthy.observe_lag(config.readiness_max_loop_lag_seconds + 0.5)
+
+    readiness = asyncio.run(check_readiness())
+    assert readiness.ready is False
+    assert readiness.failures == [
+        f"event loop lags {config.readiness_max_loop_lag_seconds + 0.5:.2f} s behind"
+    ]
+
+
+def test_not_ready_with_too_many_background_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "readiness_max_background_tasks", 2)
+
+    async def check_with_tasks() -> tuple[Readiness, Readiness]:
+        # the long running task, like the event loop monitor, isn't counted
+        AsyncioTasksManager.add_coroutine(asyncio.sleep(1), long_running=True)
+        for _ in range(2):
+            AsyncioTasksManager.add_coroutine(asyncio.sleep(1))
+        at_threshold = await check_readiness()
+
+        AsyncioTasksManager.add_coroutine(asyncio.sleep(1))
+        over_threshold = await check_readiness()
+        await AsyncioTasksManager.gather()
+        return at_threshold, over_threshold
+
+    at_threshold, over_threshold = asyncio.run(check_with_tasks())
+    assert at_threshold.ready is True
+    assert over_threshold.ready is False
+    assert over_threshold.failures == ["3 background tasks are pending"]
@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+import project.database
+from project.database import InstrumentedDatabase, database, read_database, replica_reads
+from project.routes.util import read_only_route_dependency
+
+
+@pytest.fixture
+def replica(monkeypatch: pytest.MonkeyPatch) -> InstrumentedDatabase:
+    replica = InstrumentedDatabase("postgresql://replica/db", pool_name="replica")
+    # `read_database` only returns a connected replica
+    replica.is_connected = True
+    monkeypatch.setattr(project.database, "replica_database", replica)
+    return replica
+
+
+def test_read_database_returns_replica_within_replica_reads(
+    replica: InstrumentedDatabase,
+) -> None:
+    assert read_database() is database
+    with replica_reads():
+        assert read_database() is replica
+        with replica_reads(enabled=False):
+            assert read_database() is database
+        assert read_database() is replica
+    assert read_database() is database
+
+
+def test_read_database_returns_primary_without_connected_replica(
+    replica: InstrumentedDatabase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    replica.is_connected = False
+    with replica_reads():
+        assert read_database() is database
+
+    monkeypatch.setattr(project.database, "replica_database", None)
+    with replica_reads():
+        assert read_database() is database
+
+
+def test_only_read_only_routes_read_from_replica(replica: InstrumentedDatabase) -> None:
+    app = FastAPI()
+
+    @app.get("/read", dependencies=[Depends(read_only_route_dependency)])
+    async def read() -> bool:
+        return read_database() is replica
+
+    @app.post("/write")
+    async def write() -> bool:
+        return read_database() is replica
+
+    async def reads_from_replica(method: str, url: str) -> bool:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return bool((await client.request(method, url)).json())
+
+    assert asyncio.run(reads_from_replica("GET", "/read"))
+    assert not asyncio.run(reads_from_replica("POST", "/write"))
@@ -0,0 +1,62 @@
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from project.utils.synthetic_tournament import (
+    SyntheticTournamentGenerator,
+    SyntheticTournamentSize,
+)
+
+SIZE = SyntheticTournamentSize(players=300, clubs=6, courts=4)
+
+
+def generate(seed: int) -> dict[str, list[dict[str, Any]]]:
+    generator = SyntheticTournamentGenerator(SIZE, seed)
+    assert generator.generate(tournaments=2) == [1, 2]
+    return dict(generator.rows)
+
+
+def test_synthetic_tournaments_are_reproducible() -> None:
+    rows = generate(seed=7)
+    assert rows == generate(seed=7)
+    assert rows != generate(seed=8)
+
+    assert len(rows["players"]) == 2 * SIZE.players
+    assert set(Counter(row["team_id"] for row in rows["players_x_teams"]).values()) == {5}
+    assert all(0 < row["team_count"] <= 64 for row in rows["stage_items"])
+
+    # the 15 pools of every tournament feed an 8 team elimination: 4 + 2 + 1 matches
+    finals = [row["id"] for row in rows["stage_items"] if row["type"] == "SINGLE_ELIMINATION"]
+    finals_rounds = {row["id"] for row in rows["rounds"] if row["stage_item_id"] in finals}
+    finals_matches = [row for row in rows["matches"] if row["round_id"] in finals_rounds]
+    assert len(finals_matches) == 2 * 7
+    winners_matches = [
+        row for row in finals_matches if row["stage_item_input1_winner_from_match_id"] is not None
+    ]
+    assert len(winners_matches) == 2 * 3
+
+    # standings are derived from the scored matches
+    inputs = rows["stage_item_inputs"]
+    assert sum(row["wins"] for row in inputs) == sum(row["losses"] for row in inputs) > 0
+
+
+def test_small_synthetic_tournaments_have_no_finals() -> None:
+    for size in [
+        SyntheticTournamentSize(players=10),
+        SyntheticTournamentSize(players=20, clubs=40),
+        SyntheticTournamentSize(players=12, clubs=1, pool_size=8),
+    ]:
+        generator = SyntheticTournamentGenerator(size, seed=0)
+        assert generator.generate(tournaments=1) == [1]
+        assert not [row for row in generator.rows["stages"] if row["name"] == "Finals"]
+
+
+def test_synthetic_tournament_sizes_are_validated() -> None:
+    for size in [
+        SyntheticTournamentSize(players=9),
+        SyntheticTournamentSize(pool_size=1),
+        SyntheticTournamentSize(elimination_size=6),
+    ]:
+        with pytest.raises(ValueError):
+            SyntheticTournamentGenerator(size, seed=0)
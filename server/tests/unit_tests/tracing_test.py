@@ -0,0 +1,79 @@
+import asyncio
+from pathlib import Path
+
+import orjson
+import pytest
+
+from project.utils.tracing import (
+    ConsoleSpanExporter,
+    InMemorySpanExporter,
+    JsonFileSpanExporter,
+    Span,
+    set_span_exporters,
+    trace_span,
+    traced,
+)
+
+
+@traced
+def rank(values: list[int]) -> list[int]:
+    return sorted(values)
+
+
+@traced
+async def schedule(values: list[int]) -> list[int]:
+    with trace_span("sql.matches.update", op="db.sql", rows=len(values)):
+        await asyncio.sleep(0)
+    return rank(values)
+
+
+def test_spans_are_nested_and_exported() -> None:
+    exporter = InMemorySpanExporter()
+    set_span_exporters([exporter])
+    try:
+        with trace_span("POST /schedule", op="http.server") as root:
+            assert asyncio.run(schedule([3, 1, 2])) == [1, 2, 3]
+        with pytest.raises(ZeroDivisionError), trace_span("failing"):
+            _ = 1 / 0
+    finally:
+        set_span_exporters([])
+
+    sql, ranking, scheduling, request, failing = exporter.spans
+    assert root is request and request.parent_id is None
+    assert scheduling.name == "tests.unit_tests.tracing_test.schedule"
+    assert scheduling.parent_id == request.span_id
+    assert sql.parent_id == ranking.parent_id == scheduling.span_id
+    assert {span.trace_id for span in (sql, ranking, scheduling)} == {request.trace_id}
+    assert sql.attributes == {"rows": 3}
+    assert (failing.status, failing.attributes) == ("error", {"error": "ZeroDivisionError"})
+    assert failing.trace_id != request.trace_id
+
+    waterfall = ConsoleSpanExporter.format_waterfall([sql, ranking, scheduling, request])
+    assert waterfall.splitlines()[-1].endswith("    tests.unit_tests.tracing_test.rank")
+
+
+def test_no_spans_without_exporters() -> None:
+    with trace_span("ignored") as span:
+        assert span is None
+    assert rank([2, 1]) == [1, 2]
+
+
+def test_console_exporter_drops_spans_that_finish_after_their_root() -> None:
+    exporter = ConsoleSpanExporter()
+    exporter.export(Span("sql.matches.update", "db.sql", "trace", "sql", "root", start_time=1.0))
+    exporter.export(Span("POST /schedule", "http.server", "trace", "root", None, start_time=0.0))
+    # e.g. a task started by the request
+    exporter.export(Span("notify", "function", "trace", "late", "root", start_time=2.0))
+
+    assert len(exporter._pending) == 0  # pylint: disable=protected-access
+
+
+def test_json_file_exporter_appends_lines(tmp_path: Path) -> None:
+    path = tmp_path / "spans.jsonl"
+    exporter = JsonFileSpanExporter(str(path))
+    for name in ("sql.matches.update", "POST /schedule"):
+        exporter.export(Span(name, "function", "trace", name, None, start_time=0.0))
+    exporter.close()
+
+    names = [orjson.loads(line)["name"] for line in path.read_bytes().splitlines()]
+    assert names == ["sql.matches.update", "POST /schedule"]
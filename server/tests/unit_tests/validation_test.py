@@ -0,0 +1,27 @@
+from project.models.db.match import MatchCreateBodyFrontend
+from project.models.db.team import TeamsBulkBody
+from project.sql.validation import collect_foreign_keys
+from project.utils.id_types import (
+    MatchId,
+    PlayerId,
+    RoundId,
+    StageItemInputId,
+    TeamCategoryId,
+)
+
+
+def test_collect_foreign_keys_nested() -> None:
+    body = TeamsBulkBody(
+        teams=[
+            {"code": "A", "category_id": 1, "active": True, "player_ids": [1, 2]},
+            {"code": "B", "category_id": 2, "active": True, "player_ids": [2, 3]},
+        ]
+    )
+    assert collect_foreign_keys(body) == {TeamCategoryId: {1, 2}, PlayerId: {1, 2, 3}}
+
+
+def test_collect_foreign_keys_optional() -> None:
+    body = MatchCreateBodyFrontend(
+        round_id=1, stage_item_input1_id=2, stage_item_input2_winner_from_match_id=3
+    )
+    assert collect_foreign_keys(body) == {RoundId: {1}, StageItemInputId: {2}, MatchId: {3}}